@@ -0,0 +1,41 @@
+"""Compare per-record and cached bulk parsing of address fields (C1)
+
+Usage: python benchmarks/bench_address.py [copies]
+
+"""
+
+import sys
+import time
+
+from wosfile import parse_addresses, read
+from wosfile.address import parse_address, split_address_field
+
+
+def per_record(fields):
+    """Parse each field from scratch, as parse_address_field used to do"""
+    parse = split_address_field.__wrapped__
+    parse_one = parse_address.__wrapped__
+    for field in fields:
+        for _, address in parse(field):
+            parse_one(address)
+
+
+def bulk(fields):
+    for _ in parse_addresses(fields):
+        pass
+
+
+def main(copies: int = 1000) -> None:
+    fields = [rec["C1"] for rec in read("data/wos_plaintext.txt") if rec.get("C1")]
+    fields *= copies
+    for func in (per_record, bulk):
+        split_address_field.cache_clear()
+        parse_address.cache_clear()
+        start = time.perf_counter()
+        func(fields)
+        speed = len(fields) / (time.perf_counter() - start)
+        print(f"{func.__name__:10}: {speed:9.0f} fields/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Compare the plain text readers on a scaled-up copy of data/wos_plaintext.txt
+
+Usage: python benchmarks/bench_plaintext.py [copies]
+
+"""
+import os
+import sys
+import tempfile
+import time
+
+from wosfile import MmapPlainTextReader, PlainTextReader, read
+
+
+def scaled_plaintext(copies: int, encoding: str = "utf-8") -> str:
+    """Write `copies` times the records of the example file to a temporary file"""
+    with open("data/wos_plaintext.txt", encoding="utf-8-sig") as fh:
+        text = fh.read()
+    header, body = text.split("PT ", 1)
+    body = "PT " + body.rsplit("EF", 1)[0]
+
+    fd, fname = tempfile.mkstemp(suffix=".txt")
+    with open(fd, "w", encoding=encoding) as fh:
+        fh.write(header)
+        for _ in range(copies):
+            fh.write(body)
+        fh.write("EF")
+    return fname
+
+
+def bench(fname: str, **kwargs) -> float:
+    start = time.perf_counter()
+    n = sum(1 for _ in read(fname, **kwargs))
+    return n / (time.perf_counter() - start)
+
+
+def main(copies: int = 200) -> None:
+    for encoding in ("utf-8", "utf-16"):
+        fname = scaled_plaintext(copies, encoding)
+        size = os.path.getsize(fname) / 2**20
+        print(f"{encoding}, {size:.0f} MB")
+        for fields in (None, ["UT", "PY", "SO", "AU"]):
+            for reader in (PlainTextReader, MmapPlainTextReader):
+                speed = bench(fname, using=reader, fields=fields)
+                print(f"  {reader.__name__:20} fields={fields}: {speed:9.0f} records/s")
+        os.remove(fname)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
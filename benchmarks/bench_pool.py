@@ -0,0 +1,48 @@
+"""Compare memory use of fully loaded records with and without a StringPool
+
+Records are synthetic (see synthetic.py), so that values do not repeat more
+than they would in a real corpus.
+
+Usage: python benchmarks/bench_pool.py [records]
+
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from synthetic import generate
+
+from wosfile import StringPool, records_from
+
+
+def load(fname: str, **kwargs) -> float:
+    """Get memory allocated by loading all records, in MB"""
+    tracemalloc.start()
+    records = list(records_from(fname, **kwargs))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size / 2**20
+
+
+def main(n: int = 5000) -> None:
+    fd, fname = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        generate(fname, n)
+        for lazy in (False, True):
+            pool = StringPool()
+            plain = load(fname, lazy=lazy)
+            pooled = load(fname, lazy=lazy, pool=pool)
+            print(
+                f"lazy={lazy!s:5}: {plain:6.1f} MB, with pool {pooled:6.1f} MB "
+                f"({plain / pooled:.1f}x), {pool.stats()}"
+            )
+    finally:
+        os.remove(fname)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,210 @@
+"""Track records/s and peak memory of each stage on synthetic WoS files
+
+Each stage runs in a fresh process, so that its peak memory (maximum
+resident set size) is measured on its own. Synthetic files are generated
+once (see synthetic.py) and kept in benchmarks/.data.
+
+Usage:
+    python benchmarks/bench_suite.py [--records N] [--stages NAME ...]
+        [--save results.json] [--compare baseline.json] [--tolerance 0.1]
+
+With --compare, stages that are slower or use more memory than the baseline
+(by more than the tolerance) are reported and the exit status is 1.
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Callable, Dict, Optional, Tuple
+
+from synthetic import generate
+
+from wosfile import (
+    MmapPlainTextReader,
+    PlainTextReader,
+    TabDelimitedReader,
+    parse_address_field,
+    parse_references,
+    read,
+    records_from,
+)
+from wosfile.address import parse_address, split_address_field
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".data")
+
+
+def data_file(n: int, format: str, encoding: str) -> str:
+    """Get name of synthetic file with `n` records, generating it if needed"""
+    fname = os.path.join(DATA_DIR, "{}-{}-{}.txt".format(format, encoding, n))
+    if not os.path.exists(fname):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        print("Generating", fname, file=sys.stderr)
+        generate(fname + ".tmp", n, format, encoding)
+        os.replace(fname + ".tmp", fname)
+    return fname
+
+
+def _timed(func: Callable[[], int]) -> Tuple[int, float]:
+    start = time.perf_counter()
+    n = func()
+    return n, time.perf_counter() - start
+
+
+def _count(records) -> int:
+    return sum(1 for _ in records)
+
+
+def _parse_addresses(fname: str) -> Tuple[int, float]:
+    fields = [rec["C1"] for rec in read(fname, fields=["C1"]) if rec.get("C1")]
+    split_address_field.cache_clear()
+    parse_address.cache_clear()
+    return _timed(lambda: _count(parse_address_field(field) for field in fields))
+
+
+def _parse_references(fname: str) -> Tuple[int, float]:
+    fields = [rec.get("CR") for rec in read(fname, fields=["CR"])]
+    return _timed(lambda: _count(parse_references(fields)))
+
+
+# Stage name -> (file format, encoding, function giving (records, seconds))
+STAGES: Dict[str, Tuple[str, str, Callable[[str], Tuple[int, float]]]] = {
+    "plaintext-utf8": (
+        "plaintext",
+        "utf-8",
+        lambda fname: _timed(lambda: _count(read(fname, using=PlainTextReader))),
+    ),
+    "plaintext-utf16": (
+        "plaintext",
+        "utf-16",
+        lambda fname: _timed(lambda: _count(read(fname, using=PlainTextReader))),
+    ),
+    "plaintext-fields": (
+        "plaintext",
+        "utf-8",
+        lambda fname: _timed(
+            lambda: _count(read(fname, fields=["UT", "PY", "SO", "AU"]))
+        ),
+    ),
+    "mmap-utf8": (
+        "plaintext",
+        "utf-8",
+        lambda fname: _timed(lambda: _count(read(fname, using=MmapPlainTextReader))),
+    ),
+    "tab-utf8": (
+        "tab",
+        "utf-8",
+        lambda fname: _timed(lambda: _count(read(fname, using=TabDelimitedReader))),
+    ),
+    "tab-utf16": (
+        "tab",
+        "utf-16",
+        lambda fname: _timed(lambda: _count(read(fname, using=TabDelimitedReader))),
+    ),
+    "records": (
+        "plaintext",
+        "utf-8",
+        lambda fname: _timed(lambda: len(list(records_from(fname)))),
+    ),
+    "lazy-records": (
+        "plaintext",
+        "utf-8",
+        lambda fname: _timed(lambda: len(list(records_from(fname, lazy=True)))),
+    ),
+    "addresses": ("plaintext", "utf-8", _parse_addresses),
+    "references": ("plaintext", "utf-8", _parse_references),
+}
+
+
+def _peak_memory() -> Optional[int]:
+    """Get maximum resident set size of this process in bytes, if known"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_stage(stage: str, fname: str) -> Dict[str, Optional[float]]:
+    """Run `stage` on `fname`; runs in a fresh process"""
+    n, seconds = STAGES[stage][2](fname)
+    peak = _peak_memory()
+    return {
+        "records": n,
+        "records_per_sec": n / seconds,
+        "peak_mb": peak / 2**20 if peak is not None else None,
+    }
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float
+) -> bool:
+    """Print regressions with respect to `baseline`; return whether there are any"""
+    regressed = False
+    for stage, result in results.items():
+        base = baseline.get(stage)
+        if base is None:
+            continue
+        if result["records_per_sec"] < base["records_per_sec"] * (1 - tolerance):
+            print(
+                "REGRESSION {}: {:.0f} records/s, was {:.0f}".format(
+                    stage, result["records_per_sec"], base["records_per_sec"]
+                )
+            )
+            regressed = True
+        if result["peak_mb"] and base.get("peak_mb"):
+            if result["peak_mb"] > base["peak_mb"] * (1 + tolerance):
+                print(
+                    "REGRESSION {}: peak {:.0f} MB, was {:.0f} MB".format(
+                        stage, result["peak_mb"], base["peak_mb"]
+                    )
+                )
+                regressed = True
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=None)
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="compare with results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = {}
+    context = get_context("spawn")
+    for stage in args.stages or STAGES:
+        format, encoding, _ = STAGES[stage]
+        fname = data_file(args.records, format, encoding)
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(run_stage, stage, fname).result()
+        results[stage] = result
+        peak = result["peak_mb"]
+        print(
+            "{:18} {:10.0f} records/s  peak {}".format(
+                stage,
+                result["records_per_sec"],
+                "{:.0f} MB".format(peak) if peak is not None else "unknown",
+            )
+        )
+
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump({"records": args.records, "stages": results}, fh, indent=2)
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        if baseline.get("records") != args.records:
+            print("Warning: baseline was run on {} records".format(baseline["records"]))
+        return int(compare(results, baseline["stages"], args.tolerance))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""Generate synthetic WoS export files of any size
+
+The same arguments always give the same file. Records have realistic field
+sizes: a dozen authors at most, multi-line author, address and cited
+reference fields, long abstracts, and skewed distributions of journals,
+countries and cited works, so that caches and pools behave as on real data.
+Cited references use the same key fields as the records, so some of them
+resolve to records in the file.
+
+Usage: python benchmarks/synthetic.py fname records [plaintext|tab] [encoding]
+
+"""
+
+import random
+import sys
+import textwrap
+from typing import Dict, Iterator, List, TextIO
+
+from wosfile.tags import has_item_per_line
+
+SURNAMES = (
+    "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez "
+    "Hernandez Lopez Gonzalez Wilson Anderson Thomas Taylor Moore Jackson Martin "
+    "Lee Perez Thompson White Harris Sanchez Clark Ramirez Lewis Robinson Walker "
+    "Young Allen King Wright Scott Torres Nguyen Hill Flores Green Adams Nelson "
+    "Baker Hall Rivera Campbell Mitchell Carter Roberts Wang Li Zhang Liu Chen "
+    "Yang Huang Zhao Wu Zhou Muller Schmidt Schneider Fischer Weber Meyer Wagner "
+    "Becker Janssens Peeters Maes Jacobs Mertens Willems Claes Goossens Rossi "
+    "Russo Ferrari Esposito Bianchi Romano Colombo Tanaka Suzuki Takahashi Sato"
+).split()
+FIRST_NAMES = (
+    "James Mary John Patricia Robert Jennifer Michael Linda William Elizabeth "
+    "David Barbara Richard Susan Joseph Jessica Wei Fang Hiroshi Yuki Lars Anna "
+    "Pieter Sofie Marco Giulia Jean Marie Ahmed Fatima Carlos Lucia"
+).split()
+WORDS = (
+    "network analysis citation impact science research knowledge diffusion "
+    "collaboration international patterns evidence model dynamics structure "
+    "evolution performance innovation policy measurement indicators bibliometric "
+    "scientometric journal field classification mapping clustering community "
+    "detection emergence growth productivity quality assessment funding gender "
+    "mobility career ranking university institutional national regional "
+    "interdisciplinary topic semantic text mining machine learning prediction "
+    "statistical approach framework case study comparison large scale data "
+    "open access peer review authorship team size novelty disruption "
+    "technology transfer patent industry academic linkage spillover"
+).split()
+CATEGORIES = [
+    ("Information Science & Library Science", "Information Science & Library Science"),
+    ("Computer Science, Interdisciplinary Applications", "Computer Science"),
+    ("Computer Science, Information Systems", "Computer Science"),
+    ("Management", "Business & Economics"),
+    ("Economics", "Business & Economics"),
+    ("Sociology", "Sociology"),
+    ("Multidisciplinary Sciences", "Science & Technology - Other Topics"),
+    ("Biochemistry & Molecular Biology", "Biochemistry & Molecular Biology"),
+    ("Ecology", "Environmental Sciences & Ecology"),
+    ("Environmental Sciences", "Environmental Sciences & Ecology"),
+    ("Geography", "Geography"),
+    ("Physics, Applied", "Physics"),
+    ("Chemistry, Multidisciplinary", "Chemistry"),
+    ("Neurosciences", "Neurosciences & Neurology"),
+    ("Medicine, General & Internal", "General & Internal Medicine"),
+    ("Public, Environmental & Occupational Health", "Public Health"),
+]
+COUNTRIES = (
+    ["USA"] * 12
+    + ["Peoples R China"] * 6
+    + ["England", "Germany", "Germany", "Japan", "France", "Italy", "Spain"]
+    + ["Canada", "Australia", "Netherlands", "Belgium", "Brazil", "India"]
+    + ["South Korea", "Sweden", "Switzerland", "Scotland", "Denmark"]
+)
+US_STATES = ["CA", "MA", "NY", "MI", "IL", "TX", "PA", "WA", "GA", "NC"]
+DOCUMENT_TYPES = ["Article"] * 8 + ["Review", "Proceedings Paper", "Editorial Material"]
+LANGUAGES = ["English"] * 18 + ["German", "Spanish"]
+
+_rng = random.Random(0)
+# (full name, 29-character abbreviation, ISO abbreviation, ISSN, publisher)
+JOURNALS = []
+for _i in range(800):
+    _words = [_rng.choice(WORDS).upper() for _ in range(_rng.randint(1, 3))]
+    _name = "JOURNAL OF " + " ".join(_words)
+    _abbrev = "J " + " ".join(word[:4] for word in _words)
+    JOURNALS.append(
+        (
+            _name,
+            _abbrev,
+            _abbrev.title().replace(" ", ". ") + ".",
+            "{:04d}-{:04d}".format(_i + 1000, _rng.randint(1000, 9999)),
+            _rng.choice(["ELSEVIER", "SPRINGER", "WILEY", "SAGE", "TAYLOR & FRANCIS"]),
+        )
+    )
+
+# Plain text field order, and tab-delimited columns (as in exports from WoS)
+PLAINTEXT_TAGS = (
+    "PT AU AF TI SO LA DT DE ID AB C1 RP EM CR NR TC Z9 U1 U2 PU PI PA SN J9 "
+    "JI PD PY VL IS BP EP DI PG WC SC GA UT"
+).split()
+TAB_TAGS = (
+    "PT AU BA BE GP AF BF CA TI SO SE BS LA DT CT CY CL SP HO DE ID AB C1 RP EM "
+    "RI OI FU FX CR NR TC Z9 U1 U2 PU PI PA SN EI BN J9 JI PD PY VL IS PN SU SI "
+    "MA BP EP AR DI D2 PG WC SC GA UT"
+).split()
+
+Record = Dict[str, List[str]]
+
+
+def _mix(i: int, salt: int) -> int:
+    """Deterministic pseudo-random 32-bit integer for work `i`"""
+    h = (i * 2654435761 + salt * 40503 + 12345) & 0xFFFFFFFF
+    h ^= h >> 15
+    return (h * 2246822519) & 0xFFFFFFFF
+
+
+def _author(h: int) -> str:
+    initials = chr(65 + h % 26) + ("" if h % 3 else chr(65 + (h >> 5) % 26))
+    return "{}, {}".format(SURNAMES[(h >> 10) % len(SURNAMES)], initials)
+
+
+def _work(i: int, seed: int):
+    """Get (first author, year, journal, volume, page, DOI) of work `i`"""
+    h = _mix(i, seed)
+    journal = JOURNALS[int(len(JOURNALS) * ((h & 0xFFFF) / 0x10000) ** 2)]
+    year = 2020 - int(40 * ((h >> 16 & 0xFF) / 0x100) ** 2)
+    volume = str(year - 1960 + (h >> 8) % 3)
+    page = str(1 + (h >> 12) % 900)
+    doi = "10.{}/{}.{}.{}".format(1000 + h % 9000, journal[1].replace(" ", ""), year, i)
+    return _author(h >> 3), year, journal, volume, page, doi if h % 5 else None
+
+
+def _reference(i: int, seed: int) -> str:
+    author, year, journal, volume, page, doi = _work(i, seed)
+    parts = [author.replace(",", ""), str(year), journal[1], "V" + volume, "P" + page]
+    if doi:
+        parts.append("DOI " + doi)
+    return ", ".join(parts)
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def _address(rng: random.Random, country: str) -> str:
+    org = "Univ " + rng.choice(SURNAMES)
+    dept = "Dept " + rng.choice(WORDS).title()
+    city = rng.choice(SURNAMES) + " City"
+    if country == "USA":
+        state = rng.choice(US_STATES)
+        return "{}, {}, {}, {} {:05d} USA".format(
+            org, dept, city, state, rng.randint(10000, 99999)
+        )
+    return "{}, {}, {}, {}".format(org, dept, city, country)
+
+
+def synthetic_records(n: int, seed: int = 0) -> Iterator[Record]:
+    """Generate `n` synthetic records; the same `seed` gives the same records"""
+    rng = random.Random(seed)
+    n_works = max(5 * n, 1000)
+    for i in range(n):
+        first_author, year, journal, volume, page, doi = _work(i, seed)
+        n_authors = min(1 + int(rng.expovariate(0.4)), 12)
+        authors = [first_author] + [
+            _author(rng.getrandbits(32)) for _ in range(n_authors - 1)
+        ]
+        full_names = [
+            "{}, {} {}".format(
+                author.split(", ")[0],
+                rng.choice(FIRST_NAMES),
+                author.split(", ")[1][1:],
+            ).rstrip()
+            for author in authors
+        ]
+        countries = [rng.choice(COUNTRIES) for _ in range(min(n_authors, 4))]
+        addresses = [_address(rng, country) for country in countries]
+        c1 = []
+        for j, address in enumerate(addresses):
+            members = full_names[j :: len(addresses)]
+            c1.append("[{}] {}".format("; ".join(members), address))
+        n_refs = min(int(rng.expovariate(1 / 35)), 300)
+        references = sorted(
+            {_reference(int(n_works * rng.random() ** 3), seed) for _ in range(n_refs)}
+        )
+        categories = rng.sample(CATEGORIES, rng.randint(1, 3))
+        tc = int(rng.expovariate(1 / 15))
+        record = {
+            "PT": ["J"],
+            "AU": authors,
+            "AF": full_names,
+            "TI": [_sentence(rng, rng.randint(6, 18))],
+            "SO": [journal[0]],
+            "LA": [rng.choice(LANGUAGES)],
+            "DT": [rng.choice(DOCUMENT_TYPES)],
+            "DE": [" ".join(rng.sample(WORDS, 2)) for _ in range(rng.randint(3, 6))],
+            "ID": [" ".join(rng.sample(WORDS, 2)).upper() for _ in range(4)],
+            "AB": [
+                ". ".join(_sentence(rng, rng.randint(8, 25)) for _ in range(8)) + "."
+            ],
+            "C1": c1,
+            "RP": ["{} (reprint author), {}.".format(authors[0], addresses[0])],
+            "EM": ["{}@example.org".format(first_author.split(",")[0].lower())],
+            "CR": references,
+            "NR": [str(len(references))],
+            "TC": [str(tc)],
+            "Z9": [str(tc + rng.randint(0, 3))],
+            "U1": [str(rng.randint(0, 20))],
+            "U2": [str(rng.randint(0, 100))],
+            "PU": [journal[4]],
+            "PI": ["NEW YORK"],
+            "PA": ["1 Main St, New York, NY 10001 USA"],
+            "SN": [journal[3]],
+            "J9": [journal[1]],
+            "JI": [journal[2]],
+            "PD": [rng.choice(["JAN", "MAR", "JUN", "SEP", "DEC"])],
+            "PY": [str(year)],
+            "VL": [volume],
+            "IS": [str(rng.randint(1, 12))],
+            "BP": [page],
+            "EP": [str(int(page) + rng.randint(5, 30))],
+            "PG": [str(rng.randint(6, 31))],
+            "WC": [category for category, _ in categories],
+            "SC": list(dict.fromkeys(area for _, area in categories)),
+            "GA": ["{:03d}AB".format(i % 1000)],
+            "UT": ["WOS:{:015d}".format(10**14 + seed * 10**9 + i)],
+        }
+        if doi:
+            record["DI"] = [doi]
+        yield record
+
+
+def _plaintext_record(record: Record) -> str:
+    lines = []
+    for tag in PLAINTEXT_TAGS:
+        values = record.get(tag)
+        if not values:
+            continue
+        if has_item_per_line[tag] or tag == "AB":
+            items = values
+        else:
+            items = textwrap.wrap("; ".join(values), 70) or [""]
+        lines.append(tag + " " + items[0])
+        lines.extend("   " + item for item in items[1:])
+    lines.append("ER\n")
+    return "\n".join(lines)
+
+
+def write_plaintext(fh: TextIO, records: Iterator[Record]) -> None:
+    fh.write("FN Clarivate Analytics Web of Science\nVR 1.0\n")
+    for record in records:
+        fh.write(_plaintext_record(record))
+        fh.write("\n")
+    fh.write("EF")
+
+
+def write_tab_delimited(fh: TextIO, records: Iterator[Record]) -> None:
+    fh.write("\t".join(TAB_TAGS) + "\n")
+    for record in records:
+        fh.write("\t".join("; ".join(record.get(tag, ())) for tag in TAB_TAGS) + "\n")
+
+
+def generate(
+    fname: str,
+    n: int,
+    format: str = "plaintext",
+    encoding: str = "utf-8",
+    seed: int = 0,
+) -> None:
+    """Write `n` synthetic records to `fname`
+
+    :param str format: 'plaintext' or 'tab' (tab-delimited)
+    :param str encoding: 'utf-8' or 'utf-16'; files start with a BOM, like
+        files exported from WoS
+
+    """
+    if encoding == "utf-8":
+        encoding = "utf-8-sig"
+    writer = {"plaintext": write_plaintext, "tab": write_tab_delimited}[format]
+    with open(fname, "w", encoding=encoding, newline="\n") as fh:
+        writer(fh, synthetic_records(n, seed))
+
+
+if __name__ == "__main__":
+    generate(sys.argv[1], int(sys.argv[2]), *sys.argv[3:])
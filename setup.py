@@ -14,6 +14,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=["wosfile"],
+    extras_require={"arrow": ["pyarrow"], "numpy": ["numpy"]},
     platforms="any",
     classifiers=[
         "Intended Audience :: Science/Research",
@@ -0,0 +1,66 @@
+import pytest
+
+from wosfile.address import (
+    Address,
+    countries,
+    organisations,
+    parse_address,
+    parse_addresses,
+    split_address_field,
+)
+
+mixed_field = (
+    "Univ Leuven, Dept Earth & Environm Sci, Leuven, Belgium; "
+    "[Bi, Lingling; Vanneste, Dominique] Univ Leuven, Leuven, Belgium; "
+    "[Bi, Lingling] Xian Int Studies Univ, Sch Tourism, Xian, Peoples R China"
+)
+
+
+@pytest.mark.parametrize(
+    "address, expected",
+    [
+        (
+            "Univ Antwerp, Dept Informat & Lib Sci, Antwerp, Belgium",
+            ("Univ Antwerp", "Belgium"),
+        ),
+        (
+            "Stanford Univ, Dept Sociol, Stanford, CA 94305 USA",
+            ("Stanford Univ", "USA"),
+        ),
+        ("Harvard Univ, Cambridge, MA USA", ("Harvard Univ", "USA")),
+        ("Univ Michigan", ("Univ Michigan", "Univ Michigan")),
+    ],
+)
+def test_parse_address(address, expected):
+    assert parse_address(address) == Address(address, *expected)
+
+
+def test_split_address_field_cached():
+    split_address_field.cache_clear()
+    first = split_address_field(mixed_field)
+    assert split_address_field(mixed_field) is first
+    assert split_address_field.cache_info().hits == 1
+
+
+def test_parse_addresses():
+    results = list(parse_addresses(["A Univ, X, Belgium; B Inst, Y, France", None]))
+    assert results == [
+        [
+            (None, Address("A Univ, X, Belgium", "A Univ", "Belgium")),
+            (None, Address("B Inst, Y, France", "B Inst", "France")),
+        ],
+        [],
+    ]
+
+    [result] = parse_addresses([mixed_field])
+    assert [(author, address.country) for author, address in result] == [
+        ("Bi, Lingling", "Belgium"),
+        ("Vanneste, Dominique", "Belgium"),
+        ("Bi, Lingling", "Peoples R China"),
+    ]
+
+
+def test_countries_organisations():
+    assert countries(mixed_field) == ["Belgium", "Peoples R China"]
+    assert organisations(mixed_field) == ["Univ Leuven", "Xian Int Studies Univ"]
+    assert countries(None) == organisations("") == []
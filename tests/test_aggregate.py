@@ -0,0 +1,59 @@
+import pickle
+
+import pytest
+
+from wosfile.aggregate import Aggregate, aggregate
+from wosfile.read import read
+from wosfile.record import records_from
+
+records = [
+    {"PY": "2010", "WC": "Ecology; Zoology", "TC": "3", "Z9": "4"},
+    {"PY": "2010", "WC": ["Ecology"], "TC": "1"},
+    {"PY": "2011", "WC": "Zoology; Zoology", "TC": "5", "Z9": "5"},
+    {"WC": "Ecology"},
+]
+
+
+def test_aggregate_single_field():
+    result = Aggregate("PY").update(records)
+    assert result.count("2010") == 2
+    assert result.sum("TC", "2010") == 4
+    assert result.sum("Z9", "2010") == 4
+    assert result.count(None) == 1
+    assert result.count("1999") == 0
+
+
+def test_aggregate_explodes_splittable_fields():
+    result = Aggregate(["PY", "WC"], sums=["TC"]).update(records)
+    assert result.rows() == [
+        {"PY": "2010", "WC": "Ecology", "count": 2, "TC": 4},
+        {"PY": "2010", "WC": "Zoology", "count": 1, "TC": 3},
+        {"PY": "2011", "WC": "Zoology", "count": 1, "TC": 5},
+        {"PY": None, "WC": "Ecology", "count": 1, "TC": 0},
+    ]
+
+
+def test_aggregate_merge():
+    whole = Aggregate("WC").update(records)
+    first = Aggregate("WC").update(records[:2])
+    second = pickle.loads(pickle.dumps(Aggregate("WC").update(records[2:])))
+    assert first.merge(second).rows() == whole.rows()
+
+    with pytest.raises(ValueError):
+        first.merge(Aggregate("PY"))
+
+
+def test_aggregate_file():
+    fname = "data/wos_plaintext.txt"
+    result = aggregate(fname, by="DT")
+    expected = Aggregate("DT").update(records_from(fname))
+    assert result.rows() == expected.rows()
+    assert sum(row["count"] for row in result.rows()) == 50
+
+
+def test_aggregate_files_parallel():
+    fnames = ["data/wos_plaintext.txt", "data/wos_tab_delimited_win_utf8.txt"]
+    serial = aggregate(fnames, by=["PY", "WC"])
+    parallel = aggregate(fnames, by=["PY", "WC"], workers=2)
+    assert parallel.rows() == serial.rows()
+    assert serial.rows() == Aggregate(["PY", "WC"]).update(read(fnames)).rows()
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+
+import pytest
+
+import wosfile.aio
+from wosfile.aio import aread, arecords_from
+from wosfile.read import ReadError, read, read_with_checkpoints
+from wosfile.record import LazyRecord, records_from
+
+
+async def collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.parametrize("batch_size", [1, 1000])
+def test_aread(batch_size):
+    fname = "data/wos_plaintext.txt"
+    records = asyncio.run(collect(aread(fname, batch_size=batch_size)))
+    assert records == list(read(fname))
+
+
+def test_aread_passes_options():
+    fname = "data/wos_tab_delimited_win_utf8.txt"
+    records = asyncio.run(collect(aread(fname, fields=["UT", "PY"])))
+    assert records == list(read(fname, fields=["UT", "PY"]))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("concurrency", [1, 2, 3])
+def test_aread_multiple_files(ordered, concurrency):
+    fnames = [
+        "data/wos_plaintext.txt",
+        "data/wos_tab_delimited_win_utf8.txt",
+        "data/wos_tab_delimited_win_utf16.txt",
+    ]
+    records = asyncio.run(
+        collect(aread(fnames, batch_size=2, concurrency=concurrency, ordered=ordered))
+    )
+    expected = list(read(fnames))
+    if ordered:
+        assert records == expected
+    else:
+        key = lambda record: (record["UT"], sorted(record.items()))
+        assert sorted(records, key=key) == sorted(expected, key=key)
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+@pytest.mark.parametrize("position", [10, 60, 88])
+def test_aread_resume(concurrency, position):
+    fnames = [
+        "data/wos_plaintext.txt",
+        "data/wos_tab_delimited_win_utf8.txt",
+        "data/wos_tab_delimited_win_utf16.txt",
+    ]
+    checkpoints = [checkpoint for _, checkpoint in read_with_checkpoints(fnames)]
+    resume_from = checkpoints[position]
+    records = asyncio.run(
+        collect(aread(fnames, concurrency=concurrency, resume_from=resume_from))
+    )
+    assert records == list(read(fnames))[position + 1 :]
+
+
+def test_arecords_from():
+    fname = "data/wos_plaintext.txt"
+    records = asyncio.run(collect(arecords_from(fname, lazy=True)))
+    assert all(isinstance(record, LazyRecord) for record in records)
+    assert [dict(rec) for rec in records] == [
+        dict(rec) for rec in records_from(fname, lazy=True)
+    ]
+
+
+def test_aread_does_not_block_event_loop():
+    async def main():
+        ticks = 0
+        stop = asyncio.Event()
+
+        async def tick():
+            nonlocal ticks
+            while not stop.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        records = await collect(aread(["data/wos_plaintext.txt"] * 20, batch_size=1))
+        stop.set()
+        await ticker
+        return records, ticks
+
+    records, ticks = asyncio.run(main())
+    assert ticks > 1 and len(records) > 0
+
+
+def test_aread_backpressure(monkeypatch):
+    read_records = 0
+
+    def counting_read(fname):
+        nonlocal read_records
+        for record in read(fname):
+            read_records += 1
+            yield record
+
+    async def main():
+        records = aread(["data/wos_plaintext.txt"] * 10, batch_size=1, prefetch=2)
+        await records.__anext__()
+        await asyncio.sleep(0.2)
+        n = read_records
+        await records.aclose()
+        return n
+
+    monkeypatch.setattr(wosfile.aio, "read", counting_read)
+    n = asyncio.run(main())
+    # One batch consumed, `prefetch` batches queued and one being read
+    assert n <= 4
+
+
+def test_aread_cancel(monkeypatch):
+    closed = threading.Event()
+
+    def slow_read(fname):
+        try:
+            yield from read(fname)
+            while True:
+                yield {}
+        finally:
+            closed.set()
+
+    async def main():
+        async def consume():
+            async for _ in aread("data/wos_plaintext.txt", batch_size=1):
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    monkeypatch.setattr(wosfile.aio, "read", slow_read)
+    asyncio.run(main())
+    assert closed.wait(1)
+
+
+def test_aread_error(tmp_path):
+    fname = tmp_path / "bad.txt"
+    fname.write_text("FN Thomson Reuters Web of Science\nVR 1.0\nPT J\n")
+
+    with pytest.raises(ReadError):
+        asyncio.run(collect(aread(str(fname))))
@@ -0,0 +1,53 @@
+import pytest
+
+from wosfile.arrow import _columns, write_arrow, write_parquet
+from wosfile.read import read
+from wosfile.record import Record, records_from
+
+
+def test_columns():
+    records = [
+        {"PY": "2015", "AU": "Doe, J; Foo, B", "TI": "Title", "TC": ""},
+        Record({"PY": "n/a", "AU": "Bar, C"}),
+    ]
+    columns = _columns(records, ["PY", "AU", "TI", "TC"])
+
+    assert columns == {
+        "PY": [2015, None],
+        "AU": [["Doe, J", "Foo, B"], ["Bar, C"]],
+        "TI": ["Title", None],
+        "TC": [None, None],
+    }
+
+
+@pytest.mark.parametrize("writer", [write_arrow, write_parquet])
+def test_write(tmp_path, writer):
+    pa = pytest.importorskip("pyarrow")
+    fname = tmp_path / "records"
+    n = writer(records_from("data/wos_plaintext.txt"), fname, batch_size=7)
+    records = list(records_from("data/wos_plaintext.txt"))
+    assert n == len(records)
+
+    if writer is write_parquet:
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(fname)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(str(fname))).read_all()
+
+    assert table.num_rows == len(records)
+    assert table.schema.field("PY").type == pa.int64()
+    assert table.schema.field("CR").type == pa.list_(pa.string())
+    assert table.column("PY").to_pylist() == [int(rec["PY"]) for rec in records]
+    assert table.column("CR").to_pylist() == [rec.get("CR") for rec in records]
+
+
+def test_write_fields(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    fname = tmp_path / "records.parquet"
+    write_parquet(read("data/wos_tab_delimited_win_utf8.txt"), fname, ["UT", "AU"])
+
+    table = pq.read_table(fname)
+    assert table.column_names == ["UT", "AU"]
@@ -0,0 +1,88 @@
+import gzip
+import json
+import zipfile
+
+import pytest
+
+from wosfile.read import Checkpoint, read, read_with_checkpoints
+from wosfile.record import records_from
+
+fnames = [
+    "data/wos_plaintext.txt",
+    "data/wos_tab_delimited_win_utf8.txt",
+    "data/wos_tab_delimited_win_utf16.txt",
+]
+
+
+@pytest.mark.parametrize("fname", fnames)
+def test_read_with_checkpoints(fname):
+    results = list(read_with_checkpoints(fname))
+    assert [record for record, _ in results] == list(read(fname))
+
+    checkpoints = [checkpoint for _, checkpoint in results]
+    assert [cp.ordinal for cp in checkpoints] == list(range(1, len(results) + 1))
+    assert all(cp.fname == fname and cp.file == 0 for cp in checkpoints)
+    offsets = [cp.offset for cp in checkpoints]
+    assert offsets == sorted(set(offsets))
+
+
+@pytest.mark.parametrize("fname", fnames)
+@pytest.mark.parametrize("fields", [None, ["UT", "PY"]])
+def test_resume(fname, fields):
+    results = list(read_with_checkpoints(fname, fields=fields))
+    for i, (_, checkpoint) in enumerate(results):
+        resumed = list(
+            read_with_checkpoints(fname, resume_from=checkpoint, fields=fields)
+        )
+        assert resumed == results[i + 1 :]
+
+
+def test_resume_multiple_files():
+    results = list(read_with_checkpoints(fnames))
+    assert [record for record, _ in results] == list(read(fnames))
+    assert [cp.file for _, cp in results] == sorted(cp.file for _, cp in results)
+
+    # Resume at the end of the first file and in the middle of the second one
+    n_first = sum(1 for _, cp in results if cp.file == 0)
+    for i in (n_first - 1, n_first + 1):
+        checkpoint = results[i][1]
+        assert list(read(fnames, resume_from=checkpoint)) == [
+            record for record, _ in results[i + 1 :]
+        ]
+
+
+def test_resume_compressed(tmp_path):
+    compressed = str(tmp_path / "wos.txt.gz")
+    with open(fnames[0], "rb") as f_in, gzip.open(compressed, "wb") as f_out:
+        f_out.write(f_in.read())
+    archive = str(tmp_path / "wos.zip")
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        for fname in fnames:
+            f.write(fname)
+
+    for fname in [compressed, archive]:
+        results = list(read_with_checkpoints(fname))
+        for i in range(0, len(results), 3):
+            resumed = list(read_with_checkpoints(fname, resume_from=results[i][1]))
+            assert resumed == results[i + 1 :]
+    assert {cp.member for _, cp in results} == {0, 1, 2}
+
+
+def test_resume_from_stored_checkpoint(tmp_path):
+    records = list(records_from(fnames[0]))
+    _, checkpoint = list(read_with_checkpoints(fnames[0]))[1]
+
+    stored = tmp_path / "checkpoint.json"
+    stored.write_text(json.dumps(checkpoint))
+    checkpoint = Checkpoint(*json.loads(stored.read_text()))
+    assert list(records_from(fnames[0], resume_from=checkpoint)) == records[2:]
+
+
+def test_resume_errors():
+    _, checkpoint = next(read_with_checkpoints(fnames[0]))
+    with pytest.raises(ValueError):
+        list(read(fnames[1], resume_from=checkpoint))
+    with pytest.raises(ValueError):
+        list(read(fnames[0], resume_from=checkpoint, dedupe=True))
+    with pytest.raises(ValueError):
+        list(read([fnames[0]] * 2, resume_from=checkpoint, workers=2))
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+
+from wosfile.dedupe import (
+    BloomDeduplicator,
+    Deduplicator,
+    DiskDeduplicator,
+    ExactDeduplicator,
+    get_deduplicator,
+)
+from wosfile.read import read
+from wosfile.record import records_from
+
+
+def plaintext(*records):
+    body = "".join(
+        "PT J\nUT {}\nTC {}\nTI {}\nER\n".format(*record) for record in records
+    )
+    return "FN Thomson Reuters Web of Science\nVR 1.0\n" + body + "EF"
+
+
+@pytest.fixture
+def files(tmp_path):
+    data = [
+        plaintext(("WOS:1", 1, "one"), ("WOS:2", 5, "two")),
+        plaintext(("WOS:2", 7, "two later"), ("WOS:3", 0, "three")),
+        plaintext(("WOS:1", 1, "one again"), ("WOS:3", 2, "three later")),
+    ]
+    fnames = []
+    for i, text in enumerate(data):
+        fname = tmp_path / "export{}.txt".format(i)
+        fname.write_text(text, encoding="utf-8")
+        fnames.append(fname)
+    return fnames
+
+
+@pytest.mark.parametrize("dedupe", [True, "exact", "bloom", "disk"])
+def test_dedupe_first(files, dedupe):
+    titles = [rec["TI"] for rec in read(files, dedupe=dedupe)]
+    assert titles == ["one", "two", "three"]
+
+
+@pytest.mark.parametrize("dedupe", [True, "disk"])
+def test_dedupe_highest(files, dedupe):
+    titles = [rec["TI"] for rec in read(iter(files), dedupe=dedupe, keep="TC")]
+    assert titles == ["one", "two later", "three later"]
+
+
+def test_dedupe_bloom_highest(files):
+    with pytest.raises(ValueError):
+        list(read(files, dedupe="bloom", keep="TC"))
+
+
+def test_dedupe_fields(files):
+    records = list(read(files, dedupe=True, keep="TC", fields=["TI"]))
+    assert records == [{"TI": "one"}, {"TI": "two later"}, {"TI": "three later"}]
+
+
+def test_dedupe_duplicates_count(files):
+    deduplicator = ExactDeduplicator()
+    records = list(records_from(files, dedupe=deduplicator))
+    assert [rec["UT"] for rec in records] == ["WOS:1", "WOS:2", "WOS:3"]
+    assert deduplicator.duplicates == 3
+
+
+def test_dedupe_unknown_mode():
+    with pytest.raises(ValueError):
+        get_deduplicator("magic")
+
+
+def test_bloom_deduplicator():
+    deduplicator = BloomDeduplicator(capacity=1000, error_rate=0.01)
+    keys = ["WOS:{}".format(i) for i in range(1000)]
+    assert sum(deduplicator.add(key) for key in keys) > 980
+    assert not any(deduplicator.add(key) for key in keys)
+
+
+def test_disk_deduplicator(tmp_path):
+    path = tmp_path / "seen.sqlite"
+    deduplicator = DiskDeduplicator(str(path))
+    assert deduplicator.add("WOS:1")
+    assert not deduplicator.add("WOS:1")
+    deduplicator.update("WOS:1", 3, 0)
+    deduplicator.update("WOS:1", 5, 1)
+    deduplicator.update("WOS:1", 4, 2)
+    assert deduplicator.winner("WOS:1") == 1
+    deduplicator.close()
+    assert path.exists()
+
+    # Record IDs are kept for later runs, but winners are not
+    deduplicator = DiskDeduplicator(str(path), commit_every=2)
+    assert not deduplicator.add("WOS:1")
+    assert deduplicator.winner("WOS:1") is None
+    assert all(deduplicator.add("WOS:{}".format(i)) for i in range(2, 6))
+    deduplicator.close()
+    deduplicator = DiskDeduplicator(str(path))
+    assert not any(deduplicator.add("WOS:{}".format(i)) for i in range(1, 6))
+    deduplicator.close()
+
+    deduplicator = DiskDeduplicator()
+    assert deduplicator.add("WOS:1")
+    deduplicator.close()
+    assert not os.path.exists(deduplicator.path)
+
+
+def test_incomplete_deduplicator():
+    class NoAdd(Deduplicator):
+        pass
+
+    with pytest.raises(TypeError):
+        NoAdd()
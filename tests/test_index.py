@@ -0,0 +1,81 @@
+import os
+import random
+import shutil
+
+import pytest
+
+from wosfile.index import INDEX_SUFFIX, RecordIndex
+from wosfile.read import read
+
+data_files = [
+    "wos_plaintext.txt",
+    "wos_tab_delimited_win_utf8.txt",
+    "wos_tab_delimited_win_utf16.txt",
+]
+
+
+@pytest.fixture(params=data_files)
+def data_file(request, tmp_path):
+    fname = tmp_path / request.param
+    shutil.copy("data/" + request.param, fname)
+    return fname
+
+
+def test_index_get(data_file):
+    index = RecordIndex(data_file)
+    records = list(read(data_file))
+
+    assert len(index) == len(records)
+    for record in records:
+        assert index.get(record["UT"]) == record
+
+
+def test_index_get_many(data_file):
+    index = RecordIndex(data_file)
+    records = list(read(data_file))[::-3]
+
+    assert list(index.get_many(rec["UT"] for rec in records)) == records
+
+
+def test_index_get_missing(data_file):
+    index = RecordIndex(data_file)
+    with pytest.raises(KeyError):
+        index.get("WOS:doesnotexist")
+
+
+def test_index_sample(data_file):
+    index = RecordIndex(data_file)
+    sample = index.sample(5, random.Random(42))
+
+    assert len({rec["UT"] for rec in sample}) == 5
+    assert sample == index.sample(5, random.Random(42))
+
+
+def test_index_persisted(data_file):
+    RecordIndex(data_file)
+    index_fname = str(data_file) + INDEX_SUFFIX
+    assert os.path.exists(index_fname)
+
+    # Index is reused if file is unchanged...
+    mtime = os.stat(index_fname).st_mtime_ns
+    RecordIndex(data_file)
+    assert os.stat(index_fname).st_mtime_ns == mtime
+
+    # ... but rebuilt when the file changes
+    st = os.stat(data_file)
+    os.utime(data_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    index = RecordIndex(data_file)
+    assert os.stat(index_fname).st_mtime_ns != mtime
+    first = next(read(data_file))
+    assert index.get(first["UT"]) == first
+
+
+def test_index_crlf(tmp_path):
+    fname = tmp_path / "crlf.txt"
+    with open("data/wos_plaintext.txt", encoding="utf-8-sig") as f_in:
+        with open(fname, "w", encoding="utf-8", newline="\r\n") as f_out:
+            f_out.write(f_in.read())
+
+    index = RecordIndex(fname)
+    for record in read(fname):
+        assert index.get(record["UT"]) == record
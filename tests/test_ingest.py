@@ -0,0 +1,114 @@
+import importlib
+import os
+import shutil
+
+import pytest
+
+from wosfile.ingest import ParseCache, ingest
+from wosfile.read import read
+from wosfile.record import Record
+
+read_module = importlib.import_module("wosfile.read")
+ingest_module = importlib.import_module("wosfile.ingest")
+
+
+@pytest.fixture
+def directory(tmp_path):
+    shutil.copy("data/wos_plaintext.txt", tmp_path / "plaintext.txt")
+    shutil.copy("data/wos_tab_delimited_win_utf8.txt", tmp_path / "tabdelim.txt")
+    return tmp_path
+
+
+def count_parses(monkeypatch):
+    """Count the files that are parsed rather than loaded from the cache"""
+    parsed = []
+
+    def counting_read(fname, *args, **kwargs):
+        parsed.append(os.path.basename(fname))
+        return read_module.read(fname, *args, **kwargs)
+
+    monkeypatch.setattr(ingest_module, "read", counting_read)
+    return parsed
+
+
+def test_ingest(directory, monkeypatch):
+    parsed = count_parses(monkeypatch)
+    fnames = sorted(directory.glob("*.txt"))
+    expected = list(read(fnames))
+
+    assert list(ingest(directory)) == expected
+    assert parsed == ["plaintext.txt", "tabdelim.txt"]
+    assert (directory / ".wosfile-cache" / "manifest.json").exists()
+
+    # Unchanged files come from the cache
+    assert list(ingest(directory)) == expected
+    assert parsed == ["plaintext.txt", "tabdelim.txt"]
+
+
+def test_ingest_new_and_changed_files(directory, monkeypatch):
+    list(ingest(directory))
+    parsed = count_parses(monkeypatch)
+
+    shutil.copy("data/wos_tab_delimited_win_utf16.txt", directory / "new.txt")
+    with open(directory / "plaintext.txt", "a", encoding="utf-8") as fh:
+        fh.write("\n")
+    records = list(ingest(directory))
+    assert sorted(parsed) == ["new.txt", "plaintext.txt"]
+    assert records == list(read(sorted(directory.glob("*.txt"))))
+
+
+def test_identical_files_share_cache(directory, monkeypatch):
+    list(ingest(directory))
+    parsed = count_parses(monkeypatch)
+
+    shutil.copy("data/wos_plaintext.txt", directory / "copy.txt")
+    assert len(list(ingest(directory))) == len(list(read(directory.glob("*.txt"))))
+    assert parsed == []
+
+
+def test_touched_file_not_parsed(directory, monkeypatch):
+    cache = ParseCache(directory / "cache")
+    list(cache.read(directory / "plaintext.txt"))
+    parsed = count_parses(monkeypatch)
+
+    os.utime(directory / "plaintext.txt", ns=(0, 0))
+    cache = ParseCache(directory / "cache")
+    list(cache.read(directory / "plaintext.txt"))
+    assert parsed == []
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_fields_and_where(directory):
+    cache = ParseCache(directory / "cache")
+    fname = directory / "plaintext.txt"
+    kwargs = dict(fields=["UT", "PY"], where={"PY": lambda py: int(py) < 2005})
+    assert list(cache.read(fname, **kwargs)) == list(read(fname, **kwargs))
+    assert list(cache.read(fname, **kwargs)) == list(read(fname, **kwargs))
+
+
+def test_cache_where_empty_value(tmp_path):
+    fname = tmp_path / "tabdelim.txt"
+    with open(fname, "w", encoding="utf-8") as fh:
+        fh.write("PT\tUT\tPY\nJ\tA\t2011\nJ\tB\t\nJ\tC\t1999\n")
+    cache = ParseCache(tmp_path / "cache")
+    where = {"PY": lambda py: int(py) >= 2010}
+    expected = list(read(fname, where=where))
+    assert [rec["UT"] for rec in expected] == ["A"]
+    assert list(cache.read(fname, where=where)) == expected
+    assert list(cache.read(fname, where=where)) == expected
+
+
+def test_cache_records(directory):
+    cache = ParseCache(directory / "cache")
+    records = list(cache.records(directory / "plaintext.txt"))
+    assert all(isinstance(rec, Record) for rec in records)
+    assert len(records) == 50
+
+
+def test_prune(directory):
+    cache = ParseCache(directory / "cache")
+    list(cache.read(sorted(directory.glob("*.txt"))))
+    os.remove(directory / "tabdelim.txt")
+    assert cache.prune() == 1
+    assert len(cache.manifest) == 1
+    assert len(list((directory / "cache").glob("*.pickle"))) == 1
@@ -0,0 +1,90 @@
+import bz2
+import gzip
+import lzma
+from io import BytesIO, StringIO
+
+import pytest
+
+from wosfile.mmapread import MmapPlainTextReader
+from wosfile.read import PlainTextReader, ReadError, read
+
+preamble = "FN Thomson Reuters Web of Science\nVR 1.0\n"
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-8", "utf-16"])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_same_as_plaintext_reader(tmp_path, encoding, newline):
+    with open("data/wos_plaintext.txt", encoding="utf-8-sig") as f:
+        text = f.read()
+    fname = tmp_path / "test_mmapread"
+    with open(fname, "w", encoding=encoding, newline=newline) as f:
+        f.write(text)
+
+    expected = list(read(fname, using=PlainTextReader))
+    assert list(read(fname, using=MmapPlainTextReader)) == expected
+    with open(fname, "rb") as f:
+        assert list(MmapPlainTextReader(f)) == expected
+
+
+@pytest.mark.parametrize("compression", [gzip, bz2, lzma])
+def test_compressed(tmp_path, compression):
+    with open("data/wos_plaintext.txt", "rb") as f:
+        data = f.read()
+    fname = tmp_path / "test_mmapread_compressed"
+    with compression.open(fname, "wb") as f:
+        f.write(data)
+
+    expected = list(read("data/wos_plaintext.txt", using=PlainTextReader))
+    assert list(read(fname, using=MmapPlainTextReader)) == expected
+    with compression.open(fname, "rb") as f:
+        assert list(MmapPlainTextReader(f)) == expected
+
+
+def test_multiline_fields():
+    f = BytesIO(
+        (
+            preamble + "PT abc\nAF Here\n   be\n\n   dragons\n"
+            "SC Here; there\n  be dragons; Yes\nER\nEF"
+        ).encode("utf-8")
+    )
+    r = MmapPlainTextReader(f)
+    expected = {
+        "PT": "abc",
+        "AF": "Here; be; dragons",
+        "SC": "Here; there be dragons; Yes",
+    }
+    assert next(r) == expected
+
+
+def test_fields_where():
+    fields = ["UT", "AU"]
+    where = {"PY": lambda year: int(year) >= 2005}
+    expected = list(read("data/wos_plaintext.txt", fields=fields, where=where))
+    records = read(
+        "data/wos_plaintext.txt", using=MmapPlainTextReader, fields=fields, where=where
+    )
+    assert list(records) == expected
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        ("XY Bla\nVR 1.0", ReadError),
+        ("FN Thomson Reuters Web of Science\nVR 1.1", ReadError),
+        (preamble + "PT abc\nAU xuz\nER\n\nPT abc2\nEF", ReadError),
+        (preamble + "PT abc\nAU xuz\nER\n\nPT abc2\nER", ReadError),
+        (preamble + "PT abc\n\nQQ x\nER\nEF", NotImplementedError),
+    ],
+)
+def test_errors(data, error):
+    def outcome(get_reader):
+        try:
+            list(get_reader())
+        except error as e:
+            return str(e)
+
+    expected = outcome(lambda: PlainTextReader(StringIO(data)))
+    assert expected is not None
+    assert (
+        outcome(lambda: MmapPlainTextReader(BytesIO(data.encode("utf-8")))) == expected
+    )
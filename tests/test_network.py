@@ -0,0 +1,160 @@
+import pickle
+
+import pytest
+
+from wosfile.network import (
+    CITATION_FIELDS,
+    CollaborationMatrix,
+    citation_graph,
+    coauthorship,
+    country_collaboration,
+)
+from wosfile.read import read
+from wosfile.record import Record, records_from
+
+np = pytest.importorskip("numpy")
+
+
+def record(ut, au, py, vl, bp, di=None, cr=()):
+    data = {"UT": ut, "AU": au, "PY": py, "VL": vl, "BP": bp, "CR": "; ".join(cr)}
+    if di:
+        data["DI"] = di
+    return Record(data)
+
+
+def test_citation_graph():
+    records = [
+        record(
+            "WOS:1", "Price, DJD", "1965", "149", "510", "10.1126/science.149.3683.510"
+        ),
+        record(
+            "WOS:2",
+            "Garfield, E",
+            "1972",
+            "178",
+            "471",
+            cr=[
+                # By DOI, in different case
+                "Price DJD, 1965, SCIENCE, DOI 10.1126/SCIENCE.149.3683.510",
+                # By author, year, volume and page
+                "Garfield E, 1972, SCIENCE, V178, P471",
+                "Merton RK, 1968, SCIENCE, V159, P56",
+            ],
+        ),
+        record(
+            "WOS:3",
+            "Small, H",
+            "1973",
+            "24",
+            "265",
+            cr=[
+                "Price D. J. D., 1965, SCIENCE, V149, P510",
+                "Garfield E, 1972, SCIENCE, V178, P471",
+                "Garfield E, 1972, SCI, V178, P471, DOI 10.1/unknown",
+                "Kessler MM, 1963, AM DOC, V14, P10",
+            ],
+        ),
+    ]
+    graph = citation_graph(records)
+    assert len(graph) == 3
+    assert graph.ids == ["WOS:1", "WOS:2", "WOS:3"]
+    assert graph.indptr.tolist() == [0, 0, 2, 4]
+    assert graph.cited(1).tolist() == [0, 1]
+    assert graph.cited(2).tolist() == [0, 1]
+    assert graph.unresolved.tolist() == [0, 1, 1]
+    assert graph.n_unresolved == 2
+    assert list(graph.edges()) == [
+        ("WOS:2", "WOS:1"),
+        ("WOS:2", "WOS:2"),
+        ("WOS:3", "WOS:1"),
+        ("WOS:3", "WOS:2"),
+    ]
+
+
+def test_citation_graph_empty():
+    graph = citation_graph([])
+    assert len(graph) == graph.n_edges == graph.n_unresolved == 0
+    assert graph.indptr.tolist() == [0]
+
+
+def test_citation_graph_raw_records():
+    fname = "data/wos_plaintext.txt"
+    graph = citation_graph(read(fname, fields=CITATION_FIELDS))
+    assert len(graph) == 50
+    assert graph.n_edges > 0
+
+    # Every match by full reference string is found
+    records = list(records_from(fname))
+    uts = {rec.record_id.upper(): rec["UT"] for rec in records}
+    naive = {
+        (rec["UT"], uts[reference.upper()])
+        for rec in records
+        for reference in rec.get("CR", [])
+        if reference.upper() in uts
+    }
+    assert naive <= set(graph.edges())
+
+
+author_records = [
+    {"AU": "A; B; C"},
+    {"AU": ["A", "B"]},
+    {"AU": "B"},
+    {"AU": "A; A; D"},
+]
+
+
+def test_coauthorship_full():
+    matrix = coauthorship(author_records)
+    assert matrix.labels == ["A", "B", "C", "D"]
+    assert sorted(matrix.pairs()) == [
+        ("A", "B", 2.0),
+        ("A", "C", 1.0),
+        ("A", "D", 1.0),
+        ("B", "C", 1.0),
+    ]
+    assert matrix.counts.tolist() == [3.0, 3.0, 1.0, 1.0]
+
+
+def test_coauthorship_fractional():
+    matrix = coauthorship(author_records, counting="fractional")
+    weights = {(a, b): weight for a, b, weight in matrix.pairs()}
+    assert weights[("A", "B")] == pytest.approx(1.5)
+    assert weights[("B", "C")] == pytest.approx(0.5)
+    assert matrix.counts.tolist() == pytest.approx(
+        [1 / 3 + 1 / 2 + 1 / 2, 11 / 6, 1 / 3, 1 / 2]
+    )
+
+
+def test_collaboration_compaction():
+    small_buffer = coauthorship(author_records * 10, buffer_size=2)
+    large_buffer = coauthorship(author_records * 10)
+    assert list(small_buffer.pairs()) == list(large_buffer.pairs())
+
+
+def test_collaboration_merge():
+    whole = coauthorship(author_records)
+    first = coauthorship(author_records[:2])
+    second = pickle.loads(pickle.dumps(coauthorship(author_records[2:][::-1])))
+    first.merge(second)
+    assert sorted(first.pairs()) == sorted(whole.pairs())
+    assert dict(zip(first.labels, first.counts)) == dict(
+        zip(whole.labels, whole.counts)
+    )
+
+    with pytest.raises(ValueError):
+        first.merge(CollaborationMatrix(counting="fractional"))
+
+
+def test_country_collaboration():
+    records = list(records_from("data/wos_plaintext.txt"))
+    matrix = country_collaboration(records)
+    assert "USA" in matrix.labels
+    n_records = sum(1 for rec in records if rec.get("C1"))
+    assert 0 < matrix.counts.sum() and max(matrix.counts) <= n_records
+
+
+def test_to_scipy():
+    pytest.importorskip("scipy")
+    matrix = coauthorship(author_records).to_scipy().toarray()
+    assert (matrix == matrix.T).all()
+    assert matrix[0, 0] == 3 and matrix[0, 1] == 2
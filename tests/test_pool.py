@@ -0,0 +1,93 @@
+from wosfile.pool import PoolStats, StringPool
+from wosfile.read import read, read_batches
+from wosfile.record import LazyRecord, Record, records_from
+
+
+def copy(value):
+    """Get a distinct string object that is equal to `value`"""
+    return "".join(list(value))
+
+
+def test_intern():
+    pool = StringPool()
+    first = pool.intern(copy("NATURE"))
+    second = pool.intern(copy("NATURE"))
+    assert first is second
+    assert pool.code("NATURE") == 0
+    assert pool.values == ["NATURE"]
+    assert "NATURE" in pool and len(pool) == 1
+
+
+def test_stats():
+    pool = StringPool()
+    pool.intern(copy("NATURE"))
+    pool.intern(copy("NATURE"))
+    pool.intern("SCIENCE")
+    stats = pool.stats()
+    assert stats == PoolStats(2, 3, 1, stats.saved_bytes)
+    assert stats.saved_bytes > 0
+
+
+def test_max_size():
+    pool = StringPool(max_size=1)
+    pool.intern("NATURE")
+    value = copy("SCIENCE")
+    assert pool.intern(value) is value
+    assert pool.code(value) is None
+    assert len(pool) == 1
+
+
+def test_intern_record():
+    pool = StringPool(fields=["SO", "AU"])
+    records = [
+        {"SO": copy("NATURE"), "AU": [copy("Doe, J"), "Roe, R"], "TI": copy("Title")}
+        for _ in range(2)
+    ]
+    for record in records:
+        assert pool.intern_record(record) is record
+    assert records[0]["SO"] is records[1]["SO"]
+    assert records[0]["AU"][0] is records[1]["AU"][0]
+    assert records[0]["TI"] is not records[1]["TI"]
+
+
+def test_intern_record_skips_raw_splittable_fields():
+    pool = StringPool()
+    record = pool.intern_record({"SO": "NATURE", "AU": "Doe, J; Roe, R"})
+    assert record == {"SO": "NATURE", "AU": "Doe, J; Roe, R"}
+    assert "NATURE" in pool
+    assert len(pool) == 1
+
+
+def test_read_with_pool():
+    pool = StringPool()
+    records = list(read("data/wos_plaintext.txt", pool=pool))
+    assert records == list(read("data/wos_plaintext.txt"))
+    assert records[0]["PT"] is records[1]["PT"]
+    assert pool.stats().hits > 0
+
+
+def test_read_batches_with_pool():
+    pool = StringPool()
+    (batch,) = read_batches("data/wos_plaintext.txt", batch_size=100, pool=pool)
+    assert batch["PT"][0] is batch["PT"][1]
+    assert not any(value in pool for value in batch["AU"])
+
+
+def test_records_from_with_pool():
+    fname = "data/wos_plaintext.txt"
+    pool = StringPool()
+    records = list(records_from(fname, pool=pool))
+    assert records == list(records_from(fname))
+    assert all(isinstance(rec, Record) for rec in records)
+    assert records[0]["PT"] is records[1]["PT"]
+    assert records[0]["WC"][0] in pool
+
+
+def test_lazy_records_from_with_pool():
+    fname = "data/wos_plaintext.txt"
+    records = list(records_from(fname, lazy=True, pool=StringPool()))
+    assert all(isinstance(rec, LazyRecord) for rec in records)
+    assert [dict(rec) for rec in records] == [
+        dict(rec) for rec in records_from(fname, lazy=True)
+    ]
+    assert records[0]["PT"] is records[1]["PT"]
@@ -1,13 +1,24 @@
-import pytest
+import bz2
+import gzip
+import importlib
+import lzma
+import zipfile
 from io import StringIO
 
+import pytest
+
 from wosfile.read import (
     PlainTextReader,
     ReadError,
     TabDelimitedReader,
     get_reader,
     read,
+    read_batches,
 )
+from wosfile.stats import ReadStats
+
+# wosfile.read is shadowed by the read() function in the package namespace
+read_module = importlib.import_module("wosfile.read")
 
 preamble_b = b"""FN Thomson Reuters Web of Science
 VR 1.0
@@ -17,7 +28,7 @@ preamble_s = preamble_b.decode("utf-8")
 
 def assert_no_bom(record):
     # very basic way of asserting that we've successfully stripped the BOM
-    assert u"PT" in record
+    assert "PT" in record
 
 
 def test_get_reader():
@@ -72,6 +83,238 @@ def test_read_multiple_files(tmp_path):
         assert rec == exp
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_read_multiple_files_parallel(tmp_path, ordered):
+    files = []
+    for i in range(5):
+        fname = tmp_path / f"test_read_parallel{i}"
+        with open(fname, "wb") as f:
+            f.write(preamble_b + f"PT J\nAU Author {i}\nER\nEF".encode("utf-8"))
+        files.append(fname)
+
+    serial = list(read(files))
+    parallel = list(read(files, workers=2, ordered=ordered))
+    if ordered:
+        assert parallel == serial
+    else:
+        assert sorted(parallel, key=str) == sorted(serial, key=str)
+
+
+def test_read_multiple_files_passes_options(tmp_path):
+    data = "PT\tAU\nJ\tJoão\n".encode("utf-16")
+    files = []
+    for i in range(2):
+        fname = tmp_path / f"test_read_options{i}"
+        with open(fname, "wb") as f:
+            f.write(data)
+        files.append(fname)
+
+    for workers in (None, 2):
+        res = list(
+            read(files, using=TabDelimitedReader, encoding="utf-16", workers=workers)
+        )
+        assert res == [{"PT": "J", "AU": "João"}] * 2
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16-le", "utf-16"])
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_read_single_file_parallel(tmp_path, monkeypatch, encoding, newline):
+    monkeypatch.setattr(read_module, "CHUNK_SIZE", 200)
+    with open("data/wos_plaintext.txt", encoding="utf-8-sig") as f:
+        text = f.read()
+    fname = tmp_path / "test_read_single_file_parallel"
+    with open(fname, "w", encoding=encoding, newline=newline) as f:
+        f.write(text)
+
+    serial = list(read(fname, encoding=encoding))
+    assert list(read(fname, encoding=encoding, workers=2)) == serial
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "PT abc\nAU xuz\nER\n\nPT abc2\nAU x\nER\nPT abc3\nEF",
+        "PT abc\nAU xuz\nER\n\nPT abc2\nAU x\nER\nPT abc3\nER",
+        "PT abc\nAU xuz\nER\n\nPT abc2\nAU x\nER\nEF\nPT abc3\nER\nEF",
+    ],
+)
+def test_read_single_file_parallel_errors(tmp_path, monkeypatch, data):
+    monkeypatch.setattr(read_module, "CHUNK_SIZE", 10)
+    fname = tmp_path / "test_read_single_file_parallel_errors"
+    with open(fname, "w") as f:
+        f.write(preamble_s + data)
+
+    def outcome(**kwargs):
+        records = []
+        try:
+            for record in read(fname, **kwargs):
+                records.append(record)
+        except ReadError as e:
+            return records, str(e)
+        return records, None
+
+    assert outcome(workers=2) == outcome()
+
+
+@pytest.mark.parametrize(
+    "fname",
+    [
+        "wos_plaintext.txt",
+        "wos_tab_delimited_win_utf8.txt",
+        "wos_tab_delimited_win_utf16.txt",
+    ],
+)
+def test_read_fields(fname):
+    fields = ["UT", "PY", "SO", "AU"]
+    full = list(read("data/" + fname))
+    projected = list(read("data/" + fname, fields=fields))
+
+    assert len(projected) == len(full)
+    for rec, rec_full in zip(projected, full):
+        assert rec == {k: v for k, v in rec_full.items() if k in fields}
+
+
+def is_recent(year):
+    return int(year) >= 2005
+
+
+@pytest.mark.parametrize(
+    "fname",
+    [
+        "wos_plaintext.txt",
+        "wos_tab_delimited_win_utf8.txt",
+        "wos_tab_delimited_win_utf16.txt",
+    ],
+)
+@pytest.mark.parametrize("fields", [None, ["UT", "DT"]])
+def test_read_where(fname, fields):
+    full = list(read("data/" + fname))
+    where = {"PY": is_recent, "DT": lambda dt: dt == "Article"}
+    filtered = list(read("data/" + fname, fields=fields, where=where))
+
+    expected = [
+        {k: v for k, v in rec.items() if fields is None or k in fields}
+        for rec in full
+        if rec["PY"] and is_recent(rec["PY"]) and rec["DT"] == "Article"
+    ]
+    assert 0 < len(filtered) < len(full)
+    assert filtered == expected
+
+
+def test_read_where_skipped_parallel(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(read_module, "CHUNK_SIZE", 200)
+    fname = "data/wos_plaintext.txt"
+    copy = tmp_path / "wos_plaintext.txt"
+    copy.write_bytes(open(fname, "rb").read())
+    where = {"PY": is_recent}
+    expected = len(list(read(fname))) - len(list(read(fname, where=where)))
+    assert expected > 0
+
+    for files in (fname, [fname, copy]):
+        n_files = 1 if files is fname else 2
+        for workers in (None, 2):
+            stats = ReadStats()
+            caplog.clear()
+            with caplog.at_level("INFO", logger="wosfile.read"):
+                list(read(files, where=where, workers=workers, stats=stats))
+            assert stats.skipped == n_files * expected
+            assert caplog.text.count("Skipped {} ".format(expected)) == n_files
+
+
+def columns_to_records(columns):
+    size = len(next(iter(columns.values())))
+    return [
+        {tag: values[i] for tag, values in columns.items() if values[i] is not None}
+        for i in range(size)
+    ]
+
+
+@pytest.mark.parametrize(
+    "fname",
+    [
+        "wos_plaintext.txt",
+        "wos_tab_delimited_win_utf8.txt",
+        "wos_tab_delimited_win_utf16.txt",
+    ],
+)
+@pytest.mark.parametrize("fields", [None, ["UT", "PY", "AU"]])
+def test_read_batches(fname, fields):
+    fnames = ["data/" + fname] * 2
+    records = list(read(fnames, fields=fields))
+
+    batches = list(read_batches(fnames, batch_size=7, fields=fields))
+    assert [len(batch["UT"]) for batch in batches[:-1]] == [7] * (len(batches) - 1)
+    assert [rec for batch in batches for rec in columns_to_records(batch)] == [
+        {k: v for k, v in rec.items() if v is not None} for rec in records
+    ]
+
+    batches = list(read_batches(fnames, batch_size=7, as_records=True, fields=fields))
+    assert [rec for batch in batches for rec in batch] == records
+
+
+@pytest.mark.parametrize(
+    "fname", ["wos_plaintext.txt", "wos_tab_delimited_win_utf8.txt"]
+)
+@pytest.mark.parametrize("options", [{"dedupe": True}, {"workers": 2}])
+def test_read_batches_read_options(fname, options):
+    fnames = ["data/" + fname] * 2
+    records = list(read(fnames, **options))
+
+    batches = list(read_batches(fnames, batch_size=7, **options))
+    assert [rec for batch in batches for rec in columns_to_records(batch)] == [
+        {k: v for k, v in rec.items() if v is not None} for rec in records
+    ]
+
+
+def test_read_batches_missing_fields(tmp_path):
+    fname = tmp_path / "test_read_batches"
+    with open(fname, "wb") as f:
+        f.write(preamble_b + b"PT J\nAU John\nER\nPT J\nTI Title\nER\nPT B\nER\nEF")
+
+    assert list(read_batches(fname, batch_size=2)) == [
+        {"PT": ["J", "J"], "AU": ["John", None], "TI": [None, "Title"]},
+        {"PT": ["B"]},
+    ]
+
+
+@pytest.mark.parametrize("compression", [gzip, bz2, lzma])
+def test_read_compressed(tmp_path, compression):
+    with open("data/wos_plaintext.txt", "rb") as f:
+        data = f.read()
+    fname = tmp_path / "test_read_compressed"
+    with compression.open(fname, "wb") as f:
+        f.write(data)
+
+    assert list(read(fname)) == list(read("data/wos_plaintext.txt"))
+
+
+def test_read_zip(tmp_path):
+    fnames = [
+        "wos_plaintext.txt",
+        "wos_tab_delimited_win_utf8.txt",
+        "wos_tab_delimited_win_utf16.txt",
+    ]
+    archive = tmp_path / "test_read_zip.zip"
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED) as f:
+        for fname in fnames:
+            f.write("data/" + fname, fname)
+
+    assert list(read(archive)) == list(read(["data/" + fname for fname in fnames]))
+
+
+def test_read_opens_once(monkeypatch):
+    opened = []
+
+    def counting_open(fname, *args, **kwargs):
+        opened.append(fname)
+        return open(fname, *args, **kwargs)
+
+    monkeypatch.setattr(read_module, "open", counting_open, raising=False)
+    for rec in read("data/wos_tab_delimited_win_utf16.txt"):
+        assert_no_bom(rec)
+    assert opened == ["data/wos_tab_delimited_win_utf16.txt"]
+
+
 class TestPlainTextReader:
     def test_wrong_format(self):
         f = StringIO("XY Bla\nVR 1.0")
@@ -143,6 +386,31 @@ class TestPlainTextReader:
         expected = {"PT": "abc", "SC": "Here; there be dragons; Yes"}
         assert next(r) == expected
 
+    def test_fields(self):
+        f = StringIO(
+            preamble_s + "PT abc\nAU xyz\n   abc\nCR ref 1\n   ref 2\nQQ x\nER\n"
+            "PT abc2\nCR ref 3\nER\nEF"
+        )
+        r = PlainTextReader(f, fields=["AU"])
+
+        assert list(r) == [{"AU": "xyz; abc"}, {}]
+
+    def test_where(self):
+        f = StringIO(
+            preamble_s + "PT abc\nAU xyz\nPY 2015\nCR ref 1\n   ref 2\nER\n"
+            "PT abc2\nPY 2000\nCR ref 3\nER\nPT abc3\nER\nEF"
+        )
+        r = PlainTextReader(f, fields=["AU"], where={"PY": is_recent})
+
+        assert list(r) == [{"AU": "xyz"}]
+        assert r.skipped == 2
+
+    def test_where_unexpected_EF(self):
+        f = StringIO(preamble_s + "PT abc\nPY 2000\nAU xyz\nEF")
+        r = PlainTextReader(f, where={"PY": is_recent})
+        with pytest.raises(ReadError):
+            list(r)
+
     def test_wos_plaintext(self):
         # utf-8-sig = UTF-8 with BOM
         with open("data/wos_plaintext.txt", encoding="utf-8-sig") as fh:
@@ -174,6 +442,20 @@ class TestTabDelimitedReader:
         for result, exp in zip(results, expected):
             assert result == exp
 
+    def test_fields(self):
+        f = StringIO("PT\tAF\tC1\n\nJ\tAa; Bb\tX; Y\nJ\tBb; Cc")
+        r = TabDelimitedReader(f, fields=["C1", "PT"])
+
+        expected = [{"PT": "J", "C1": "X; Y"}, {"PT": "J", "C1": None}]
+        assert list(r) == expected
+
+    def test_where(self):
+        f = StringIO("PT\tPY\tC1\nJ\t2015\tX\nJ\t2000\tY\nJ\t\tZ\nJ")
+        r = TabDelimitedReader(f, where={"PY": is_recent})
+
+        assert list(r) == [{"PT": "J", "PY": "2015", "C1": "X"}]
+        assert r.skipped == 3
+
     def test_spurious_tab_at_end(self):
         f = StringIO("PT\tAU\tC1\nJ\ta\tb\t")
         r = TabDelimitedReader(f)
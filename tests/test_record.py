@@ -1,9 +1,18 @@
+import itertools
+import pickle
 import tempfile
 
 import pytest
 
-from wosfile.record import Record, parse_address_field, records_from
-
+from wosfile.record import (
+    LAYOUT_CACHE_SIZE,
+    LazyRecord,
+    Record,
+    _layout,
+    parse_address_field,
+    records_from,
+)
+from wosfile.tags import is_splittable
 
 records = [
     # (data, record_id, author_address)
@@ -156,3 +165,53 @@ def test_records_from_multiple_files():
     for res, exp in zip(results, expected):
         assert isinstance(res, Record)
         assert res == Record(exp)
+
+
+def test_records_from_fields():
+    results = list(records_from("data/wos_plaintext.txt", fields=["AU", "PY"]))
+    assert results
+    for res in results:
+        assert set(res) <= {"AU", "PY"}
+        assert isinstance(res["AU"], list)
+
+
+@pytest.mark.parametrize("data, record_id, author_address", records)
+def test_lazy_record(data, record_id, author_address):
+    for skip_empty in (True, False):
+        rec = LazyRecord(data, skip_empty)
+        assert rec == Record(data, skip_empty)
+        assert dict(rec) == Record(data, skip_empty)
+    assert rec.record_id == record_id
+    assert rec.author_address == author_address
+    assert not hasattr(rec, "__dict__")
+
+
+def test_lazy_record_splits_once():
+    rec = LazyRecord({"AU": "Doe, J; Foo, B", "TI": "Title"})
+    assert rec._values == ["Doe, J; Foo, B", "Title"]
+    authors = rec["AU"]
+    assert authors == ["Doe, J", "Foo, B"]
+    assert rec["AU"] is authors
+
+
+def test_lazy_record_layout_cache():
+    first = LazyRecord({"AU": "Doe, J", "TI": "Title"})
+    second = LazyRecord({"AU": "Foo, B", "TI": "Other"})
+    assert first._layout is second._layout
+
+    pairs = itertools.islice(itertools.permutations(is_splittable, 2), 2000)
+    for first_tag, second_tag in pairs:
+        rec = LazyRecord({first_tag: "one", second_tag: "two"})
+        assert list(rec) == [first_tag, second_tag]
+    assert _layout.cache_info().currsize == LAYOUT_CACHE_SIZE
+
+
+def test_lazy_record_pickle():
+    rec = LazyRecord({"AU": "Doe, J; Foo, B", "TI": "Title"})
+    assert pickle.loads(pickle.dumps(rec)) == rec
+
+
+def test_records_from_lazy():
+    lazy = list(records_from("data/wos_plaintext.txt", lazy=True))
+    assert all(isinstance(rec, LazyRecord) for rec in lazy)
+    assert lazy == list(records_from("data/wos_plaintext.txt"))
@@ -0,0 +1,110 @@
+import pytest
+
+from wosfile.read import read
+from wosfile.record import LazyRecord, Record
+from wosfile.references import (
+    Reference,
+    ReferenceParser,
+    parse_reference,
+    parse_references,
+    references_from,
+)
+
+
+@pytest.mark.parametrize(
+    "reference, expected",
+    [
+        (
+            "Yu HY, 2011, NAT METHODS, V8, P478, DOI 10.1038/nmeth.1597",
+            ("Yu HY", 2011, "NAT METHODS", "8", "478", "10.1038/nmeth.1597"),
+        ),
+        (
+            "Yu HY, 2011, NAT METHODS, V8, P478, DOI [10.1038/nmeth.1597, "
+            "10.1038/NMETH.1597]",
+            ("Yu HY", 2011, "NAT METHODS", "8", "478", "10.1038/nmeth.1597"),
+        ),
+        (
+            "Hirschman L., 2012, DATABASE, DOI [10.1093/database/bas020",
+            ("Hirschman L.", 2012, "DATABASE", None, None, "10.1093/database/bas020"),
+        ),
+        ("Price DJD, 1965, SCIENCE", ("Price DJD", 1965, "SCIENCE", None, None, None)),
+        ("2001, VIROLOGY, V12", (None, 2001, "VIROLOGY", "12", None, None)),
+        (
+            "*OGC, WEB MAP CONT DOC",
+            ("*OGC", None, "WEB MAP CONT DOC", None, None, None),
+        ),
+        ("Smith J, 1999, P12", ("Smith J", 1999, None, None, "12", None)),
+    ],
+)
+def test_parse_reference(reference, expected):
+    assert parse_reference(reference) == Reference(*expected)
+
+
+def test_parser_interns_authors_and_sources():
+    parser = ReferenceParser()
+    first = parser.parse("Price DJD, 1965, SCIENCE, V149, P510")
+    second = parser.parse(
+        "Merton RK, 1968, " + "".join(["SCI", "ENCE"]) + ", V159, P56"
+    )
+    assert first.source is second.source
+
+
+def test_parser_bounded():
+    parser = ReferenceParser(cache_size=2, pool_size=1)
+    for i in range(10):
+        parser.parse("Author {}, 2000, SOURCE {}".format(i, i))
+    assert len(parser.pool) == 1
+    assert parser.parse.cache_info().currsize == 2
+
+
+def test_parse_references():
+    fields = [
+        "Price DJD, 1965, SCIENCE; Merton RK, 1968, SCIENCE",
+        ["Price DJD, 1965, SCIENCE"],
+        None,
+    ]
+    parsed = list(parse_references(fields))
+    assert [len(references) for references in parsed] == [2, 1, 0]
+    assert parsed[0][1].author == "Merton RK"
+
+
+def test_parse_references_keeps_semicolons_in_doi():
+    field = (
+        "Stuart TE, 2000, STRATEGIC MANAGE J, V21, P791, "
+        "DOI 10.1002/1097-0266(200008)21:8<791::AID-SMJ121>3.0.CO;2-K; "
+        "Price DJD, 1965, SCIENCE"
+    )
+    ((first, second),) = parse_references([field])
+    assert first.doi.endswith("3.0.CO;2-K")
+    assert second.author == "Price DJD"
+
+
+def test_references_from():
+    references = list(references_from("data/wos_plaintext.txt"))
+    records = list(read("data/wos_plaintext.txt"))
+    assert len(references) == len(records) == 50
+    for (ut, refs), rec, parsed in zip(
+        references, records, parse_references(rec.get("CR") for rec in records)
+    ):
+        assert ut == rec["UT"]
+        assert refs == parsed
+
+
+def test_record_references():
+    record = Record({"CR": "Price DJD, 1965, SCIENCE; Merton RK, 1968, SCIENCE"})
+    assert [ref.year for ref in record.references] == [1965, 1968]
+    assert Record({}).references == []
+
+
+@pytest.mark.parametrize("record_type", [Record, LazyRecord])
+def test_record_references_sici_doi(record_type):
+    field = (
+        "Small H, 1998, J AM SOC INFORM SCI, V49, P693, "
+        "DOI 10.1002/(SICI)1097-4571(199806)49:8<693::AID-ASI4>3.0.CO;2-#; "
+        "Price DJD, 1965, SCIENCE"
+    )
+    record = record_type({"CR": field})
+    assert len(record["CR"]) == 2
+    assert record.references == list(parse_references([field]))[0]
+    assert [ref.author for ref in record.references] == ["Small H", "Price DJD"]
+    assert record.references[0].doi.endswith("3.0.CO;2-#")
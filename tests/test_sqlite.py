@@ -0,0 +1,72 @@
+import sqlite3
+
+from wosfile.address import parse_addresses
+from wosfile.read import read
+from wosfile.record import records_from
+from wosfile.sqlite import load_sqlite
+
+
+def test_load_sqlite(tmp_path):
+    fname = tmp_path / "wos.db"
+    records = list(records_from("data/wos_plaintext.txt"))
+    assert load_sqlite(records, fname, batch_size=7) == 50
+
+    db = sqlite3.connect(str(fname))
+    assert db.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert db.execute("SELECT COUNT(*) FROM records").fetchone() == (50,)
+
+    record = records[0]
+    row = db.execute(
+        "SELECT id, TI, PY FROM records WHERE UT = ?", (record["UT"],)
+    ).fetchone()
+    assert row == (1, record["TI"], int(record["PY"]))
+
+    authors = db.execute(
+        "SELECT AU, AF FROM authors WHERE record_id = 1 ORDER BY position"
+    ).fetchall()
+    assert authors == list(zip(record["AU"], record["AF"]))
+
+    references = db.execute(
+        "SELECT reference, year FROM cited_references "
+        "WHERE record_id = 1 ORDER BY position"
+    ).fetchall()
+    assert [ref for ref, _ in references] == record["CR"]
+    assert references[0][1] == int(record["CR"][0].split(", ")[1])
+
+    categories = db.execute(
+        "SELECT category FROM categories WHERE record_id = 1 AND type = 'WC'"
+    ).fetchall()
+    assert [category for category, in categories] == record["WC"]
+
+    (n_addresses,) = db.execute(
+        "SELECT COUNT(*) FROM addresses WHERE record_id = 1"
+    ).fetchone()
+    assert n_addresses == len(next(parse_addresses([record["C1"]])))
+
+    items = db.execute(
+        "SELECT record_id, tag, item FROM items ORDER BY record_id, tag, position"
+    ).fetchall()
+    expected = [
+        (i, tag, item)
+        for i, rec in enumerate(records, 1)
+        for tag in sorted(rec)
+        if tag in ("C3", "EM", "OI", "RI")
+        for item in rec[tag]
+    ]
+    assert expected
+    assert [row for row in items if row[1] in ("C3", "EM", "OI", "RI")] == expected
+
+    indexes = db.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    assert ("records_UT",) in indexes.fetchall()
+
+
+def test_load_sqlite_append_raw(tmp_path):
+    db = sqlite3.connect(str(tmp_path / "wos.db"))
+    load_sqlite(read("data/wos_plaintext.txt"), db, wal=False, create_indexes=False)
+    load_sqlite(read("data/wos_plaintext.txt"), db, wal=False, create_indexes=False)
+    assert db.execute("SELECT MIN(id), MAX(id) FROM records").fetchone() == (1, 100)
+    assert db.execute("PRAGMA journal_mode").fetchone() != ("wal",)
+    (n_keywords,) = db.execute(
+        "SELECT COUNT(*) FROM keywords WHERE record_id = 51"
+    ).fetchone()
+    assert n_keywords > 0
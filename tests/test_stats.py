@@ -0,0 +1,95 @@
+import gzip
+import io
+import shutil
+
+import pytest
+
+from wosfile.mmapread import MmapPlainTextReader
+from wosfile.read import read
+from wosfile.record import Record, records_from
+from wosfile.stats import ReadStats
+
+
+@pytest.mark.parametrize(
+    "fname, stages",
+    [
+        ("wos_plaintext.txt", {"io", "lines", "format"}),
+        ("wos_tab_delimited_win_utf8.txt", {"io", "csv"}),
+    ],
+)
+@pytest.mark.parametrize("fields", [None, ["UT", "PY"]])
+def test_read_stats(fname, stages, fields):
+    stats = ReadStats()
+    records = list(read("data/" + fname, stats=stats, fields=fields))
+    assert records == list(read("data/" + fname, fields=fields))
+    assert stats.records == len(records)
+    assert set(stats.stages) == stages
+    assert all(seconds > 0 for _, seconds in stats.stages.values())
+    assert stats.bytes > 0 and stats.elapsed > 0
+    assert stats.records_per_sec > 0 and stats.bytes_per_sec > 0
+
+
+def test_read_stats_bytes(tmp_path):
+    fname = "data/wos_plaintext.txt"
+    compressed = str(tmp_path / "wos.txt.gz")
+    with open(fname, "rb") as f_in, gzip.open(compressed, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    size = len(open(fname, "rb").read())
+
+    for actual_fname, using in [
+        (fname, None),
+        (compressed, None),
+        (fname, MmapPlainTextReader),
+    ]:
+        stats = ReadStats()
+        list(read(actual_fname, using=using, stats=stats))
+        assert stats.bytes == size
+
+
+def test_largest():
+    stats = ReadStats(top=2)
+    records = list(read("data/wos_plaintext.txt", stats=stats))
+    sizes = sorted(
+        ((sum(len(v) for v in rec.values() if v), rec["UT"]) for rec in records),
+        reverse=True,
+    )
+    assert sorted(stats.largest_records, reverse=True) == sizes[:2]
+
+    fields = [(len(v), rec["UT"], tag) for rec in records for tag, v in rec.items()]
+    assert max(stats.largest_fields) == max(fields)
+    assert len(stats.largest_fields) == 2
+
+
+def test_records_from_stats(caplog):
+    stats = ReadStats()
+    with caplog.at_level("INFO", logger="wosfile.record"):
+        records = list(records_from("data/wos_plaintext.txt", stats=stats))
+    assert all(isinstance(rec, Record) for rec in records)
+    assert stats.stages["record"][0] == len(records) == stats.records
+    assert "{} records".format(len(records)) in caplog.text
+
+
+def test_stats_with_dedupe():
+    stats = ReadStats()
+    fname = "data/wos_plaintext.txt"
+    records = list(read([fname, fname], dedupe=True, stats=stats))
+    assert stats.records == 2 * len(records)
+
+
+def test_time_and_report():
+    stats = ReadStats()
+    with stats.time("addresses"):
+        pass
+    double = stats.timed("addresses", lambda x: 2 * x)
+    assert double(2) == 4
+    assert stats.stages["addresses"][0] == 2
+    list(read("data/wos_plaintext.txt", stats=stats))
+
+    out = io.StringIO()
+    stats.dump(out)
+    report = out.getvalue()
+    assert report == stats.report() + "\n"
+    assert "addresses" in report and "Largest fields:" in report
+    summary = stats.as_dict()
+    assert summary["records"] == stats.records
+    assert summary["stages"]["addresses"]["calls"] == 2
@@ -0,0 +1,138 @@
+import pytest
+
+from wosfile.aggregate import Aggregate
+from wosfile.record import Record, records_from
+from wosfile.table import RecordTable, record_table
+
+np = pytest.importorskip("numpy")
+
+records = [
+    {"PY": "2010", "WC": "Ecology; Zoology", "TC": "3", "Z9": "4", "TI": "One"},
+    Record({"PY": "2010", "WC": "Ecology", "TC": "1", "SO": "NATURE"}),
+    {"PY": "2011", "WC": "Zoology; Zoology", "TC": "5", "Z9": "5", "SO": "CELL"},
+    {"WC": "Ecology", "TC": "n/a", "SO": "NATURE", "AU": "Doe, J; Foo, B"},
+]
+
+
+def test_columns():
+    table = RecordTable.from_records(records)
+    assert len(table) == 4
+    assert table.fields == ("PY", "WC", "TC", "Z9", "TI", "SO", "AU")
+    assert table["PY"].tolist() == [2010, 2010, 2011, -1]
+    assert table["TC"].tolist() == [3, 1, 5, -1]
+    assert table["SO"].tolist() == [None, "NATURE", "CELL", "NATURE"]
+    assert table.categories["SO"] == ["NATURE", "CELL"]
+    assert table.columns["SO"].tolist() == [-1, 0, 1, 0]
+    assert table["TI"].tolist() == ["One", None, None, None]
+    assert table["WC"].tolist() == [
+        ["Ecology", "Zoology"],
+        ["Ecology"],
+        ["Zoology", "Zoology"],
+        ["Ecology"],
+    ]
+    assert table.offsets["AU"].tolist() == [0, 0, 0, 0, 2]
+
+
+def test_numeric_fields_not_categorical():
+    with pytest.raises(ValueError):
+        RecordTable.from_records(records, categorical=["PY", "DT"])
+    with pytest.raises(ValueError):
+        record_table("data/wos_plaintext.txt", categorical=["TC"])
+
+    fname = "data/wos_plaintext.txt"
+    table = record_table(fname, categorical=["PT", "DT"])
+    expected = list(records_from(fname))
+    assert table.categories["PT"] == list(dict.fromkeys(rec["PT"] for rec in expected))
+    assert [dict(row) for row in table] == [dict(rec) for rec in expected]
+
+
+def test_rows_match_records():
+    fname = "data/wos_plaintext.txt"
+    expected = list(records_from(fname))
+    table = record_table(fname)
+    assert len(table) == len(expected)
+    for row, record in zip(table, expected):
+        assert dict(row) == dict(record)
+        assert row.record_id == record.record_id
+    assert table[-1]["UT"] == expected[-1]["UT"]
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+
+def test_fields():
+    table = record_table("data/wos_tab_delimited_win_utf8.txt", fields=["UT", "PY"])
+    assert set(table.fields) == {"UT", "PY"}
+    assert "TI" not in table
+
+
+def test_filter_and_isin():
+    table = RecordTable.from_records(records)
+    recent = table.filter(table["PY"] >= 2011)
+    assert [row["TC"] for row in recent] == ["5"]
+    assert table.isin("SO", ["NATURE", "SCIENCE"]).tolist() == [
+        False,
+        True,
+        False,
+        True,
+    ]
+    ecology = table.filter(table.isin("WC", ["Ecology"]))
+    assert ecology["WC"].tolist() == [["Ecology", "Zoology"], ["Ecology"], ["Ecology"]]
+    assert ecology[2]["AU"] == ["Doe, J", "Foo, B"]
+    assert table.isin("TI", ["One"]).tolist() == [True, False, False, False]
+
+
+def test_take_splittable_fields():
+    table = RecordTable.from_records(records)
+    taken = table.take([3, 0, 3])
+    assert taken["WC"].tolist() == [["Ecology"], ["Ecology", "Zoology"], ["Ecology"]]
+    assert taken.offsets["AU"].tolist() == [0, 2, 2, 4]
+    assert dict(taken[1]) == dict(table[0])
+
+
+def test_sort():
+    fname = "data/wos_plaintext.txt"
+    table = record_table(fname)
+    expected = sorted(records_from(fname), key=lambda rec: -int(rec.get("TC", -1)))
+    assert [row["UT"] for row in table.sort("TC", descending=True)] == [
+        rec["UT"] for rec in expected
+    ]
+
+    expected = sorted(
+        records_from(fname), key=lambda rec: (rec.get("SO", "￿"), rec["UT"])
+    )
+    assert [row["UT"] for row in table.sort(["SO", "UT"])] == [
+        rec["UT"] for rec in expected
+    ]
+
+    with pytest.raises(ValueError):
+        table.sort("AU")
+
+
+def test_group_by():
+    table = RecordTable.from_records(records)
+    groups = table.group_by("WC")
+    assert {key: group.tolist() for key, group in groups.items()} == {
+        "Ecology": [0, 1, 3],
+        "Zoology": [0, 2],
+    }
+    groups = table.group_by("PY")
+    assert {key: group.tolist() for key, group in groups.items()} == {
+        "2010": [0, 1],
+        "2011": [2],
+        None: [3],
+    }
+
+
+@pytest.mark.parametrize("by", ["PY", "WC", "SO", "TI", "AU", ["PY", "WC"]])
+def test_aggregate(by):
+    table = RecordTable.from_records(records)
+    expected = Aggregate(by).update(records)
+    assert table.aggregate(by).rows() == expected.rows()
+
+
+def test_aggregate_file():
+    fname = "data/wos_plaintext.txt"
+    table = record_table(fname)
+    for by in ("DT", "PY", "WC", "AU"):
+        expected = Aggregate(by, ["TC", "NR", "BP"]).update(records_from(fname))
+        assert table.aggregate(by, ["TC", "NR", "BP"]).rows() == expected.rows()
@@ -0,0 +1,121 @@
+import io
+
+import pytest
+
+from wosfile.read import PlainTextReader, TabDelimitedReader, read, sniff_encoding
+from wosfile.record import records_from
+from wosfile.tags import tags
+from wosfile.write import (
+    PlainTextWriter,
+    TabDelimitedWriter,
+    Writer,
+    tab_delimited_tags,
+    write_plaintext,
+    write_tab_delimited,
+)
+
+fnames = [
+    "data/wos_plaintext.txt",
+    "data/wos_tab_delimited_win_utf8.txt",
+    "data/wos_tab_delimited_win_utf16.txt",
+]
+
+
+def non_empty(record):
+    return {tag: value for tag, value in record.items() if value}
+
+
+def test_tab_delimited_tags():
+    assert sorted(tab_delimited_tags) == sorted({abbr for abbr, *_ in tags})
+
+
+@pytest.mark.parametrize("fname", fnames)
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_write_plaintext(tmp_path, fname, encoding):
+    out = tmp_path / "out.txt"
+    records = list(read(fname))
+    assert write_plaintext(read(fname), out, encoding) == len(records)
+
+    with open(out, "rb") as fh:
+        assert (
+            sniff_encoding(fh) == {"utf-8": "utf-8-sig", "utf-16": "utf-16"}[encoding]
+        )
+    with open(out, encoding="utf-8-sig" if encoding == "utf-8" else encoding) as fh:
+        text = fh.read()
+    assert text.startswith("FN ") and text.endswith("ER\n\nEF\n")
+    assert list(read(out)) == [non_empty(record) for record in records]
+
+
+@pytest.mark.parametrize("fname", fnames)
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_write_tab_delimited(tmp_path, fname, encoding):
+    out = tmp_path / "out.txt"
+    records = list(read(fname))
+    assert write_tab_delimited(read(fname), out, encoding=encoding) == len(records)
+
+    written = list(read(out))
+    assert all(tuple(record) == tab_delimited_tags for record in written)
+    assert [non_empty(record) for record in written] == [
+        non_empty(record) for record in records
+    ]
+
+
+def test_write_tab_delimited_fields(tmp_path):
+    out = tmp_path / "out.txt"
+    fname = fnames[1]
+    write_tab_delimited(read(fname), out, fields=["UT", "PY", "AU"])
+    assert list(read(out)) == list(read(fname, fields=["UT", "PY", "AU"]))
+    with open(out, encoding="utf-8-sig") as fh:
+        assert fh.readline() == "UT\tPY\tAU\n"
+
+
+def test_write_parsed_records(tmp_path):
+    out = tmp_path / "out.txt"
+    write_plaintext(records_from(fnames[0]), out)
+    assert list(records_from(out)) == list(records_from(fnames[0]))
+
+
+def test_plaintext_items_per_line():
+    fh = io.StringIO()
+    with PlainTextWriter(fh) as writer:
+        writer.write(
+            {
+                "AU": "Doe, J; Roe, R",
+                "TI": "A title; with a semicolon",
+                "C1": "[Doe, J; Roe, R] Univ A, Belgium; [Poe, P] Univ B, France",
+                "DE": ["x", "y"],
+            }
+        )
+    assert fh.getvalue() == (
+        "FN Clarivate Analytics Web of Science\n"
+        "VR 1.0\n"
+        "AU Doe, J\n"
+        "   Roe, R\n"
+        "TI A title; with a semicolon\n"
+        "C1 [Doe, J; Roe, R] Univ A, Belgium\n"
+        "   [Poe, P] Univ B, France\n"
+        "DE x; y\n"
+        "ER\n\n"
+        "EF\n"
+    )
+    fh.seek(0)
+    assert next(PlainTextReader(fh))["C1"] == (
+        "[Doe, J; Roe, R] Univ A, Belgium; [Poe, P] Univ B, France"
+    )
+
+
+def test_tab_delimited_quoting():
+    fh = io.StringIO()
+    record = {"TI": '"Quoted" title', "AB": "Tab\there", "UT": "WOS:1"}
+    with TabDelimitedWriter(fh, ["UT", "TI", "AB"]) as writer:
+        writer.write(record)
+    fh.seek(0)
+    assert list(TabDelimitedReader(fh)) == [record]
+
+
+def test_incomplete_writer():
+    class NoWrite(Writer):
+        pass
+
+    with pytest.raises(TypeError):
+        NoWrite(io.StringIO())
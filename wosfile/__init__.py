@@ -1,3 +1,18 @@
 from .record import *
 from .read import *  # type: ignore # https://github.com/python/mypy/issues/5479
 from .tags import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .index import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .arrow import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .mmapread import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .address import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .pool import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .dedupe import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .ingest import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .sqlite import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .network import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .aggregate import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .references import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .stats import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .aio import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .write import *  # type: ignore # https://github.com/python/mypy/issues/5479
+from .table import *  # type: ignore # https://github.com/python/mypy/issues/5479
@@ -0,0 +1,131 @@
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = ["Address", "countries", "organisations", "parse_address", "parse_addresses"]
+
+# Maximum number of distinct address fields and addresses kept in the caches
+CACHE_SIZE = 2**16
+
+_address_field_re = re.compile(
+    r"""\s*\[(.*?)\] # Author part
+    \s+(.*)          # Address part
+    """,
+    re.VERBOSE,
+)
+_address_split_re = re.compile(r";(?=\s*\[)")
+_first_author_address_re = re.compile(r".+?;\s*(\[.+$)")
+_us_state_zip_re = re.compile(r"^(?:[A-Z]{2} )?(?:\d{5}(?:-\d{4})? )?USA$")
+
+# Addresses in an address field, each with a (possibly empty) tuple of authors
+AddressField = Tuple[Tuple[Tuple[str, ...], str], ...]
+
+
+class Address(NamedTuple):
+    """Parts of an address in the WoS address field (C1)"""
+
+    address: str
+    organisation: str
+    country: str
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_address_field(field: str) -> AddressField:
+    """Split author address field into (authors, address) pairs
+
+    Results are cached, since the same address fields occur in many records.
+
+    :raises ValueError: if `field` cannot be parsed
+    :return: tuple of (authors, address) pairs. If `field` does not list
+        authors, each address has an empty tuple of authors.
+
+    """
+    # Only addresses, no authors
+    if not field.startswith("["):
+        addresses = field.split("; ")
+
+        # It may happen that the first address(es) dont have authors but the rest do:
+        # Remove the ones without authors in that case and parse what remains.
+        # See issue #8.
+        if not any(address.startswith("[") for address in addresses):
+            return tuple(((), address) for address in addresses)
+        m = _first_author_address_re.search(field)
+        field = m.group(1)  # type: ignore
+
+    # Addresses with authors
+    parsed = []
+    for address_field in _address_split_re.split(field):
+        match = _address_field_re.match(address_field)
+        if match:
+            authors, address = match.groups()
+        else:
+            raise ValueError(f"Could not parse '{address_field}' as address field")
+        parsed.append((tuple(part.strip() for part in authors.split(";")), address))
+
+    return tuple(parsed)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_address(address: str) -> Address:
+    """Get organisation and country of a single address
+
+    The organisation is the first part of the address and the country is the
+    last part. US addresses, which end in state, ZIP code and 'USA', get
+    'USA' as country.
+
+    """
+    parts = address.rstrip(" .").split(", ")
+    country = parts[-1]
+    if country.endswith("USA") and _us_state_zip_re.match(country):
+        country = "USA"
+    return Address(address, parts[0], country)
+
+
+def parse_addresses(
+    fields: Iterable[Optional[str]],
+) -> Iterator[List[Tuple[Optional[str], Address]]]:
+    """Parse many address fields (C1) at once
+
+    Address fields and addresses are cached, so repeated values are only
+    parsed once. Missing fields (None or empty) yield an empty list.
+
+    :param fields: address fields, e.g. the C1 values of a series of records
+    :return:
+        iterator over lists of (author, address) pairs, one list per field.
+        If a field does not list authors, author is None.
+
+    """
+    for field in fields:
+        if not field:
+            yield []
+            continue
+        parsed = []
+        for authors, address in split_address_field(field):
+            parsed_address = parse_address(address)
+            if authors:
+                parsed.extend((author, parsed_address) for author in authors)
+            else:
+                parsed.append((None, parsed_address))
+        yield parsed
+
+
+def _unique(values: Iterable[str]) -> List[str]:
+    return list(dict.fromkeys(values))
+
+
+def countries(field: Optional[str]) -> List[str]:
+    """Get distinct countries in address field `field`, in order of appearance"""
+    if not field:
+        return []
+    return _unique(
+        parse_address(address).country for _, address in split_address_field(field)
+    )
+
+
+def organisations(field: Optional[str]) -> List[str]:
+    """Get distinct organisations in address field `field`, in order of appearance"""
+    if not field:
+        return []
+    return _unique(
+        parse_address(address).organisation for _, address in split_address_field(field)
+    )
@@ -0,0 +1,166 @@
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .read import FileName, _imap_bounded, read
+from .record import field_items, to_int
+from .tags import is_splittable
+
+__all__ = ["Aggregate", "aggregate"]
+
+Key = Tuple[Optional[str], ...]
+
+
+def _values(record: Mapping[str, Any], tag: str) -> List[Optional[str]]:
+    """Get the distinct values of `tag` in a parsed or raw record
+
+    Splittable fields give one value per item; missing fields give [None].
+
+    """
+    value = record.get(tag)
+    if not value:
+        return [None]
+    if isinstance(value, str) and not is_splittable.get(tag, False):
+        return [value]
+    return list(dict.fromkeys(field_items(tag, value)))
+
+
+class Aggregate:
+    def __init__(
+        self, by: Union[str, Sequence[str]], sums: Iterable[str] = ("TC", "Z9")
+    ) -> None:
+        """Count records and sum numeric fields, grouped by one or more fields
+
+        Records are added one at a time, so the corpus never needs to be in
+        memory. Records with several items in a splittable field (e.g. WC)
+        count once for each item; records with a missing field are grouped
+        under None. Aggregates over the same fields can be merged, e.g. to
+        combine aggregates of separate files.
+
+        :param by: field tag(s) to group by, e.g. 'PY' or ['PY', 'WC']
+        :param sums: numeric field tags to sum within each group
+
+        """
+        self.by = (by,) if isinstance(by, str) else tuple(by)
+        self.sums = tuple(sums)
+        # Group -> [number of records, sum of each field in `sums`]
+        self.groups: Dict[Key, List[int]] = {}
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Add a single parsed or raw record"""
+        totals = [1, *(to_int(record.get(tag), 0) for tag in self.sums)]
+        groups = self.groups
+        for key in product(*(_values(record, tag) for tag in self.by)):
+            try:
+                group = groups[key]
+            except KeyError:
+                groups[key] = list(totals)
+                continue
+            for i, total in enumerate(totals):
+                group[i] += total
+
+    def update(self, records: Iterable[Mapping[str, Any]]) -> "Aggregate":
+        """Add all `records`; return the aggregate itself"""
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: "Aggregate") -> "Aggregate":
+        """Add the groups of `other`; return the aggregate itself"""
+        if other.by != self.by or other.sums != self.sums:
+            raise ValueError("Cannot merge aggregates over different fields")
+        groups = self.groups
+        for key, totals in other.groups.items():
+            group = groups.get(key)
+            if group is None:
+                groups[key] = list(totals)
+            else:
+                for i, total in enumerate(totals):
+                    group[i] += total
+        return self
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self.groups)
+
+    def count(self, *key: Optional[str]) -> int:
+        """Get number of records in group `key`, e.g. ``count('2010')``"""
+        group = self.groups.get(key)
+        return group[0] if group else 0
+
+    def sum(self, tag: str, *key: Optional[str]) -> int:
+        """Get sum of field `tag` in group `key`, e.g. ``sum('TC', '2010')``"""
+        group = self.groups.get(key)
+        return group[1 + self.sums.index(tag)] if group else 0
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Get one dict per group, sorted by group, e.g. for a data frame
+
+        Each dict has the group fields, 'count' and the summed fields.
+
+        """
+        columns = [*self.by, "count", *self.sums]
+        return [
+            dict(zip(columns, (*key, *totals)))
+            for key, totals in sorted(
+                self.groups.items(),
+                key=lambda item: tuple((v is None, v or "") for v in item[0]),
+            )
+        ]
+
+
+def _aggregate_file(args) -> Aggregate:
+    """Aggregate records of one file; runs in a worker process"""
+    fname, by, sums, kwargs = args
+    return aggregate(fname, by, sums, **kwargs)
+
+
+def aggregate(
+    fname: Union[FileName, Iterable[FileName]],
+    by: Union[str, Sequence[str]],
+    sums: Iterable[str] = ("TC", "Z9"),
+    workers: Optional[int] = None,
+    **kwargs
+) -> Aggregate:
+    """Aggregate records of one or more WoS files (see :class:`Aggregate`)
+
+    Only the fields in `by` and `sums` are read.
+
+    :param fname: name(s) of the WoS export file(s)
+    :param by: field tag(s) to group by
+    :param sums: numeric field tags to sum within each group
+    :param int workers:
+        number of worker processes. If more than 1, files are aggregated
+        separately in parallel and the results are merged. Note that
+        ``dedupe`` then only drops duplicates within each file
+    :param kwargs: passed on to :func:`.read`, e.g. ``where`` or ``dedupe``
+    :return: :class:`Aggregate`
+
+    """
+    result = Aggregate(by, sums)
+    fields = {*result.by, *result.sums}
+    if workers is None or workers <= 1 or isinstance(fname, (str, pathlib.Path)):
+        # A single plain text file is still read in parallel chunks
+        return result.update(read(fname, workers=workers, fields=fields, **kwargs))
+
+    jobs = ((actual_fname, by, sums, kwargs) for actual_fname in fname)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in _imap_bounded(
+            executor, _aggregate_file, jobs, 2 * workers, ordered=False
+        ):
+            result.merge(partial)
+    return result
@@ -0,0 +1,232 @@
+import asyncio
+import pathlib
+import threading
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from .read import FileName, read
+from .record import LazyRecord, Record, records_from
+
+__all__ = ["aread", "arecords_from"]
+
+# Marks the end of the records of a file in a queue
+_DONE = object()
+
+
+class _Source:
+    """Synchronous record iterator that is advanced in an executor
+
+    A lock makes sure that the iterator is never advanced and closed at
+    the same time, e.g. when reading is cancelled while a batch is read.
+
+    """
+
+    def __init__(self, open_records: Callable[[], Iterator[Any]]) -> None:
+        self.open_records = open_records
+        self.records: Optional[Iterator[Any]] = None
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def next_batch(self, size: int) -> List[Any]:
+        with self.lock:
+            if self.closed:
+                return []
+            if self.records is None:
+                self.records = self.open_records()
+            return list(islice(self.records, size))
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+            if self.records is not None:
+                self.records.close()  # type: ignore
+
+
+async def _produce(
+    source: _Source,
+    queue: asyncio.Queue,
+    executor: Optional[Executor],
+    batch_size: int,
+) -> None:
+    """Put batches of `source` in `queue`, followed by `_DONE`
+
+    Errors are put in the queue as well, so the consumer raises them.
+
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            batch = await loop.run_in_executor(executor, source.next_batch, batch_size)
+            if not batch:
+                break
+            await queue.put(batch)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        await queue.put(e)
+    finally:
+        # Do not block the event loop if a batch is still being read
+        loop.run_in_executor(executor, source.close)
+    await queue.put(_DONE)
+
+
+async def _aiterate(
+    open_records: List[Callable[[], Iterator[Any]]],
+    executor: Optional[Executor],
+    prefetch: int,
+    batch_size: int,
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[Any]:
+    """Yield the records of each of `open_records`, read in `executor`
+
+    At most `concurrency` files are read at the same time; the next file
+    is started when the consumer has reached the end of a file.
+
+    """
+    if ordered:
+        queues = [asyncio.Queue(prefetch) for _ in open_records]
+    else:
+        queues = [asyncio.Queue(prefetch * concurrency)] * len(open_records)
+    jobs = iter(zip(open_records, queues))
+    tasks: List[asyncio.Future] = []
+
+    def start_next() -> None:
+        job = next(jobs, None)
+        if job is not None:
+            source = _Source(job[0])
+            task = _produce(source, job[1], executor, batch_size)
+            tasks.append(asyncio.ensure_future(task))
+
+    try:
+        for _ in range(concurrency):
+            start_next()
+        remaining = len(open_records)
+        queue_iter = iter(queues)
+        queue = next(queue_iter, None)
+        while remaining:
+            item = await queue.get()  # type: ignore
+            if item is _DONE:
+                remaining -= 1
+                start_next()
+                if ordered:
+                    queue = next(queue_iter, None)
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                for record in item:
+                    yield record
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _openers(
+    fname: Union[FileName, Iterable[FileName]],
+    concurrency: int,
+    func: Callable[..., Iterator[Any]],
+    **kwargs
+) -> List[Callable[[], Iterator[Any]]]:
+    """Get functions that open a record iterator per file (or for all files)
+
+    A checkpoint in ``resume_from`` refers to all files, so it is only passed
+    on for the file it is in; earlier files are left out.
+
+    """
+    if isinstance(fname, (str, pathlib.Path)) or concurrency <= 1:
+        return [partial(func, fname, **kwargs)]
+    fnames = list(fname)
+    resume_from = kwargs.pop("resume_from", None)
+    if resume_from is None:
+        return [partial(func, actual_fname, **kwargs) for actual_fname in fnames]
+    fnames = fnames[resume_from.file :]
+    if not fnames:
+        return []
+    return [
+        partial(func, fnames[0], resume_from=resume_from._replace(file=0), **kwargs),
+        *(partial(func, actual_fname, **kwargs) for actual_fname in fnames[1:]),
+    ]
+
+
+def aread(
+    fname: Union[FileName, Iterable[FileName]],
+    executor: Optional[Executor] = None,
+    prefetch: int = 4,
+    batch_size: int = 1000,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs
+) -> AsyncIterator[Dict[str, str]]:
+    """Read WoS export file(s) without blocking the event loop
+
+    Asynchronous variant of :func:`.read`. Files are opened and parsed in
+    `executor`, in batches of `batch_size` records. At most `prefetch`
+    batches per file are read ahead; reading pauses until the consumer has
+    caught up. Stop reading early with ``aclose()`` on the iterator (or
+    cancel the task that reads it): batches that are being read are
+    finished in the background, and files are then closed.
+
+    :param fname: name(s) of the WoS export file(s)
+    :type fname: str or iterable of strings
+    :param executor:
+        executor that reads and parses the files. It must run functions in
+        threads of this process. If None, the event loop's default executor
+        is used. Use ``workers`` to parse in separate processes as well
+    :param int prefetch: maximum number of batches read ahead per file
+    :param int batch_size: number of records read per call in `executor`
+    :param int concurrency:
+        number of files that are read at the same time. Note that
+        ``dedupe`` then only drops duplicates within each file
+    :param bool ordered:
+        only relevant if `concurrency` > 1. If True, records are yielded in
+        the same order as :func:`.read`; if False, batches of each file are
+        yielded as soon as they have been read
+    :param kwargs: passed on to :func:`.read`, e.g. ``fields`` or ``workers``
+    :return: asynchronous iterator over records in `fname`
+
+    """
+    openers = _openers(fname, concurrency, read, **kwargs)
+    return _aiterate(openers, executor, prefetch, batch_size, concurrency, ordered)
+
+
+def arecords_from(
+    fname: Union[FileName, Iterable[FileName]],
+    skip_empty: bool = True,
+    lazy: bool = False,
+    executor: Optional[Executor] = None,
+    prefetch: int = 4,
+    batch_size: int = 1000,
+    concurrency: int = 1,
+    ordered: bool = True,
+    **kwargs
+) -> AsyncIterator[Union[Record, LazyRecord]]:
+    """Get records from WoS file(s) without blocking the event loop
+
+    Asynchronous variant of :func:`.records_from`. Records are parsed in
+    `executor` as well. See :func:`aread` for the other parameters.
+
+    :param fname: WoS file name(s)
+    :type fname: str or list of strings
+    :param bool skip_empty: whether or not to skip empty fields
+    :param bool lazy: whether to get :class:`.LazyRecord` objects instead
+    :param kwargs: passed on to :func:`.records_from`, e.g. ``pool``
+    :return: asynchronous iterator over parsed records in `fname`
+
+    """
+    openers = _openers(
+        fname, concurrency, records_from, skip_empty=skip_empty, lazy=lazy, **kwargs
+    )
+    return _aiterate(openers, executor, prefetch, batch_size, concurrency, ordered)
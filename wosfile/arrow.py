@@ -0,0 +1,141 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+from .read import FileName
+from .record import field_items, to_int
+from .tags import is_splittable, numeric_tags, tags
+
+__all__ = ["write_arrow", "write_parquet"]
+
+DEFAULT_BATCH_SIZE = 10000
+
+WosRecord = Mapping[str, Union[str, List[str]]]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Writing Parquet or Arrow files requires pyarrow. "
+            "Install it with: pip install wosfile[arrow]"
+        ) from None
+    return pyarrow
+
+
+def schema(fields: Optional[Iterable[str]] = None):
+    """Get Arrow schema for WoS records
+
+    Splittable fields are lists of strings, numeric fields are 64-bit integers
+    and all other fields are strings.
+
+    :param fields: field tags to include. If None, all known tags are included
+    :return: :class:`pyarrow.Schema`
+
+    """
+    pa = _import_pyarrow()
+    if fields is None:
+        fields = sorted({abbr for abbr, *_ in tags})
+
+    def field_type(tag: str):
+        if tag in numeric_tags:
+            return pa.int64()
+        if is_splittable.get(tag, False):
+            return pa.list_(pa.string())
+        return pa.string()
+
+    return pa.schema([(tag, field_type(tag)) for tag in fields])
+
+
+def _columns(records: List[WosRecord], fields: Iterable[str]) -> Dict[str, List[Any]]:
+    """Convert `records` to a field tag -> list of values dict
+
+    Both raw records (as returned by :func:`wosfile.read`) and parsed records
+    (:class:`wosfile.Record`) are accepted. Missing and empty values are
+    None; numeric values that cannot be converted to integers as well.
+
+    """
+    columns = {}
+    for tag in fields:
+        values = [record.get(tag) or None for record in records]
+        if tag in numeric_tags:
+            values = [to_int(value) for value in values]
+        elif is_splittable.get(tag, False):
+            values = [field_items(tag, value) or None for value in values]
+        columns[tag] = values
+    return columns
+
+
+def _batches(
+    records: Iterable[WosRecord], fields: List[str], batch_size: int
+) -> Iterator[Dict[str, List[Any]]]:
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return
+        yield _columns(batch, fields)
+
+
+def _write(writer, records, schema, batch_size: int) -> int:
+    pa = _import_pyarrow()
+    n = 0
+    for columns in _batches(records, schema.names, batch_size):
+        batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+        writer.write_batch(batch)
+        n += batch.num_rows
+    return n
+
+
+def write_parquet(
+    records: Iterable[WosRecord],
+    fname: FileName,
+    fields: Optional[Iterable[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **kwargs
+) -> int:
+    """Write `records` to Parquet file `fname`
+
+    Records are converted and written in batches of `batch_size`, so memory
+    use does not depend on the number of records.
+
+    :param records: WoS records, e.g. from :func:`wosfile.records_from`
+    :param fname: name of Parquet file
+    :param fields: field tags to write. If None, all known tags are written
+    :param int batch_size: number of records per batch (row group)
+    :param kwargs: passed on to :class:`pyarrow.parquet.ParquetWriter`
+    :return: number of records written
+
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    record_schema = schema(fields)
+    with pq.ParquetWriter(str(fname), record_schema, **kwargs) as writer:
+        return _write(writer, records, record_schema, batch_size)
+
+
+def write_arrow(
+    records: Iterable[WosRecord],
+    fname: FileName,
+    fields: Optional[Iterable[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Write `records` to Arrow IPC (Feather v2) file `fname`
+
+    Records are converted and written in batches of `batch_size`, so memory
+    use does not depend on the number of records.
+
+    :param records: WoS records, e.g. from :func:`wosfile.records_from`
+    :param fname: name of Arrow file
+    :param fields: field tags to write. If None, all known tags are written
+    :param int batch_size: number of records per batch
+    :return: number of records written
+
+    """
+    pa = _import_pyarrow()
+
+    record_schema = schema(fields)
+    with pa.OSFile(str(fname), "wb") as sink:
+        with pa.ipc.new_file(sink, record_schema) as writer:
+            return _write(writer, records, record_schema, batch_size)
@@ -0,0 +1,206 @@
+import hashlib
+import math
+import os
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Set, Tuple, Union
+
+__all__ = [
+    "BloomDeduplicator",
+    "Deduplicator",
+    "DiskDeduplicator",
+    "ExactDeduplicator",
+]
+
+
+class Deduplicator(ABC):
+    """Keep track of the record IDs (UT) seen while reading
+
+    Subclasses implement :meth:`add` to drop all but the first copy of a
+    record, and optionally :meth:`update` and :meth:`winner` to keep the copy
+    with the highest value of a field instead.
+
+    """
+
+    def __init__(self) -> None:
+        # Number of copies dropped
+        self.duplicates = 0
+
+    @abstractmethod
+    def add(self, key: str) -> bool:
+        """Add `key`; return True if it had not been seen before"""
+
+    def update(self, key: str, value: int, ordinal: int) -> None:
+        """Keep `ordinal` as the winning copy of `key` if `value` is highest"""
+        raise ValueError(
+            "{} can only keep the first copy of a record".format(type(self).__name__)
+        )
+
+    def winner(self, key: str) -> Optional[int]:
+        """Get ordinal of the winning copy of `key`"""
+        raise ValueError(
+            "{} can only keep the first copy of a record".format(type(self).__name__)
+        )
+
+    def close(self) -> None:
+        """Release resources held by the deduplicator"""
+
+
+class ExactDeduplicator(Deduplicator):
+    """Keep all record IDs in memory"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: Set[str] = set()
+        self.best: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, key: str) -> bool:
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+    def update(self, key: str, value: int, ordinal: int) -> None:
+        best = self.best.get(key)
+        if best is None or value > best[0]:
+            self.best[key] = (value, ordinal)
+
+    def winner(self, key: str) -> Optional[int]:
+        best = self.best.get(key)
+        return None if best is None else best[1]
+
+    def close(self) -> None:
+        self.seen.clear()
+        self.best.clear()
+
+
+class BloomDeduplicator(Deduplicator):
+    def __init__(self, capacity: int = 10**7, error_rate: float = 0.001) -> None:
+        """Keep track of record IDs in a Bloom filter of fixed size
+
+        Memory use only depends on `capacity` and `error_rate`: about 1.8
+        bytes per record for the default error rate. The price is that a
+        small fraction of records (`error_rate`, as long as no more than
+        `capacity` distinct records are read) is wrongly dropped as a
+        duplicate.
+
+        :param int capacity: expected number of distinct records
+        :param float error_rate: fraction of records wrongly dropped
+
+        """
+        super().__init__()
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: str) -> bool:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        new = False
+        for i in range(self.hashes):
+            pos = (h1 + i * h2) % self.size
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                new = True
+        return new
+
+
+class DiskDeduplicator(Deduplicator):
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        cache_size: int = 64,
+        commit_every: int = 100000,
+    ) -> None:
+        """Keep track of record IDs in an on-disk SQLite database
+
+        Record IDs are committed every `commit_every` new IDs and when the
+        deduplicator is closed. A database at `path` can therefore be reused
+        to also drop records that were seen in an earlier run. This only
+        holds for the first copy of a record: the winning copies (see
+        :meth:`update`) are identified by their position in a single read,
+        so these are cleared when the database is opened.
+
+        :param str path:
+            database file. If None, a temporary file is used, which is removed
+            when the deduplicator is closed
+        :param int cache_size: maximum memory used for caching, in MB
+        :param int commit_every: number of new record IDs per transaction
+
+        """
+        super().__init__()
+        self.commit_every = commit_every
+        # Number of new record IDs since the last commit
+        self.pending = 0
+        self.temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".sqlite")
+            os.close(fd)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode = OFF")
+        self.db.execute("PRAGMA synchronous = OFF")
+        self.db.execute("PRAGMA cache_size = {}".format(-1024 * cache_size))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS best "
+            "(key TEXT PRIMARY KEY, value INTEGER, ordinal INTEGER) WITHOUT ROWID"
+        )
+        self.db.execute("DELETE FROM best")
+        self.db.commit()
+
+    def add(self, key: str) -> bool:
+        cursor = self.db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (key,))
+        if cursor.rowcount != 1:
+            return False
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.db.commit()
+            self.pending = 0
+        return True
+
+    def update(self, key: str, value: int, ordinal: int) -> None:
+        self.db.execute(
+            "INSERT INTO best VALUES (?, ?, ?) ON CONFLICT (key) DO UPDATE "
+            "SET value = excluded.value, ordinal = excluded.ordinal "
+            "WHERE excluded.value > best.value",
+            (key, value, ordinal),
+        )
+
+    def winner(self, key: str) -> Optional[int]:
+        row = self.db.execute(
+            "SELECT ordinal FROM best WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def close(self) -> None:
+        if not self.temporary:
+            self.db.commit()
+        self.db.close()
+        if self.temporary:
+            os.remove(self.path)
+
+
+deduplicators = {
+    "exact": ExactDeduplicator,
+    "bloom": BloomDeduplicator,
+    "disk": DiskDeduplicator,
+}
+
+
+def get_deduplicator(dedupe: Union[bool, str, Deduplicator]) -> Deduplicator:
+    """Get deduplicator for value `dedupe` of the dedupe argument of read"""
+    if isinstance(dedupe, Deduplicator):
+        return dedupe
+    if dedupe is True:
+        dedupe = "exact"
+    try:
+        return deduplicators[dedupe]()  # type: ignore
+    except KeyError:
+        raise ValueError("Unknown deduplication mode {!r}".format(dedupe))
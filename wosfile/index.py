@@ -0,0 +1,225 @@
+import io
+import itertools
+import json
+import logging
+import os
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from .read import (
+    FileName,
+    PlainTextReader,
+    ReadError,
+    Reader,
+    TabDelimitedReader,
+    _chunk_codec,
+    _iter_raw_lines,
+    _PlainTextChunkReader,
+    get_reader,
+    sniff_encoding,
+)
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["RecordIndex"]
+
+INDEX_SUFFIX = ".wosidx"
+INDEX_VERSION = 1
+
+readers: Dict[str, Type[Reader]] = {
+    "PlainTextReader": PlainTextReader,
+    "TabDelimitedReader": TabDelimitedReader,
+}
+
+
+class RecordIndex:
+    def __init__(
+        self,
+        fname: FileName,
+        encoding: str = None,
+        using: Optional[Type[Reader]] = None,
+        save: bool = True,
+    ) -> None:
+        """Create an index of the byte offsets of all records in `fname`
+
+        The index is stored next to `fname` (with extension ``.wosidx``) and
+        reused as long as the size and modification time of `fname` do not
+        change. Otherwise, it is rebuilt.
+
+        :param fname: name of the WoS export file
+        :param str encoding:
+            encoding of the file. If None, we try to automatically determine
+            the file's encoding
+        :param using:
+            class used for reading `fname`. If None, we try to automatically
+            find best reader
+        :param bool save: whether or not to store a newly built index on disk
+
+        """
+        self.fname = fname
+        self.index_fname = str(fname) + INDEX_SUFFIX
+        self.offsets: Dict[str, Tuple[int, int]] = {}
+        self._header: Optional[str] = None
+
+        if not self._load():
+            self._build(encoding, using)
+            if save:
+                self._save()
+
+    def _stat(self) -> Tuple[int, int]:
+        st = os.stat(self.fname)
+        return st.st_size, st.st_mtime_ns
+
+    def _load(self) -> bool:
+        """Load index from disk; return whether it is present and up to date"""
+        try:
+            with open(self.index_fname, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION or [
+            data.get("size"),
+            data.get("mtime"),
+        ] != list(self._stat()):
+            logger.info("Index %s is outdated", self.index_fname)
+            return False
+
+        self.encoding = data["encoding"]
+        self.codec = data["codec"]
+        self.reader_class = readers[data["reader"]]
+        self.offsets = {ut: tuple(pos) for ut, pos in data["offsets"].items()}
+        return True
+
+    def _save(self) -> None:
+        size, mtime = self._stat()
+        data = {
+            "version": INDEX_VERSION,
+            "size": size,
+            "mtime": mtime,
+            "encoding": self.encoding,
+            "codec": self.codec,
+            "reader": self.reader_class.__name__,
+            "offsets": self.offsets,
+        }
+        try:
+            with open(self.index_fname, "w", encoding="utf-8") as fh:
+                json.dump(data, fh)
+        except OSError:
+            logger.warning("Could not save index to %s", self.index_fname)
+
+    def _build(self, encoding: Optional[str], using: Optional[Type[Reader]]) -> None:
+        if encoding is None:
+            with open(self.fname, "rb") as fh_sniff:
+                encoding = sniff_encoding(fh_sniff)
+        if using is None:
+            with open(self.fname, encoding=encoding) as fh:
+                using = get_reader(fh)
+        if using not in readers.values():
+            raise ValueError("Cannot index files read with {}".format(using))
+
+        self.encoding = encoding
+        self.codec = _chunk_codec(self.fname, encoding)
+        self.reader_class = using
+
+        with open(self.fname, "rb") as fh:
+            # Skip BOM, if any
+            bom_length = len("\ufeff".encode(self.codec))
+            if fh.read(bom_length).decode(self.codec, "replace") != "\ufeff":
+                fh.seek(0)
+            lines = _iter_raw_lines(fh, self.codec)
+            if using is PlainTextReader:
+                self._build_plaintext(lines)
+            else:
+                self._build_tab_delimited(lines)
+
+    def _build_plaintext(self, lines: Iterator[Tuple[int, bytes]]) -> None:
+        start = None
+        ut = None
+        for offset, raw_line in lines:
+            line = raw_line.decode(self.codec).rstrip("\r\n")
+            if not line or start is None and line.startswith(("FN", "VR")):
+                # Skip empty lines and file header
+                continue
+            if line.startswith("EF"):
+                break
+            if start is None:
+                start = offset
+            if line.startswith("UT "):
+                ut = line[3:].strip()
+            elif line.startswith("ER"):
+                if ut is not None:
+                    self.offsets.setdefault(ut, (start, offset + len(raw_line) - start))
+                start = ut = None
+
+    def _build_tab_delimited(self, lines: Iterator[Tuple[int, bytes]]) -> None:
+        try:
+            _, header = next(lines)
+        except StopIteration:
+            raise ReadError("Cannot index empty file {}".format(self.fname))
+        try:
+            column = header.decode(self.codec).rstrip("\r\n").split("\t").index("UT")
+        except ValueError:
+            raise ReadError("File {} has no UT column".format(self.fname))
+
+        for offset, raw_line in lines:
+            values = raw_line.decode(self.codec).rstrip("\r\n").split("\t")
+            if len(values) > column and values[column]:
+                self.offsets.setdefault(values[column], (offset, len(raw_line)))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __contains__(self, ut: object) -> bool:
+        return ut in self.offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.offsets)
+
+    @property
+    def header(self) -> str:
+        """Header line of a tab-delimited file"""
+        if self._header is None:
+            with open(self.fname, encoding=self.encoding) as fh:
+                self._header = fh.readline()
+        return self._header
+
+    def _parse(self, data: bytes) -> Dict[str, str]:
+        fh = io.TextIOWrapper(io.BytesIO(data), encoding=self.codec)
+        if self.reader_class is PlainTextReader:
+            reader: Reader = _PlainTextChunkReader(fh)
+            reader.last_chunk = False  # type: ignore
+        else:
+            reader = TabDelimitedReader(itertools.chain([self.header], fh))
+        return next(reader)
+
+    def get(self, ut: str) -> Dict[str, str]:
+        """Get record with WoS ID `ut`
+
+        :raises KeyError: if there is no such record in the file
+
+        """
+        return next(self.get_many([ut]))
+
+    def get_many(self, uts: Iterable[str]) -> Iterator[Dict[str, str]]:
+        """Get records with WoS IDs `uts`, in the same order
+
+        :raises KeyError: if one of `uts` does not occur in the file
+
+        """
+        with open(self.fname, "rb") as fh:
+            for ut in uts:
+                offset, length = self.offsets[ut]
+                fh.seek(offset)
+                yield self._parse(fh.read(length))
+
+    def sample(
+        self, k: int, rng: Optional[random.Random] = None
+    ) -> List[Dict[str, str]]:
+        """Get `k` records sampled at random without replacement
+
+        :param int k: sample size
+        :param rng: random number generator, e.g. to get a reproducible sample
+
+        """
+        rng = rng or random.Random()
+        return list(self.get_many(rng.sample(list(self.offsets), k)))
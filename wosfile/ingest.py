@@ -0,0 +1,240 @@
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import pickle
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from .read import FileName, Reader, Where, read
+from .record import LazyRecord, Record
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ParseCache", "ingest"]
+
+MANIFEST_NAME = "manifest.json"
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = ".wosfile-cache"
+
+
+def _file_hash(fname: FileName) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(fname, "rb") as fh:
+        for block in iter(lambda: fh.read(2**20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(fname: pathlib.Path, data: bytes) -> None:
+    """Write `data` to `fname` such that readers never see a partial file"""
+    tmp_fname = fname.with_name(fname.name + ".tmp")
+    with open(tmp_fname, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp_fname, fname)
+
+
+def _select(
+    records: List[Dict[str, str]],
+    fields: Optional[Iterable[str]],
+    where: Optional[Where],
+) -> Iterator[Dict[str, str]]:
+    """Apply `fields` and `where` (see :func:`.read`) to cached `records`"""
+    fields = frozenset(fields) if fields is not None else None
+    for record in records:
+        if where is not None and not all(
+            record.get(tag) and predicate(record[tag])
+            for tag, predicate in where.items()
+        ):
+            continue
+        if fields is not None:
+            record = {tag: value for tag, value in record.items() if tag in fields}
+        yield record
+
+
+class ParseCache:
+    def __init__(self, cache_dir: FileName) -> None:
+        """Create a cache of parsed WoS export files in directory `cache_dir`
+
+        The cache keeps a manifest with the path, size, modification time and
+        content hash of each file read through it, and the parsed records of
+        each file in a binary file. Files whose size and modification time
+        did not change (or whose contents did not change) are loaded from the
+        cache; other files are parsed again.
+
+        :param cache_dir: directory for the manifest and cached records
+
+        """
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_fname = self.cache_dir / MANIFEST_NAME
+        # Absolute path -> size, mtime, content hash and names of cache files
+        self.manifest: Dict[str, Dict[str, Any]] = self._load_manifest()
+        # Number of files loaded from the cache and parsed, respectively
+        self.hits = 0
+        self.misses = 0
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_fname, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data["files"]
+
+    def save(self) -> None:
+        """Write the manifest to disk"""
+        data = {"version": CACHE_VERSION, "files": self.manifest}
+        _write_atomic(self.manifest_fname, json.dumps(data).encode("utf-8"))
+
+    def _entry_fname(
+        self, digest: str, using: Optional[Type[Reader]], encoding: Optional[str]
+    ) -> pathlib.Path:
+        """Get name of the cache file for a file with hash `digest`"""
+        options = "{}:{}:{}:{}".format(
+            CACHE_VERSION,
+            digest,
+            using.__name__ if using is not None else "",
+            encoding or "",
+        )
+        key = hashlib.blake2b(options.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / (key + ".pickle")
+
+    def _entry(self, fname: FileName) -> Dict[str, Any]:
+        """Get manifest entry of `fname`, updating it if the file changed"""
+        path = str(pathlib.Path(fname).resolve())
+        st = os.stat(fname)
+        entry = self.manifest.get(path)
+        if (
+            entry is not None
+            and entry["size"] == st.st_size
+            and entry["mtime"] == st.st_mtime_ns
+        ):
+            return entry
+
+        digest = _file_hash(fname)
+        if entry is None or entry["hash"] != digest:
+            entry = {"hash": digest, "cached": []}
+        entry.update(size=st.st_size, mtime=st.st_mtime_ns)
+        self.manifest[path] = entry
+        return entry
+
+    def _records(
+        self,
+        fname: FileName,
+        using: Optional[Type[Reader]],
+        encoding: Optional[str],
+    ) -> List[Dict[str, str]]:
+        """Get all records in `fname`, from the cache if possible"""
+        entry = self._entry(fname)
+        entry_fname = self._entry_fname(entry["hash"], using, encoding)
+        try:
+            with open(entry_fname, "rb") as fh:
+                records = pickle.load(fh)
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError):
+            logger.warning("Ignoring corrupt cache file %s", entry_fname)
+        else:
+            self.hits += 1
+            return records
+
+        self.misses += 1
+        records = list(read(fname, using, encoding))
+        _write_atomic(entry_fname, pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+        if entry_fname.name not in entry["cached"]:
+            entry["cached"].append(entry_fname.name)
+        return records
+
+    def read(
+        self,
+        fname: Union[FileName, Iterable[FileName]],
+        using: Optional[Type[Reader]] = None,
+        encoding: str = None,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Where] = None,
+    ) -> Iterator[Dict[str, str]]:
+        """Read WoS export file(s) through the cache
+
+        Gives the same records as :func:`.read`. Each file is parsed (or
+        loaded) as a whole and the manifest is saved when iteration stops.
+
+        :param fname: name(s) of the WoS export file(s)
+        :param using: see :func:`.read`
+        :param str encoding: see :func:`.read`
+        :param fields: field tags to return (see :class:`.PlainTextReader`)
+        :param where: filter on field values (see :class:`.PlainTextReader`)
+        :return: iterator over records in `fname`
+
+        """
+        fnames = [fname] if isinstance(fname, (str, pathlib.Path)) else fname
+        try:
+            for actual_fname in fnames:
+                records = self._records(actual_fname, using, encoding)
+                yield from _select(records, fields, where)
+        finally:
+            self.save()
+
+    def records(
+        self,
+        fname: Union[FileName, Iterable[FileName]],
+        skip_empty: bool = True,
+        lazy: bool = False,
+        **kwargs
+    ) -> Iterator[Union[Record, LazyRecord]]:
+        """Get records from WoS file(s) through the cache
+
+        Like :func:`.records_from`; `kwargs` are passed on to :meth:`read`.
+
+        """
+        record_class = LazyRecord if lazy else Record
+        for wos_record in self.read(fname, **kwargs):
+            yield record_class(wos_record, skip_empty)
+
+    def prune(self) -> int:
+        """Forget files that no longer exist and remove unused cache files
+
+        :return: number of cache files removed
+
+        """
+        self.manifest = {
+            path: entry for path, entry in self.manifest.items() if os.path.exists(path)
+        }
+        self.save()
+
+        used = {name for entry in self.manifest.values() for name in entry["cached"]}
+        removed = 0
+        for entry_fname in self.cache_dir.glob("*.pickle"):
+            if entry_fname.name not in used:
+                entry_fname.unlink()
+                removed += 1
+        return removed
+
+
+def ingest(
+    directory: FileName,
+    pattern: str = "*.txt",
+    cache_dir: Optional[FileName] = None,
+    **kwargs
+) -> Iterator[Dict[str, str]]:
+    """Read all WoS export files in `directory`, using a :class:`ParseCache`
+
+    Files that were read before and did not change are loaded from the cache,
+    so that rereading a directory that only gains a few files is fast.
+
+    :param directory: directory with WoS export files
+    :param str pattern: glob pattern of the files to read, in sorted order
+    :param cache_dir:
+        directory of the cache. If None, a ``.wosfile-cache`` subdirectory of
+        `directory` is used
+    :param kwargs: passed on to :meth:`ParseCache.read`, e.g. ``fields``
+    :return: iterator over records in the files
+
+    """
+    directory = pathlib.Path(directory)
+    if cache_dir is None:
+        cache_dir = directory / DEFAULT_CACHE_DIR
+    fnames = sorted(path for path in directory.glob(pattern) if path.is_file())
+    yield from ParseCache(cache_dir).read(fnames, **kwargs)
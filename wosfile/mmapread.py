@@ -0,0 +1,187 @@
+import codecs
+import io
+import mmap
+import re
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple, Union
+
+from .read import (
+    _UNEXPECTED_EF_MSG,
+    ReadError,
+    Reader,
+    Where,
+    _encoding_from_prefix,
+    _unknown_tag_error,
+)
+from .tags import has_item_per_line
+
+__all__ = ["MmapPlainTextReader"]
+
+# Start of a field: tag at the start of a line, followed by whitespace. Starting
+# the pattern with a literal newline (rather than ^) makes searching much faster.
+_field_re = re.compile(rb"\n(\S+)[ \t]*")
+
+_separators = {True: b"; ", False: b" "}
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+class MmapPlainTextReader(Reader):
+    # Files are read as bytes
+    binary = True
+
+    def __init__(
+        self,
+        fh: BinaryIO,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Where] = None,
+        encoding: str = None,
+    ) -> None:
+        """Create a bytes-based reader for WoS plain text file `fh`
+
+        This reader gives the same results as :class:`.PlainTextReader`, but
+        works on the raw bytes of a memory-mapped file. Record and field
+        boundaries are found with fast searches in the buffer, and only the
+        values of fields that are returned are decoded. UTF-16 files are
+        transcoded to UTF-8 in one step before reading.
+
+        Use it with the :func:`.read` function as follows:
+        ``read(fname, using=MmapPlainTextReader)``.
+
+        :param fh: WoS plain text file, opened in binary mode(!)
+        :type fh: file object
+        :param fields: field tags to read (see :class:`.PlainTextReader`)
+        :param where: filter on field values (see :class:`.PlainTextReader`)
+        :param str encoding:
+            encoding of the file. If None, we try to automatically determine
+            the file's encoding
+
+        """
+        super().__init__(fh, fields, where)  # type: ignore
+        self.version = "1.0"  # Expected version of WoS plain text format
+        self.buffer, self.pos = self._get_buffer(fh, encoding)
+        self._tags: Dict[bytes, str] = {}
+        self._read_header()
+
+    @staticmethod
+    def _get_buffer(fh: BinaryIO, encoding: Optional[str]) -> Tuple[Buffer, int]:
+        """Get contents of `fh` as UTF-8 encoded buffer and start of its data"""
+        buffer: Buffer
+        # Compressed files have a fileno() too, but that of the compressed data
+        if isinstance(fh, io.BufferedReader) and isinstance(fh.raw, io.FileIO):
+            try:
+                buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Not a regular file, e.g. empty or a pipe
+                buffer = fh.read()
+        else:
+            buffer = fh.read()
+
+        if encoding is None:
+            encoding = _encoding_from_prefix(buffer[:10])
+        codec = codecs.lookup(encoding).name
+        if codec == "utf-8-sig" or codec == "utf-8":
+            # Skip BOM, if any
+            return buffer, 3 if buffer[:3] == codecs.BOM_UTF8 else 0
+        return buffer[:].decode(encoding).encode("utf-8"), 0
+
+    def _line_number(self, pos: int) -> int:
+        """Get line number of position `pos` in buffer"""
+        return self.buffer[:pos].count(b"\n") + 1
+
+    def _next_line_start(self, pos: int) -> int:
+        """Get position of start of line after the one at `pos`"""
+        end = self.buffer.find(b"\n", pos)
+        return len(self.buffer) if end < 0 else end + 1
+
+    def _skip_empty_lines(self, pos: int) -> int:
+        buffer = self.buffer
+        while buffer[pos : pos + 1] in (b"\n", b"\r"):
+            pos += 1
+        return pos
+
+    def _read_header(self) -> None:
+        """Read and check FN and VR lines at start of file"""
+        pos = self._skip_empty_lines(self.pos)
+        if self.buffer[pos : pos + 2] != b"FN":
+            raise ReadError("Unknown file format")
+
+        pos = self._skip_empty_lines(self._next_line_start(pos))
+        end = self._next_line_start(pos)
+        label, version = self.buffer[pos:end].decode("utf-8").split()
+        if label != "VR" or version != self.version:
+            raise ReadError(
+                "Unknown version: expected {} "
+                "but got {}".format(self.version, version)
+            )
+        self.pos = end
+
+    def _tag(self, raw: bytes) -> str:
+        try:
+            return self._tags[raw]
+        except KeyError:
+            tag = self._tags[raw] = raw.decode("utf-8")
+            return tag
+
+    def _value(self, tag: str, value: bytes) -> str:
+        """Decode raw `value` of field `tag`, joining multiple lines"""
+        try:
+            item_per_line = has_item_per_line[tag]
+        except KeyError:
+            raise _unknown_tag_error(tag)
+        if b"\n" not in value:
+            return value.rstrip(b"\r").decode("utf-8")
+
+        first, *rest = value.split(b"\n")
+        # Skip empty lines, like PlainTextReader does
+        values = [first.rstrip(b"\r")]
+        values.extend(line.strip() for line in rest if line and line != b"\r")
+        return _separators[item_per_line].join(values).decode("utf-8")
+
+    def __next__(self) -> Dict[str, str]:
+        buffer = self.buffer
+        size = len(buffer)
+        fields = self.fields
+        where = self.where
+        tags = self._tags
+
+        while True:
+            pos = self._skip_empty_lines(self.pos)
+            if pos >= size:
+                raise ReadError("Encountered EOF before 'EF' marker")
+            if buffer[pos : pos + 2] == b"EF":
+                raise StopIteration
+            if buffer[pos : pos + 2] == b"ER":  # Empty record
+                self.pos = self._next_line_start(pos)
+                return {}
+
+            end = buffer.find(b"\nER", pos)
+            ef = buffer.find(b"\nEF", pos, size if end < 0 else end)
+            if ef >= 0:
+                raise ReadError(_UNEXPECTED_EF_MSG.format(self._line_number(ef + 1)))
+            if end < 0:
+                raise ReadError("Encountered EOF before 'EF' marker")
+            self.pos = self._next_line_start(end + 1)
+
+            record = {}
+            # Records always start right after a newline
+            matches = list(_field_re.finditer(buffer, pos - 1, end + 1))
+            value_ends = [match.start() for match in matches[1:]]
+            value_ends.append(end)
+            for match, value_end in zip(matches, value_ends):
+                raw_tag = match.group(1)
+                tag = tags.get(raw_tag) or self._tag(raw_tag)
+                if fields is not None and tag not in fields:
+                    if where is None or tag not in where:
+                        continue
+                record[tag] = self._value(tag, buffer[match.end() : value_end])
+
+            if where is not None:
+                if not all(
+                    tag in record and predicate(record[tag])
+                    for tag, predicate in where.items()
+                ):
+                    self.skipped += 1
+                    continue
+                if fields is not None:
+                    record = {tag: v for tag, v in record.items() if tag in fields}
+            return record
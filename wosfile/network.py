@@ -0,0 +1,391 @@
+import hashlib
+from array import array
+from itertools import combinations
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .address import countries
+from .record import field_items
+from .references import ReferenceParser
+
+__all__ = [
+    "CitationGraph",
+    "CollaborationMatrix",
+    "citation_graph",
+    "coauthorship",
+    "country_collaboration",
+]
+
+# Fields needed to build a citation graph, e.g. for ``read(fname, fields=...)``
+CITATION_FIELDS = ("AU", "BP", "CR", "DI", "PY", "UT", "VL")
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Citation graphs, co-occurrence matrices and record tables require "
+            "numpy. "
+            "Install it with: pip install wosfile[numpy]"
+        ) from None
+    return numpy
+
+
+def _hash(key: str) -> int:
+    """Get 64-bit hash of `key`; 0 is reserved for missing keys"""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def _normalise(value: Optional[str]) -> str:
+    return "".join(char for char in value.upper() if char.isalnum()) if value else ""
+
+
+def _bibliographic_key(
+    author: Optional[str],
+    year: Optional[str],
+    volume: Optional[str],
+    page: Optional[str],
+) -> int:
+    """Get hashed key of first author, year, volume and page
+
+    The source is left out, since cited references and records abbreviate
+    it differently. Without volume and page the key is too ambiguous to be
+    of use, so 0 is returned.
+
+    """
+    if not author or not year or not (volume or page):
+        return 0
+    return _hash(
+        "|".join((_normalise(author), str(year), _normalise(volume), _normalise(page)))
+    )
+
+
+def _doi_key(doi: Optional[str]) -> int:
+    return _hash(doi.strip().lower()) if doi else 0
+
+
+def _first(value: Any) -> Optional[str]:
+    """Get first item of a parsed or raw splittable field"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value.split(";", 1)[0].strip()
+    return value[0]
+
+
+class CitationGraph:
+    def __init__(self, ids: List[Optional[str]], indptr, indices, unresolved) -> None:
+        """Citation graph of a set of records in compressed sparse row format
+
+        Node ``i`` is the ``i``-th record, with UT ``ids[i]``. The nodes cited
+        by node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``, in increasing
+        order. ``unresolved[i]`` is the number of references of node ``i``
+        that do not match a record.
+
+        """
+        self.ids = ids
+        self.indptr = indptr
+        self.indices = indices
+        self.unresolved = unresolved
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+
+    @property
+    def n_unresolved(self) -> int:
+        """Total number of references that do not match a record"""
+        return int(self.unresolved.sum())
+
+    def cited(self, node: int):
+        """Get nodes cited by `node`"""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def edges(self) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+        """Get (citing UT, cited UT) pairs, e.g. to build a networkx graph"""
+        ids = self.ids
+        for node in range(len(ids)):
+            for cited in self.cited(node).tolist():
+                yield ids[node], ids[cited]
+
+
+def _lookup(np, keys, nodes, query):
+    """Get node with key `query` for each query, or -1 if there is none"""
+    keys, first = np.unique(keys, return_index=True)
+    nodes = nodes[first]
+    found = np.full(len(query), -1, dtype=np.int64)
+    if len(keys):
+        pos = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+        match = (keys[pos] == query) & (query != 0)
+        found[match] = nodes[pos[match]]
+    return found
+
+
+def citation_graph(
+    records: Iterable[Mapping[str, Any]], parser: Optional[ReferenceParser] = None
+) -> CitationGraph:
+    """Build the citation graph between `records`
+
+    Each cited reference (CR) is matched to a record by DOI (DI) or, failing
+    that, by first author, year, volume and page. Keys are hashed, and
+    records are processed in a single streaming pass that only keeps compact
+    arrays of keys; references are resolved in bulk at the end. This
+    requires numpy.
+
+    :param records:
+        parsed or raw records, e.g. from
+        ``read(fname, fields=CITATION_FIELDS)``
+    :param parser: parser for cited references (see :class:`.ReferenceParser`)
+    :return: :class:`CitationGraph`
+
+    """
+    np = _import_numpy()
+    parse_field = (parser or ReferenceParser()).parse_field
+
+    ids: List[Optional[str]] = []
+    # Hashed keys of each record
+    record_doi, record_key = array("Q"), array("Q")
+    # Citing node and hashed keys of each reference
+    citing, cited_doi, cited_key = array("q"), array("Q"), array("Q")
+
+    for node, record in enumerate(records):
+        ids.append(record.get("UT"))
+        record_doi.append(_doi_key(record.get("DI")))
+        record_key.append(
+            _bibliographic_key(
+                _first(record.get("AU")),
+                record.get("PY"),
+                record.get("VL"),
+                record.get("BP"),
+            )
+        )
+        for reference in parse_field(record.get("CR")):
+            citing.append(node)
+            cited_doi.append(_doi_key(reference.doi))
+            cited_key.append(
+                _bibliographic_key(
+                    reference.author, reference.year, reference.volume, reference.page
+                )
+            )
+
+    n = len(ids)
+    nodes = np.arange(n, dtype=np.int64)
+    citing = np.frombuffer(citing, dtype=np.int64)
+    cited = _lookup(
+        np,
+        np.frombuffer(record_doi, np.uint64),
+        nodes,
+        np.frombuffer(cited_doi, np.uint64),
+    )
+    missing = cited < 0
+    cited[missing] = _lookup(
+        np,
+        np.frombuffer(record_key, np.uint64),
+        nodes,
+        np.frombuffer(cited_key, np.uint64)[missing],
+    )
+
+    resolved = cited >= 0
+    unresolved = np.bincount(citing[~resolved], minlength=n).astype(np.int32)
+    # Sort edges by citing node, then cited node, and drop repeated edges
+    edges = np.unique(citing[resolved] * max(n, 1) + cited[resolved])
+    sources = edges // max(n, 1)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    indices = (edges % max(n, 1)).astype(np.int32)
+    return CitationGraph(ids, indptr, indices, unresolved)
+
+
+class CollaborationMatrix:
+    def __init__(self, counting: str = "full", buffer_size: int = 2**20) -> None:
+        """Accumulate how often entities (authors, countries, ...) occur together
+
+        Each entity gets an integer id, in order of first occurrence, and
+        ``labels[i]`` is the entity with id ``i``. Pair counts are appended
+        to array-backed buffers, which are summed into a sparse matrix in
+        coordinate (COO) format whenever they hold `buffer_size` pairs. Only
+        pairs ``(i, j)`` with ``i < j`` are stored. Requires numpy.
+
+        With full counting, each record adds 1 to each pair of its entities.
+        With fractional counting, a record with n entities adds 1 / (n - 1),
+        so that each entity's links from a record sum to 1.
+
+        :param str counting: 'full' or 'fractional'
+        :param int buffer_size: number of pairs to collect before summing
+
+        """
+        if counting not in ("full", "fractional"):
+            raise ValueError("Unknown counting method {!r}".format(counting))
+        self.np = _import_numpy()
+        self.counting = counting
+        self.buffer_size = buffer_size
+        self.labels: List[str] = []
+        self.ids: Dict[str, int] = {}
+        # Number of records per entity (weighted by 1 / n if fractional)
+        self._counts = array("d")
+        # Pairs that have not been summed yet
+        self._rows, self._cols, self._weights = array("i"), array("i"), array("d")
+        # Summed pairs, sorted by row and column
+        self.rows = self.np.zeros(0, dtype=self.np.int32)
+        self.cols = self.np.zeros(0, dtype=self.np.int32)
+        self.data = self.np.zeros(0, dtype=self.np.float64)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        self.compact()
+        state = self.__dict__.copy()
+        del state["np"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.np = _import_numpy()
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def _id(self, entity: str) -> int:
+        try:
+            return self.ids[entity]
+        except KeyError:
+            i = self.ids[entity] = len(self.labels)
+            self.labels.append(entity)
+            self._counts.append(0.0)
+            return i
+
+    def add(self, entities: Iterable[str]) -> None:
+        """Add the entities of a single record; repeated entities count once"""
+        ids = sorted({self._id(entity) for entity in entities})
+        n = len(ids)
+        if not n:
+            return
+        weight = 1.0 if self.counting == "full" else 1.0 / n
+        for i in ids:
+            self._counts[i] += weight
+        if n < 2:
+            return
+
+        weight = 1.0 if self.counting == "full" else 1.0 / (n - 1)
+        for i, j in combinations(ids, 2):
+            self._rows.append(i)
+            self._cols.append(j)
+        self._weights.extend([weight] * (n * (n - 1) // 2))
+        if len(self._rows) >= self.buffer_size:
+            self.compact()
+
+    def _add_pairs(self, rows, cols, weights) -> None:
+        """Sum pairs into the summed matrix"""
+        np = self.np
+        keys = np.concatenate(
+            (
+                self.rows.astype(np.int64) << 32 | self.cols,
+                rows.astype(np.int64) << 32 | cols,
+            )
+        )
+        keys, inverse = np.unique(keys, return_inverse=True)
+        self.data = np.bincount(
+            inverse, np.concatenate((self.data, weights)), minlength=len(keys)
+        )
+        self.rows = (keys >> 32).astype(np.int32)
+        self.cols = (keys & 0xFFFFFFFF).astype(np.int32)
+
+    def compact(self) -> None:
+        """Sum the pairs collected so far into the sparse matrix"""
+        if not len(self._rows):
+            return
+        np = self.np
+        self._add_pairs(
+            np.frombuffer(self._rows, dtype=np.int32),
+            np.frombuffer(self._cols, dtype=np.int32),
+            np.frombuffer(self._weights, dtype=np.float64),
+        )
+        self._rows, self._cols, self._weights = array("i"), array("i"), array("d")
+
+    def merge(self, other: "CollaborationMatrix") -> None:
+        """Add counts of `other`, e.g. built from other files or in a worker"""
+        if other.counting != self.counting:
+            raise ValueError("Cannot merge matrices with different counting methods")
+        np = self.np
+        other.compact()
+        self.compact()
+        mapping = np.array([self._id(label) for label in other.labels], dtype=np.int32)
+        counts = np.frombuffer(self._counts, dtype=np.float64)
+        counts[mapping] += np.frombuffer(other._counts, dtype=np.float64)
+        rows, cols = mapping[other.rows], mapping[other.cols]
+        # Keep row < column after renumbering
+        self._add_pairs(np.minimum(rows, cols), np.maximum(rows, cols), other.data)
+
+    @property
+    def counts(self):
+        """Number of records per entity (fractional if counting is fractional)"""
+        return self.np.array(self._counts, dtype=self.np.float64)
+
+    def to_coo(self) -> Tuple[Any, Any, Any]:
+        """Get (rows, cols, data) arrays of all pairs with row < column"""
+        self.compact()
+        return self.rows, self.cols, self.data
+
+    def to_scipy(self):
+        """Get the symmetric matrix as a :class:`scipy.sparse.coo_matrix`
+
+        The diagonal holds :attr:`counts`. Requires scipy.
+
+        """
+        from scipy.sparse import coo_matrix
+
+        np = self.np
+        rows, cols, data = self.to_coo()
+        diagonal = np.arange(len(self), dtype=np.int32)
+        return coo_matrix(
+            (
+                np.concatenate((data, data, self.counts)),
+                (
+                    np.concatenate((rows, cols, diagonal)),
+                    np.concatenate((cols, rows, diagonal)),
+                ),
+            ),
+            shape=(len(self), len(self)),
+        )
+
+    def pairs(self) -> Iterator[Tuple[str, str, float]]:
+        """Get (entity, entity, weight) triples, e.g. to build a networkx graph"""
+        labels = self.labels
+        rows, cols, data = self.to_coo()
+        for i, j, weight in zip(rows.tolist(), cols.tolist(), data.tolist()):
+            yield labels[i], labels[j], weight
+
+
+def coauthorship(
+    records: Iterable[Mapping[str, Any]], field: str = "AU", **kwargs
+) -> CollaborationMatrix:
+    """Count how often authors publish together
+
+    :param records: parsed or raw records, e.g. from :func:`.records_from`
+    :param str field: author field to use, e.g. 'AU' or 'AF'
+    :param kwargs: passed on to :class:`CollaborationMatrix`, e.g. ``counting``
+
+    """
+    matrix = CollaborationMatrix(**kwargs)
+    for record in records:
+        matrix.add(field_items(field, record.get(field)))
+    matrix.compact()
+    return matrix
+
+
+def country_collaboration(
+    records: Iterable[Mapping[str, Any]], **kwargs
+) -> CollaborationMatrix:
+    """Count how often countries occur together in the addresses (C1)
+
+    :param records: parsed or raw records, e.g. from :func:`.records_from`
+    :param kwargs: passed on to :class:`CollaborationMatrix`, e.g. ``counting``
+
+    """
+    matrix = CollaborationMatrix(**kwargs)
+    for record in records:
+        matrix.add(countries(record.get("C1")))
+    matrix.compact()
+    return matrix
@@ -0,0 +1,133 @@
+import sys
+from typing import Dict, Iterable, List, MutableMapping, NamedTuple, Optional, TypeVar
+
+from .tags import is_splittable
+
+__all__ = ["PoolStats", "StringPool"]
+
+# Fields whose values (or items) typically repeat across many records
+INTERNED_FIELDS = frozenset(
+    (
+        "AF",
+        "AU",
+        "C3",
+        "CR",
+        "DE",
+        "DT",
+        "ID",
+        "J9",
+        "JI",
+        "LA",
+        "PA",
+        "PI",
+        "PT",
+        "PU",
+        "PY",
+        "SC",
+        "SN",
+        "SO",
+        "WC",
+        "WE",
+    )
+)
+
+R = TypeVar("R", bound=MutableMapping)
+
+
+class PoolStats(NamedTuple):
+    """Statistics of a :class:`StringPool`"""
+
+    # Number of distinct values in the pool
+    size: int
+    # Number of values looked up
+    lookups: int
+    # Number of lookups that returned a value already in the pool
+    hits: int
+    # Approximate number of bytes saved by returning pooled values
+    saved_bytes: int
+
+
+class StringPool:
+    def __init__(
+        self,
+        fields: Optional[Iterable[str]] = INTERNED_FIELDS,
+        max_size: Optional[int] = None,
+    ) -> None:
+        """Create a pool that deduplicates repeated field values across records
+
+        Each distinct value is stored once and gets an integer code, so the
+        pool can be used both to share strings between records and to
+        dictionary-encode values.
+
+        :param fields:
+            field tags whose values are pooled. If None, all fields are pooled
+        :param int max_size:
+            maximum number of distinct values in the pool. Once the pool is
+            full, new values are returned as is. If None, the pool is unbounded
+
+        """
+        self.fields = frozenset(fields) if fields is not None else None
+        self.max_size = max_size
+        # Value -> code, and code -> value
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+        self.lookups = 0
+        self.hits = 0
+        self.saved_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.codes
+
+    def code(self, value: str) -> Optional[int]:
+        """Get code of `value`, adding it to the pool if necessary
+
+        :return: code of `value`, or None if it is new and the pool is full
+
+        """
+        self.lookups += 1
+        try:
+            code = self.codes[value]
+        except KeyError:
+            if self.max_size is not None and len(self.values) >= self.max_size:
+                return None
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+            return code
+        if self.values[code] is not value:
+            self.hits += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return code
+
+    def intern(self, value: str) -> str:
+        """Get the pooled copy of `value`"""
+        code = self.code(value)
+        return value if code is None else self.values[code]
+
+    def intern_record(self, record: R) -> R:
+        """Replace values of pooled fields in `record` by their pooled copies
+
+        Fields with a list of values (as in :class:`.Record`, or the columns
+        of :func:`.read_batches`) have each item pooled. Raw values of
+        splittable fields (e.g. AU or CR in records from :func:`.read`) are
+        not pooled: they are nearly unique per record, so pooling them would
+        only keep them alive. `record` is changed in place and returned.
+
+        """
+        intern = self.intern
+        fields = self.fields
+        for tag, value in record.items():
+            if fields is not None and tag not in fields or not value:
+                continue
+            if isinstance(value, str):
+                if not is_splittable.get(tag, False):
+                    record[tag] = intern(value)
+            else:
+                record[tag] = [item and intern(item) for item in value]
+        return record
+
+    def stats(self) -> PoolStats:
+        """Get statistics of the pool"""
+        return PoolStats(len(self.values), self.lookups, self.hits, self.saved_bytes)
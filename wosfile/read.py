@@ -1,41 +1,136 @@
+import bz2
 import codecs
+import gzip
+import io
 import logging
+import lzma
+import os
 import pathlib
-from csv import DictReader
+import zipfile
+from collections import deque
+from functools import partial
+from itertools import chain, islice
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from csv import DictReader, reader as csv_reader
 from typing import (
+    Any,
     AnyStr,
     BinaryIO,
+    Callable,
+    Deque,
     Dict,
     IO,
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     TextIO,
+    Tuple,
     Type,
     Union,
 )
 
-from .tags import has_item_per_line
+from .dedupe import Deduplicator, get_deduplicator
+from .pool import StringPool
+from .stats import ReadStats, _TimedIterator, _TimedStream
+from .tags import has_item_per_line, is_splittable
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["get_reader", "read", "PlainTextReader", "ReadError", "TabDelimitedReader"]
+__all__ = [
+    "Checkpoint",
+    "get_reader",
+    "read",
+    "read_batches",
+    "read_with_checkpoints",
+    "PlainTextReader",
+    "ReadError",
+    "TabDelimitedReader",
+]
 
 FileName = Union[str, pathlib.Path]
+Where = Dict[str, Callable[[str], bool]]
+Columns = Dict[str, List[Optional[str]]]
 
 
 class ReadError(Exception):
     pass
 
 
+class Checkpoint(NamedTuple):
+    """Position right after a record, from which reading can be resumed"""
+
+    # Name of the file
+    fname: str
+    # Index of the file among the files that are read
+    file: int
+    # Index of the stream in the file (only nonzero for zip archives)
+    member: int
+    # Byte offset in the (decompressed) stream
+    offset: int
+    # Number of records read up to and including this one
+    ordinal: int
+
+
 class Reader:
-    def __init__(self, fh: TextIO, **kwargs) -> None:
+    # Whether the reader expects a file opened in binary mode
+    binary = False
+
+    def __init__(
+        self,
+        fh: TextIO,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Where] = None,
+        **kwargs
+    ) -> None:
         self.fh = fh
+        # Field tags to read; None means all fields
+        self.fields = frozenset(fields) if fields is not None else None
+        # Field tag -> predicate on field value that records must match
+        self.where = dict(where) if where is not None else None
+        # Number of records skipped because they do not match `where`
+        self.skipped = 0
 
     def __iter__(self):
         return self
 
+    def fill_columns(self, columns: Columns, start: int, n: int) -> int:
+        """Read up to `n` records into `columns`
+
+        :param columns:
+            field tag -> list of values dict. Values of the records read are
+            appended, and lists are padded with None for missing fields
+        :param int start: number of records already in `columns`
+        :param int n: maximum number of records to read
+        :return: number of records read
+
+        """
+        for i in range(start, start + n):
+            try:
+                record = next(self)
+            except StopIteration:
+                return i - start
+            for heading, value in record.items():
+                _append_value(columns, heading, value, i)
+        return n
+
+
+def _append_value(columns: Columns, tag: str, value: Optional[str], i: int) -> None:
+    """Set value of field `tag` for the `i`-th record in `columns`"""
+    column = columns.get(tag)
+    if column is None:
+        column = columns[tag] = [None] * i
+    elif len(column) < i:
+        column.extend([None] * (i - len(column)))
+    column.append(value)
+
 
 def sniff_file(fh: IO[AnyStr], length: int = 10, offset: int = 0) -> AnyStr:
     sniff = fh.read(length)
@@ -54,8 +149,11 @@ def sniff_encoding(fh: BinaryIO) -> str:
     :return: best guess encoding
 
     """
-    sniff = sniff_file(fh)
+    return _encoding_from_prefix(sniff_file(fh))
+
 
+def _encoding_from_prefix(sniff: bytes) -> str:
+    """Guess encoding of file that starts with bytes `sniff`"""
     # WoS files typically include a BOM, which we want to strip from the actual
     # data. The encodings 'utf-8-sig' and 'utf-16' do this for UTF-8 and UTF-16
     # respectively. When dealing with files with BOM, avoid the encodings
@@ -71,8 +169,11 @@ def sniff_encoding(fh: BinaryIO) -> str:
 
 def get_reader(fh: TextIO) -> Type[Reader]:
     """Get appropriate reader for the file type of `fh`"""
-    sniff = sniff_file(fh)
+    return _reader_from_prefix(sniff_file(fh), fh)
 
+
+def _reader_from_prefix(sniff: str, fh: Any) -> Type[Reader]:
+    """Get appropriate reader for file `fh` that starts with `sniff`"""
     if sniff.startswith("FN "):
         return PlainTextReader
     elif "\t" in sniff:
@@ -82,15 +183,75 @@ def get_reader(fh: TextIO) -> Type[Reader]:
         raise ReadError("Could not determine appropriate reader for file {}".format(fh))
 
 
+# Magic numbers of supported compression formats
+_magic_numbers = {
+    b"\x1f\x8b": "gzip",
+    b"BZh": "bz2",
+    b"\xfd7zXZ\x00": "xz",
+    b"PK\x03\x04": "zip",
+}
+
+
+def _compression(sniff: bytes) -> Optional[str]:
+    """Get compression format of file that starts with bytes `sniff`"""
+    for magic, compression in _magic_numbers.items():
+        if sniff.startswith(magic):
+            return compression
+    return None
+
+
+def _peek(fh: BinaryIO, length: int = 10) -> bytes:
+    """Get first `length` bytes of buffered stream `fh` without consuming them"""
+    return fh.peek(length)[:length]  # type: ignore
+
+
+def _open_members(fname: FileName) -> Iterator[BinaryIO]:
+    """Open `fname` once and get the binary stream(s) it contains
+
+    Files compressed with gzip, bzip2 or xz are decompressed while they are
+    read. Each member of a zip archive is a separate stream. Other files
+    are a single stream.
+
+    """
+    with open(fname, "rb") as raw:
+        compression = _compression(_peek(raw))
+        if compression == "zip":
+            with zipfile.ZipFile(raw) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir():
+                        with archive.open(info) as fh:
+                            yield fh  # type: ignore
+        elif compression == "gzip":
+            with gzip.GzipFile(fileobj=raw) as fh:
+                yield fh  # type: ignore
+        elif compression == "bz2":
+            with bz2.BZ2File(raw) as fh:
+                yield fh  # type: ignore
+        elif compression == "xz":
+            with lzma.LZMAFile(raw) as fh:
+                yield fh  # type: ignore
+        else:
+            yield raw
+
+
 def read(
     fname: Union[FileName, Iterable[FileName]],
     using: Optional[Type[Reader]] = None,
     encoding: str = None,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    pool: Optional[StringPool] = None,
+    dedupe: Union[bool, str, Deduplicator] = False,
+    keep: str = "first",
+    stats: Optional[ReadStats] = None,
+    resume_from: Optional[Checkpoint] = None,
     **kwargs
 ) -> Iterator[Dict[str, str]]:
     """Read WoS export file ('tab-delimited' or 'plain text')
 
-    :param fname: name(s) of the WoS export file(s)
+    :param fname:
+        name(s) of the WoS export file(s). Files may be compressed with gzip,
+        bzip2 or xz, or be zip archives, in which case all members are read
     :type fname: str or iterable of strings
     :param using:
         class used for reading `fname`. If None, we try to automatically
@@ -98,33 +259,769 @@ def read(
     :param str encoding:
         encoding of the file. If None, we try to automatically determine the
         file's encoding
+    :param int workers:
+        number of worker processes used to read multiple files in parallel.
+        A single plain text file is split into chunks of about
+        :data:`CHUNK_SIZE` bytes, which are read in parallel. If None or 1,
+        everything is read in this process
+    :param bool ordered:
+        only relevant if `workers` > 1 and `fname` is an iterable. If True,
+        records are yielded in the same order as the serial reader; if False,
+        records from each file are yielded as soon as that file has been
+        parsed
+    :param pool:
+        if given, repeated values of the pool's fields are shared between
+        records through this :class:`.StringPool`
+    :param dedupe:
+        whether to drop records whose UT occurred before. Use True or
+        'exact' to keep all UTs in memory, 'bloom' to use a fixed-size Bloom
+        filter (which wrongly drops a small fraction of records) or 'disk'
+        to keep them in a temporary on-disk database. A
+        :class:`.Deduplicator` can be passed to configure these further
+    :param str keep:
+        which copy of a record to keep if `dedupe` is set: 'first', or the
+        tag of a numeric field (e.g. 'TC') to keep the copy with the highest
+        value. The latter reads the files twice and does not work with
+        'bloom'
+    :param stats:
+        if given, timings, throughput and the largest records and fields are
+        collected in this :class:`.ReadStats`
+    :param resume_from:
+        :class:`Checkpoint` from :func:`read_with_checkpoints` after which to
+        continue reading. `fname` must be the same file(s) as before. Cannot
+        be combined with `workers` or `dedupe`
+    :param kwargs:
+        passed on to the reader class, e.g. ``fields`` to only read some
+        field tags or ``where`` to only read matching records. With
+        `workers`, these must be picklable (e.g., no lambdas)
     :return:
         iterator over records in `fname`, where each record is a field code -
         value dict
 
     """
-    if not isinstance(fname, (str, pathlib.Path)):
+    if pool is not None:
+        records = read(
+            fname,
+            using,
+            encoding,
+            workers,
+            ordered,
+            None,
+            dedupe,
+            keep,
+            stats,
+            resume_from,
+            **kwargs
+        )
+        for record in records:
+            yield pool.intern_record(record)
+        return
+    if resume_from is not None:
+        if dedupe or workers is not None and workers > 1:
+            raise ValueError("Cannot resume reading with workers or dedupe")
+        records = (
+            record
+            for record, _ in read_with_checkpoints(
+                fname, using, encoding, resume_from, **kwargs
+            )
+        )
+        yield from records if stats is None else stats.track(records)
+        return
+    if dedupe:
+        yield from _read_deduplicated(
+            fname, dedupe, keep, using, encoding, workers, ordered, stats, **kwargs
+        )
+        return
+    if stats is not None:
+        yield from stats.track(
+            _read_profiled(fname, using, encoding, workers, ordered, stats, **kwargs)
+        )
+        return
+
+    if isinstance(fname, (str, pathlib.Path)):
+        yield from _read_file(fname, using, encoding, workers, **kwargs)
+    elif workers is not None and workers > 1:
+        yield from _read_parallel(fname, workers, ordered, using, encoding, **kwargs)
+    else:
         # fname is an iterable of file names
         for actual_fname in fname:
-            yield from read(actual_fname)
+            yield from _read_file(actual_fname, using, encoding, **kwargs)
+
+
+def read_with_checkpoints(
+    fname: Union[FileName, Iterable[FileName]],
+    using: Optional[Type[Reader]] = None,
+    encoding: str = None,
+    resume_from: Optional[Checkpoint] = None,
+    **kwargs
+) -> Iterator[Tuple[Dict[str, str], Checkpoint]]:
+    """Read WoS export file(s), with a checkpoint after each record
+
+    Pass the checkpoint of the last record that was handled as
+    ``resume_from`` to this function or :func:`read` to continue reading
+    right after that record, e.g. after a crash. Checkpoints are tuples
+    of a file name and numbers, which are easily stored (e.g. as JSON).
+    Reading compressed files is resumed by decompressing up to the
+    checkpoint, which is still much faster than parsing.
+
+    Only :class:`PlainTextReader` and :class:`TabDelimitedReader` are
+    supported.
+
+    :param fname: name(s) of the WoS export file(s)
+    :type fname: str or iterable of strings
+    :param using: see :func:`read`
+    :param str encoding: see :func:`read`
+    :param resume_from: :class:`Checkpoint` after which to continue reading
+    :param kwargs: passed on to the reader class, e.g. ``fields``
+    :return: iterator over (record, :class:`Checkpoint`) pairs
+
+    """
+    fnames = [fname] if isinstance(fname, (str, pathlib.Path)) else fname
+    ordinal = resume_from.ordinal if resume_from is not None else 0
+    for i, actual_fname in enumerate(fnames):
+        start_member = offset = 0
+        if resume_from is not None:
+            if i < resume_from.file:
+                continue
+            if i == resume_from.file:
+                if str(actual_fname) != resume_from.fname:
+                    raise ValueError(
+                        "Checkpoint is for file {}, not {}".format(
+                            resume_from.fname, actual_fname
+                        )
+                    )
+                start_member, offset = resume_from.member, resume_from.offset
+
+        for member, fh in enumerate(_open_members(actual_fname)):
+            if member < start_member:
+                continue
+            lines, reader = _open_at(
+                fh, actual_fname, using, encoding, offset, **kwargs
+            )
+            offset = 0
+            for record in reader:
+                ordinal += 1
+                checkpoint = Checkpoint(
+                    str(actual_fname), i, member, lines.offset, ordinal
+                )
+                yield record, checkpoint
+
+
+class _OffsetLines:
+    """Decoded lines of binary stream `fh`, with the byte offset after the last
+
+    Iterating gives a generator, which is faster than a ``__next__`` method.
+
+    """
+
+    def __init__(self, fh: BinaryIO, codec: str) -> None:
+        self.fh = fh
+        self.codec = codec
+        self.offset = fh.tell()
+
+    def __iter__(self) -> Iterator[str]:
+        codec = self.codec
+        for offset, raw_line in _iter_raw_lines(self.fh, codec):
+            self.offset = offset + len(raw_line)
+            line = raw_line.decode(codec)
+            # Translate newlines, like text files do
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            yield line
 
+
+def _open_at(
+    fh: BinaryIO,
+    fname: FileName,
+    using: Optional[Type[Reader]],
+    encoding: Optional[str],
+    offset: int,
+    **kwargs
+) -> Tuple[_OffsetLines, Reader]:
+    """Get reader for records in binary stream `fh` from byte `offset` on
+
+    The returned lines keep track of the offset after the last record read.
+
+    """
+    sniff = _peek(fh)
+    encoding = encoding or _encoding_from_prefix(sniff)
+    reader_class = using or _reader_from_prefix(sniff.decode(encoding, "ignore"), fname)
+    if reader_class not in (PlainTextReader, TabDelimitedReader):
+        raise ValueError("Cannot read with checkpoints using {}".format(reader_class))
+    codec = _codec_from_prefix(sniff, encoding)
+    try:
+        bom = "\ufeff".encode(codec)
+    except UnicodeEncodeError:
+        bom = b""
+    start = len(bom) if bom and sniff.startswith(bom) else 0
+
+    if offset <= start:
+        fh.read(start)
+        lines = _OffsetLines(fh, codec)
+        if reader_class is PlainTextReader:
+            return lines, PlainTextReader(iter(lines), **kwargs)  # type: ignore
+        return lines, TabDelimitedReader(iter(lines), **kwargs)  # type: ignore
+
+    if reader_class is PlainTextReader:
+        fh.seek(offset)
+        lines = _OffsetLines(fh, codec)
+        return lines, _PlainTextChunkReader(iter(lines), **kwargs)  # type: ignore
+
+    # Tab-delimited files need the header line
+    fh.read(start)
+    header = next(iter(_OffsetLines(fh, codec)))
+    fh.seek(offset)
+    lines = _OffsetLines(fh, codec)
+    return lines, TabDelimitedReader(chain([header], lines), **kwargs)  # type: ignore
+
+
+def _read_profiled(
+    fname: Union[FileName, Iterable[FileName]],
+    using: Optional[Type[Reader]],
+    encoding: Optional[str],
+    workers: Optional[int],
+    ordered: bool,
+    stats: ReadStats,
+    **kwargs
+) -> Iterator[Dict[str, str]]:
+    """Read records from `fname`, timing the stages of each reader in `stats`"""
+    if isinstance(fname, (str, pathlib.Path)):
+        yield from _read_file(fname, using, encoding, workers, stats, **kwargs)
+    elif workers is not None and workers > 1:
+        yield from _read_parallel(
+            fname, workers, ordered, using, encoding, stats, **kwargs
+        )
     else:
-        if encoding is None:
-            with open(fname, "rb") as fh_sniff:
-                encoding = sniff_encoding(fh_sniff)
+        for actual_fname in fname:
+            yield from _read_file(actual_fname, using, encoding, None, stats, **kwargs)
+
+
+def _read_deduplicated(
+    fname: Union[FileName, Iterable[FileName]],
+    dedupe: Union[bool, str, Deduplicator],
+    keep: str,
+    using: Optional[Type[Reader]],
+    encoding: Optional[str],
+    workers: Optional[int],
+    ordered: bool,
+    stats: Optional[ReadStats] = None,
+    **kwargs
+) -> Iterator[Dict[str, str]]:
+    """Read records from `fname`, dropping repeated UTs (see :func:`read`)"""
+    fields = kwargs.get("fields")
+    drop_ut = fields is not None and "UT" not in fields
+    if drop_ut:
+        kwargs["fields"] = [*fields, "UT"]
+    deduplicator = get_deduplicator(dedupe)
+
+    try:
+        if keep == "first":
+            records = read(
+                fname, using, encoding, workers, ordered, stats=stats, **kwargs
+            )
+            for record in records:
+                ut = record.pop("UT", None) if drop_ut else record.get("UT")
+                if not ut or deduplicator.add(ut):
+                    yield record
+                else:
+                    deduplicator.duplicates += 1
+            return
+
+        # Find the winning copy of each record first, then read again and
+        # only yield the winners. Both passes need the same record order.
+        if not isinstance(fname, (str, pathlib.Path)):
+            fname = list(fname)
+        first_pass = dict(kwargs, fields=("UT", keep))
+        records = read(fname, using, encoding, workers, True, stats=stats, **first_pass)
+        for ordinal, record in enumerate(records):
+            ut = record.get("UT")
+            if ut:
+                value = record.get(keep)
+                deduplicator.update(ut, int(value) if value else -1, ordinal)
+
+        records = read(fname, using, encoding, workers, True, stats=stats, **kwargs)
+        for ordinal, record in enumerate(records):
+            ut = record.pop("UT", None) if drop_ut else record.get("UT")
+            if not ut or deduplicator.winner(ut) == ordinal:
+                yield record
+            else:
+                deduplicator.duplicates += 1
+    finally:
+        if deduplicator is not dedupe:
+            deduplicator.close()
+
+
+def _read_file(
+    fname: FileName,
+    using: Optional[Type[Reader]] = None,
+    encoding: str = None,
+    workers: Optional[int] = None,
+    stats: Optional[ReadStats] = None,
+    **kwargs
+) -> Iterator[Dict[str, str]]:
+    """Read a single WoS export file (see :func:`read`)"""
+    if workers is not None and workers > 1:
+        with open(fname, "rb") as fh:
+            sniff = _peek(fh)
+        if _compression(sniff) is None:
+            encoding = encoding or _encoding_from_prefix(sniff)
+            reader_class = using or _reader_from_prefix(
+                sniff.decode(encoding, "ignore"), fname
+            )
+            if reader_class is PlainTextReader:
+                yield from _read_chunks_parallel(
+                    fname, workers, encoding, stats, **kwargs
+                )
+                return
+
+    for reader in _open_readers(fname, using, encoding, stats, **kwargs):
+        yield from reader
+        _report_skipped(reader.skipped, fname, stats)
+
+
+def _report_skipped(
+    skipped: int, fname: FileName, stats: Optional[ReadStats] = None
+) -> None:
+    """Log and count `skipped` records of `fname` that did not match `where`"""
+    if skipped:
+        logger.info("Skipped %d non-matching records in %s", skipped, fname)
+        if stats is not None:
+            stats.skipped += skipped
+
+
+def _open_readers(
+    fname: FileName,
+    using: Optional[Type[Reader]] = None,
+    encoding: str = None,
+    stats: Optional[ReadStats] = None,
+    **kwargs
+) -> Iterator[Reader]:
+    """Get a reader for each stream in `fname` (see :func:`read`)
+
+    The file is opened only once: encoding and reader class are determined
+    from the first bytes of each stream, without seeking. If `stats` is
+    given, the stages of each reader are timed.
+
+    """
+    for fh in _open_members(fname):
+        sniff = _peek(fh)
+        member_encoding = encoding or _encoding_from_prefix(sniff)
+        reader_class = using or _reader_from_prefix(
+            sniff.decode(member_encoding, "ignore"), fname
+        )
+        if reader_class.binary:
+            reader = reader_class(fh, encoding=member_encoding, **kwargs)
+        else:
+            if stats is not None:
+                fh = io.BufferedReader(_TimedStream(fh, stats))  # type: ignore
+            text = io.TextIOWrapper(fh, encoding=member_encoding)
+            reader = reader_class(text, **kwargs)
+        if stats is not None:
+            _profile_reader(reader, stats)
+        yield reader
+        if stats is not None and reader_class.binary:
+            stats.bytes += _stream_size(fh)
+
+
+def _profile_reader(reader: Reader, stats: ReadStats) -> None:
+    """Time the stages of `reader` in `stats` (see :class:`.ReadStats`)"""
+    if isinstance(reader, PlainTextReader):
+        reader._next_record_lines = stats.timed(  # type: ignore
+            "lines", reader._next_record_lines
+        )
+        reader._format_values = stats.timed(  # type: ignore
+            "format", reader._format_values
+        )
+    elif isinstance(reader, TabDelimitedReader):
+        if hasattr(reader, "reader"):
+            reader.reader.reader = _TimedIterator(reader.reader.reader, stats, "csv")
+        else:
+            reader.rows = _TimedIterator(reader.rows, stats, "csv")
+
+
+def _stream_size(fh: BinaryIO) -> int:
+    """Get number of bytes in `fh`, which a binary reader may not have moved"""
+    size = 0
+    try:
+        size = fh.tell()
+        size = max(size, os.fstat(fh.fileno()).st_size)
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        pass
+    return size
+
+
+# Options of read() that are not handled by the readers themselves
+_READ_OPTIONS = frozenset(
+    ("workers", "ordered", "dedupe", "keep", "stats", "resume_from")
+)
+
+
+def read_batches(
+    fname: Union[FileName, Iterable[FileName]],
+    batch_size: int = 1000,
+    as_records: bool = False,
+    using: Optional[Type[Reader]] = None,
+    encoding: str = None,
+    pool: Optional[StringPool] = None,
+    **kwargs
+) -> Iterator[Union[Columns, List[Dict[str, str]]]]:
+    """Read WoS export file(s) in batches of `batch_size` records
+
+    By default, each batch is a field tag -> list of values dict, with None
+    for fields that are missing in a record. Fields that do not occur in any
+    record of a batch are left out. Batches are filled directly by the
+    readers, without creating a dict per record.
+
+    :param fname: name(s) of the WoS export file(s)
+    :type fname: str or iterable of strings
+    :param int batch_size: maximum number of records per batch
+    :param bool as_records: whether to yield lists of records instead
+    :param using: see :func:`read`
+    :param str encoding: see :func:`read`
+    :param pool: see :func:`read`
+    :param kwargs:
+        passed on to the reader class, e.g. ``fields``, or to :func:`read`,
+        e.g. ``workers`` or ``dedupe``. Batches are then filled from records
+    :return: iterator over batches of records from `fname`
+
+    """
+    if as_records or _READ_OPTIONS.intersection(kwargs):
+        records = read(fname, using, encoding, pool=pool, **kwargs)
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                return
+            if as_records:
+                yield batch
+                continue
+            columns = {}
+            for i, record in enumerate(batch):
+                for tag, value in record.items():
+                    _append_value(columns, tag, value, i)
+            yield _pad_columns(columns, len(batch))
+
+    fnames = [fname] if isinstance(fname, (str, pathlib.Path)) else fname
+    columns: Columns = {}
+    size = 0
+    for actual_fname in fnames:
+        for reader in _open_readers(actual_fname, using, encoding, **kwargs):
+            while True:
+                n = reader.fill_columns(columns, size, batch_size - size)
+                size += n
+                if size < batch_size:  # Reader exhausted
+                    break
+                yield _pad_columns(columns, size, pool)
+                columns = {}
+                size = 0
+            _report_skipped(reader.skipped, actual_fname)
+    if size:
+        yield _pad_columns(columns, size, pool)
+
+
+def _pad_columns(
+    columns: Columns, size: int, pool: Optional[StringPool] = None
+) -> Columns:
+    """Pad all lists in `columns` with None to length `size`, pooling values"""
+    for column in columns.values():
+        if len(column) < size:
+            column.extend([None] * (size - len(column)))
+    if pool is not None:
+        # Values of splittable fields are raw, so these are not pooled
+        single = {
+            tag: column
+            for tag, column in columns.items()
+            if not is_splittable.get(tag, False)
+        }
+        columns.update(pool.intern_record(single))
+    return columns
+
+
+def _read_file_to_list(args) -> Tuple[FileName, List[Dict[str, str]], int]:
+    """Read all records of one file; runs in a worker process
+
+    :return:
+        tuple of the file name, its records and the number of records that
+        were skipped because they do not match `where`
+
+    """
+    fname, using, encoding, kwargs = args
+    records: List[Dict[str, str]] = []
+    skipped = 0
+    for reader in _open_readers(fname, using, encoding, **kwargs):
+        records.extend(reader)
+        skipped += reader.skipped
+    return fname, records, skipped
+
+
+def _imap_bounded(
+    executor: Executor,
+    fn: Callable[[Any], Any],
+    jobs: Iterable[Any],
+    max_pending: int,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """Map `fn` over `jobs` in `executor`, with at most `max_pending` jobs in flight
+
+    Jobs are only submitted when an earlier result has been consumed, so
+    memory use is bounded regardless of the number of jobs. Jobs that are
+    still pending when the iterator is closed are cancelled.
+
+    """
+    jobs = iter(jobs)
+    pending: Deque[Future] = deque()
+
+    def submit_next() -> bool:
+        try:
+            job = next(jobs)
+        except StopIteration:
+            return False
+        pending.append(executor.submit(fn, job))
+        return True
+
+    try:
+        while len(pending) < max_pending and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+            result = future.result()
+            submit_next()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _read_parallel(
+    fnames: Iterable[FileName],
+    workers: int,
+    ordered: bool = True,
+    using: Optional[Type[Reader]] = None,
+    encoding: str = None,
+    stats: Optional[ReadStats] = None,
+    **kwargs
+) -> Iterator[Dict[str, str]]:
+    """Read files `fnames` in a pool of `workers` processes
+
+    At most ``2 * workers`` files are parsed or waiting to be consumed at any
+    time, so memory use is bounded regardless of the number of files.
+
+    """
+    jobs = ((fname, using, encoding, kwargs) for fname in fnames)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for fname, records, skipped in _imap_bounded(
+            executor, _read_file_to_list, jobs, 2 * workers, ordered
+        ):
+            yield from records
+            _report_skipped(skipped, fname, stats)
+
+
+# Approximate size in bytes of the chunks a single plain text file is split into
+# when it is read in parallel
+CHUNK_SIZE = 64 * 2**20
+
+
+def _chunk_codec(fname: FileName, encoding: str) -> str:
+    """Get BOM-less codec to decode chunks that do not start the file"""
+    if encoding == "utf-16":
+        with open(fname, "rb") as fh:
+            return _codec_from_prefix(fh.read(2), encoding)
+    return _codec_from_prefix(b"", encoding)
+
+
+def _codec_from_prefix(sniff: bytes, encoding: str) -> str:
+    """Get BOM-less codec for `encoding`, given the first bytes of a stream"""
+    if encoding == "utf-8-sig":
+        return "utf-8"
+    if encoding == "utf-16":
+        return "utf-16-be" if sniff.startswith(codecs.BOM_UTF16_BE) else "utf-16-le"
+    return encoding
+
+
+def _iter_raw_lines(fh: BinaryIO, codec: str) -> Iterator[Tuple[int, bytes]]:
+    """Iterate over lines in binary file `fh`, with their byte offsets
+
+    Lines are split on the newline as encoded in `codec` and include it.
+
+    """
+    newline = "\n".encode(codec)
+    width = len(newline)
+    offset = fh.tell()
+
+    if width == 1:
+        for line in fh:
+            yield offset, line
+            offset += len(line)
+        return
+
+    buffer = b""
+    while True:
+        block = fh.read(2**16)
+        if not block:
+            if buffer:
+                yield offset, buffer
+            return
+        buffer += block
+        start = 0
+        i = buffer.find(newline)
+        while i >= 0:
+            if i % width == 0:
+                line = buffer[start : i + width]
+                yield offset, line
+                offset += len(line)
+                start = i + width
+            i = buffer.find(newline, i + 1)
+        buffer = buffer[start:]
+
+
+def _next_boundary(fh: BinaryIO, pos: int, codec: str) -> Optional[int]:
+    """Get offset right after the first line starting with 'ER' after `pos`"""
+    newline = "\n".encode(codec)
+    marker = newline + "ER".encode(codec)
+    # Width of a code unit: matches must be aligned to it (e.g. in UTF-16)
+    width = len(newline)
+    base = pos - pos % width
+    fh.seek(base)
+    buffer = b""
+
+    while True:
+        block = fh.read(2**16)
+        if not block:
+            return None
+        buffer += block
+
+        i = buffer.find(marker)
+        while i >= 0 and i % width:
+            i = buffer.find(marker, i + 1)
+        if i < 0:
+            # Keep only the tail, which may contain the start of a marker
+            keep = len(buffer) - len(buffer) % width - len(marker)
+            if keep > 0:
+                base += keep
+                buffer = buffer[keep:]
+            continue
+
+        j = buffer.find(newline, i + len(marker))
+        while j >= 0 and (j - i) % width:
+            j = buffer.find(newline, j + 1)
+        if j >= 0:
+            return base + j + width
+
+
+def _chunk_boundaries(
+    fname: FileName, codec: str, chunk_size: int
+) -> Iterator[Tuple[int, int]]:
+    """Split `fname` in byte ranges of about `chunk_size` at record boundaries"""
+    size = os.path.getsize(fname)
+    with open(fname, "rb") as fh:
+        start = 0
+        while start < size:
+            end = _next_boundary(fh, start + chunk_size, codec)
+            if end is None or end >= size:
+                end = size
+            yield start, end
+            start = end
 
-        if using is None:
-            with open(fname, encoding=encoding) as fh:
-                reader_class = get_reader(fh)
+
+class _UnexpectedEF(Exception):
+    """Unexpected EF marker at a line number relative to the start of a chunk"""
+
+    def __init__(self, line: int) -> None:
+        super().__init__(line)
+        self.line = line
+
+
+def _read_chunk(
+    args,
+) -> Tuple[List[Dict[str, str]], int, int, bool, Optional[Exception]]:
+    """Read records in a byte range of a plain text file; runs in a worker process
+
+    :return:
+        tuple of the records read, the number of records skipped because they
+        do not match `where`, the number of lines in the chunk, whether the
+        EF marker was reached, and the error encountered (if any)
+
+    """
+    fname, start, end, encoding, codec, last, kwargs = args
+    with open(fname, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(end - start)
+
+    records: List[Dict[str, str]] = []
+    fh_chunk = io.TextIOWrapper(
+        io.BytesIO(data), encoding=encoding if start == 0 else codec
+    )
+    reader: Optional[PlainTextReader] = None
+    try:
+        if start == 0:
+            reader = PlainTextReader(fh_chunk, **kwargs)
         else:
-            reader_class = using
+            reader = _PlainTextChunkReader(fh_chunk, **kwargs)
+        reader.last_chunk = last
+        records.extend(reader)
+    except ReadError as e:
+        skipped = reader.skipped if reader is not None else 0
+        if reader is not None and reader.reached_ef:
+            return records, skipped, 0, True, _UnexpectedEF(reader.current_line)
+        return records, skipped, 0, True, e
+    except NotImplementedError as e:
+        return records, reader.skipped if reader is not None else 0, 0, True, e
+
+    n_lines = data.count("\n".encode(codec))
+    return records, reader.skipped, n_lines, reader.reached_ef, None
 
-        with open(fname, encoding=encoding) as fh:
-            yield from reader_class(fh, **kwargs)
+
+def _read_chunks_parallel(
+    fname: FileName,
+    workers: int,
+    encoding: str,
+    stats: Optional[ReadStats] = None,
+    **kwargs
+) -> Iterator[Dict[str, str]]:
+    """Read plain text file `fname` by parsing byte ranges in `workers` processes
+
+    Records are yielded in their original order, and errors are reported as
+    they would be by :class:`PlainTextReader`.
+
+    """
+    codec = _chunk_codec(fname, encoding)
+    size = os.path.getsize(fname)
+    jobs = (
+        (fname, start, end, encoding, codec, end == size, kwargs)
+        for start, end in _chunk_boundaries(fname, codec, CHUNK_SIZE)
+    )
+    line_offset = 0
+    total_skipped = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for records, skipped, n_lines, reached_ef, error in _imap_bounded(
+            executor, _read_chunk, jobs, 2 * workers
+        ):
+            yield from records
+            total_skipped += skipped
+            if isinstance(error, _UnexpectedEF):
+                raise ReadError(_UNEXPECTED_EF_MSG.format(line_offset + error.line))
+            elif error is not None:
+                raise error
+            if reached_ef:
+                # The serial reader ignores everything after EF
+                break
+            line_offset += n_lines
+    _report_skipped(total_skipped, fname, stats)
 
 
 class TabDelimitedReader(Reader):
-    def __init__(self, fh: TextIO, **kwargs) -> None:
+    def __init__(
+        self,
+        fh: TextIO,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Where] = None,
+        **kwargs
+    ) -> None:
         """Create a reader for tab-delimited file `fh` exported fom WoS
 
         If you do not know the encoding of a file, the :func:`.read` function
@@ -132,12 +1029,76 @@ class TabDelimitedReader(Reader):
 
         :param fh: WoS tab-delimited file, opened in text mode(!)
         :type fh: file object
+        :param fields:
+            field tags to read. If None, all fields are read; otherwise,
+            other columns are skipped
+        :type fields: iterable of strings
+        :param where:
+            field tag -> predicate dict. Only records for which each predicate
+            returns True for the value of its field are read. Records where
+            one of these fields is missing or empty are skipped.
 
         """
-        super().__init__(fh, **kwargs)
-        self.reader = DictReader(self.fh, delimiter="\t", **kwargs)
+        super().__init__(fh, fields, where)
+        if self.fields is None and self.where is None:
+            self.reader = DictReader(self.fh, delimiter="\t", **kwargs)
+        else:
+            self.rows = csv_reader(self.fh, delimiter="\t", **kwargs)
+            header = next(self.rows, [])
+            self.columns = [
+                (i, tag)
+                for i, tag in enumerate(header)
+                if self.fields is None or tag in self.fields
+            ]
+            self.conditions = [
+                (header.index(tag) if tag in header else len(header), predicate)
+                for tag, predicate in (self.where or {}).items()
+            ]
+
+    def _next_row(self) -> List[str]:
+        """Get next non-empty row that matches `self.where`"""
+        while True:
+            row = next(self.rows)
+            if not row:  # Skip empty lines, like DictReader does
+                continue
+            n = len(row)
+            for i, predicate in self.conditions:
+                if i >= n or not row[i] or not predicate(row[i]):
+                    self.skipped += 1
+                    break
+            else:
+                return row
+
+    def _next_projected(self) -> Dict[str, str]:
+        """Get next matching record with only the columns in `self.fields`"""
+        row = self._next_row()
+        n = len(row)
+        return {tag: row[i] if i < n else None for i, tag in self.columns}
+
+    def fill_columns(self, columns: Columns, start: int, n: int) -> int:
+        if self.fields is None and self.where is None:
+            rows = self.reader.reader
+            layout = list(enumerate(self.reader.fieldnames or []))
+            next_row = partial(next, rows)
+        else:
+            layout = self.columns
+            next_row = self._next_row
+
+        for i in range(start, start + n):
+            try:
+                row = next_row()
+                while not row:  # Skip empty lines, like DictReader does
+                    row = next_row()
+            except StopIteration:
+                return i - start
+            size = len(row)
+            for j, tag in layout:
+                _append_value(columns, tag, row[j] if j < size else None, i)
+        return n
 
     def __next__(self) -> Dict[str, str]:
+        if self.fields is not None or self.where is not None:
+            return self._next_projected()
         record = next(self.reader)
         # Since WoS files have a spurious tab at the end of each line, we
         # may get a 'ghost' None key.
@@ -148,6 +1109,20 @@ class TabDelimitedReader(Reader):
         return record
 
 
+_UNEXPECTED_EF_MSG = "Encountered unexpected end of file marker EF on line {}"
+
+
+def _unknown_tag_error(heading: str) -> NotImplementedError:
+    msg = (
+        "\n------------ ERROR ------------\n"
+        'Seems that the tag "{}" is new and not yet handled by the wosfile library.\n'
+        "Please report this error:\n"
+        "  https://github.com/rafguns/wosfile/issues\n"
+        "We are sorry for the inconvenience.\n"
+    )
+    return NotImplementedError(msg.format(heading))
+
+
 class PlainTextReader(Reader):
     def __init__(self, fh: TextIO, **kwargs) -> None:
         """Create a reader for WoS plain text file `fh`
@@ -157,12 +1132,25 @@ class PlainTextReader(Reader):
 
         :param fh: WoS plain text file, opened in text mode(!)
         :type fh: file object
+        :param fields:
+            field tags to read. If None, all fields are read; otherwise,
+            lines of other fields are skipped
+        :type fields: iterable of strings
+        :param where:
+            field tag -> predicate dict. Only records for which each predicate
+            returns True for the value of its field are read. Records where
+            one of these fields is missing are skipped.
 
         """
         super().__init__(fh, **kwargs)
         self.version = "1.0"  # Expected version of WoS plain text format
         self.current_line = 0
+        self.reached_ef = False
+        self.last_chunk = True
+        self._read_header()
 
+    def _read_header(self) -> None:
+        """Read and check FN and VR lines at start of file"""
         line = self._next_nonempty_line()
         if not line.startswith("FN"):
             raise ReadError("Unknown file format")
@@ -188,27 +1176,82 @@ class PlainTextReader(Reader):
         return line
 
     def _next_record_lines(self) -> List[str]:
-        """Gather lines that belong to one record"""
+        """Gather lines that belong to one record
+
+        Lines of fields that are not in `self.fields` are left out. Records
+        that do not match `self.where` are skipped as soon as a field that
+        does not match has been read.
+
+        """
         lines: List[str] = []
+        fields = self.fields
+        where = self.where
+        in_record = False
+        keep = True
+        rejected = False
+        # Tag and index of first line of the filtered field that is being gathered
+        condition: Optional[Tuple[str, int]] = None
+        n_conditions = 0
+
         while True:
             try:
                 line = self._next_nonempty_line()
             except StopIteration:
+                if not self.last_chunk and not in_record:
+                    # End of a chunk of a file that is read in parallel
+                    raise
                 raise ReadError("Encountered EOF before 'EF' marker")
             if line.startswith("EF"):
-                if lines:  # We're in the middle of a record!
-                    raise ReadError(
-                        "Encountered unexpected end of file marker EF on line {}".format(
-                            self.current_line
-                        )
-                    )
+                self.reached_ef = True
+                if in_record:  # We're in the middle of a record!
+                    raise ReadError(_UNEXPECTED_EF_MSG.format(self.current_line))
                 else:  # End of file
                     raise StopIteration
+            in_record = True
             if line.startswith("ER"):  # end of record
+                if where is not None:
+                    if condition is not None and not rejected:
+                        rejected = not self._matches(lines, *condition)
+                    if rejected or n_conditions < len(where):
+                        self.skipped += 1
+                        lines = []
+                        in_record = rejected = False
+                        keep = True
+                        condition = None
+                        n_conditions = 0
+                        continue
                 return lines
-            else:
+            if rejected:
+                continue
+            if not line.startswith("  "):  # new field
+                if condition is not None:
+                    if not self._matches(lines, *condition):
+                        rejected = True
+                        continue
+                    condition = None
+                tag = line[:2]
+                if where is not None and tag in where:
+                    condition = (tag, len(lines))
+                    n_conditions += 1
+                    keep = True
+                elif fields is not None:
+                    keep = tag in fields
+            if keep:
                 lines.append(line)
 
+    def _matches(self, lines: List[str], heading: str, start: int) -> bool:
+        """Check if field in `lines[start:]` matches `self.where`
+
+        The lines of the field are removed if the field should not be read.
+
+        """
+        heading, v = lines[start].split(None, 1)
+        values = [v]
+        values.extend(line.strip() for line in lines[start + 1 :])
+        if self.fields is not None and heading not in self.fields:
+            del lines[start:]
+        return self.where[heading](self._format_values(heading, values))
+
     def _format_values(self, heading: str, values: List[str]) -> str:
         try:
             if has_item_per_line[heading]:  # Iterable field with one item per line
@@ -216,33 +1259,48 @@ class PlainTextReader(Reader):
             else:
                 return " ".join(values)
         except KeyError:
-            msg = (
-                "\n------------ ERROR ------------\n"
-                'Seems that the tag "{}" is new and not yet handled by the wosfile library.\n'
-                "Please report this error:\n"
-                "  https://github.com/rafguns/wosfile/issues\n"
-                "We are sorry for the inconvenience.\n"
-            )
-            raise NotImplementedError(msg.format(heading))
+            raise _unknown_tag_error(heading)
 
-    def __next__(self) -> Dict[str, str]:
-        record = {}
+    def _fields(self, lines: List[str]) -> Iterator[Tuple[str, str]]:
+        """Get (field tag, value) pairs from the lines of a record"""
         values: List[str] = []
         heading = ""
-        lines = self._next_record_lines()
 
         # Parse record, this is mostly handling multi-line fields
         for line in lines:
             if not line.startswith("  "):  # new field
                 # Add previous field, if available, to record
                 if heading:
-                    record[heading] = self._format_values(heading, values)
+                    yield heading, self._format_values(heading, values)
                 heading, v = line.split(None, 1)
                 values = [v]
             else:
                 values.append(line.strip())
 
         # Add last field
-        record[heading] = self._format_values(heading, values)
+        if heading:
+            yield heading, self._format_values(heading, values)
 
-        return record
+    def __next__(self) -> Dict[str, str]:
+        return dict(self._fields(self._next_record_lines()))
+
+    def fill_columns(self, columns: Columns, start: int, n: int) -> int:
+        for i in range(start, start + n):
+            try:
+                lines = self._next_record_lines()
+            except StopIteration:
+                return i - start
+            for heading, value in self._fields(lines):
+                _append_value(columns, heading, value, i)
+        return n
+
+
+class _PlainTextChunkReader(PlainTextReader):
+    """Reader for part of a plain text file, starting at a record boundary
+
+    Used to read a single file in parallel (see :func:`read`).
+
+    """
+
+    def _read_header(self) -> None:
+        pass
@@ -1,17 +1,62 @@
+import logging
 import re
 from collections import defaultdict
-from typing import Dict, Iterable, Iterator, List, Optional, Union
+from functools import lru_cache
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
+from .address import split_address_field
+from .pool import StringPool
 from .read import read
+from .references import Reference, _parser
+from .stats import ReadStats
 from .tags import is_splittable
 
-__all__ = ["Record", "parse_address_field", "records_from"]
+logger = logging.getLogger(__name__)
+
+__all__ = ["LazyRecord", "Record", "parse_address_field", "records_from"]
+
+D = TypeVar("D")
 
 
 def split_by(string: str, delimiter: str) -> List[str]:
     return [part.strip() for part in string.split(delimiter)]
 
 
+def split_field(tag: str, value: str) -> List[str]:
+    """Split raw `value` of splittable field `tag` into its items
+
+    Cited references (CR) are only split on '; ', since their DOIs can
+    contain semicolons, e.g. 'DOI 10.1002/(SICI)1097-4571(199806)49:8<693::AID-
+    ASI4>3.0.CO;2-#'.
+
+    """
+    if tag == "CR":
+        return split_by(value, "; ")
+    return split_by(value, ";")
+
+
+def field_items(tag: str, value: Any) -> List[str]:
+    """Get items of splittable field `tag` from its parsed or raw `value`
+
+    Missing and empty values give an empty list.
+
+    """
+    if not value:
+        return []
+    if isinstance(value, str):
+        return split_field(tag, value)
+    return value
+
+
+def to_int(value: Any, default: D = None) -> Union[int, D]:  # type: ignore
+    """Get numeric `value` as int, or `default` if it is missing or invalid"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 class Record(dict):
     def __init__(
         self, wos_data: Dict[str, str] = None, skip_empty: bool = True
@@ -38,7 +83,7 @@ class Record(dict):
             if self.skip_empty and not value:
                 continue
             if is_splittable[field_name]:
-                self[field_name] = split_by(value, ";")
+                self[field_name] = split_field(field_name, value)
             else:  # No parsing needed
                 self[field_name] = value
 
@@ -59,61 +104,177 @@ class Record(dict):
     @property
     def author_address(self) -> Optional[Union[List[str], Dict[str, List[str]]]]:
         try:
-            return parse_address_field(self['C1'])
+            return parse_address_field(self["C1"])
         except KeyError:
             return None
 
+    @property
+    def references(self) -> List[Reference]:
+        """Get parsed cited references (CR) of this record"""
+        return _parser.parse_field(self.get("CR"))
+
+
+# Maximum number of distinct field tag sequences kept in the layout cache
+LAYOUT_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def _layout(tags: Tuple[str, ...]) -> Dict[str, int]:
+    """Get field tag -> position dict for LazyRecords with fields `tags`"""
+    return {tag: i for i, tag in enumerate(tags)}
+
+
+class LazyRecord(Mapping):
+    """Memory-efficient, read-only variant of :class:`Record`
+
+    Values are stored as the raw strings from the WoS file, in a list on an
+    object without a ``__dict__``. Splittable fields are only split on first
+    access, and the result is kept for later use. The field tag -> position
+    mapping is taken from a small cache, which saves a dict per record when
+    many records have the same fields.
+
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(
+        self, wos_data: Dict[str, str] = None, skip_empty: bool = True
+    ) -> None:
+        """Create a lazy record based on *wos_data*
+
+        :param dict wos_data: a WoS record
+        :param bool skip_empty: whether or not to skip empty fields
+
+        """
+        items = [
+            (field_name, value)
+            for field_name, value in (wos_data or {}).items()
+            if value or not skip_empty
+        ]
+        tags = tuple(field_name for field_name, _ in items)
+        self._layout = _layout(tags)
+        self._values: List[Union[str, List[str]]] = [value for _, value in items]
+
+    def __getitem__(self, field_name: str) -> Union[str, List[str]]:
+        i = self._layout[field_name]
+        value = self._values[i]
+        if isinstance(value, str) and is_splittable[field_name]:
+            value = self._values[i] = split_field(field_name, value)
+        return value
+
+    def __contains__(self, field_name: object) -> bool:
+        return field_name in self._layout
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, dict(self))
+
+    def __getstate__(self) -> Tuple[Tuple[str, ...], List[Union[str, List[str]]]]:
+        return tuple(self._layout), self._values
+
+    def __setstate__(
+        self, state: Tuple[Tuple[str, ...], List[Union[str, List[str]]]]
+    ) -> None:
+        tags, self._values = state
+        self._layout = _layout(tags)
+
+    record_id = Record.record_id
+    author_address = Record.author_address
+    references = Record.references
+
 
 def parse_address_field(field: str) -> Union[List[str], Dict[str, List[str]]]:
-    """Parse author address field into author -> addresses dict"""
-    # Only addresses, no authors
-    if not field.startswith("["):
-        addresses = field.split("; ")
-
-        # It may happen that the first address(es) dont have authors but the rest do:
-        # Remove the ones without authors in that case and reparse what remains.
-        # See issue #8.
-        if any(address.startswith("[") for address in addresses):
-            m = re.search(r".+?;\s*(\[.+$)", field)
-            trimmed_field = m.group(1)  # type: ignore
-            return parse_address_field(trimmed_field)
-        return addresses
-
-    # Addresses with authors
-    address_field_re = re.compile(
-        r"""\s*\[(.*?)\] # Author part
-        \s+(.*)          # Address part
-        """,
-        re.VERBOSE,
-    )
-    parsed: Dict[str, List[str]] = defaultdict(list)
+    """Parse author address field into author -> addresses dict
 
-    address_fields = re.split(r";(?=\s*\[)", field)
-    for address_field in address_fields:
-        match = address_field_re.match(address_field)
-        if match:
-            authors, address = match.groups()
-        else:
-            raise ValueError(f"Could not parse '{address_field}' as address field")
+    If the field does not list authors, a list of addresses is returned.
+    Parsing is cached (see :func:`wosfile.address.split_address_field`).
 
-        for author in split_by(authors, ";"):
+    """
+    address_field = split_address_field(field)
+    # Only addresses, no authors
+    if not address_field[0][0]:
+        return [address for _, address in address_field]
+
+    parsed: Dict[str, List[str]] = defaultdict(list)
+    for authors, address in address_field:
+        for author in authors:
             parsed[author].append(address)
 
     return parsed
 
 
 def records_from(
-    fname: Union[str, Iterable[str]], skip_empty: bool = True, **kwargs
-) -> Iterator[Record]:
+    fname: Union[str, Iterable[str]],
+    skip_empty: bool = True,
+    lazy: bool = False,
+    pool: Optional[StringPool] = None,
+    stats: Optional[ReadStats] = None,
+    **kwargs,
+) -> Iterator[Union[Record, LazyRecord]]:
     """Get records from WoS file *fobj*
 
     :param fname: WoS file name(s)
     :type fname: str or list of strings
     :param bool skip_empty: whether or not to skip empty fields
+    :param bool lazy:
+        whether to get memory-efficient :py:class:`wosfile.LazyRecord`
+        objects instead
+    :param pool:
+        if given, repeated values (or, for splittable fields, items) of the
+        pool's fields are shared between records through this
+        :py:class:`wosfile.StringPool`. With `lazy`, only values of fields that
+        are not splittable are shared. Call its ``stats()`` method to see how
+        many values were shared
+    :param stats:
+        if given, timings and throughput of reading and parsing are collected
+        in this :py:class:`wosfile.ReadStats`, and logged when all records
+        have been read. Call its ``dump()`` method to print them
+    :param kwargs:
+        passed on to :func:`wosfile.read`, e.g. ``workers`` to read multiple
+        files in parallel
     :return:
         iterator over parsed records in *fobj*, where each parsed record is a
         :py:class:`wosfile.Record`
 
     """
-    for wos_record in read(fname, **kwargs):
-        yield Record(wos_record, skip_empty)
+    if stats is not None:
+        yield from _records_profiled(fname, skip_empty, lazy, pool, stats, **kwargs)
+        return
+    record_class = LazyRecord if lazy else Record
+    if pool is None:
+        for wos_record in read(fname, **kwargs):
+            yield record_class(wos_record, skip_empty)
+    elif lazy:
+        # Lazy records keep the raw values, so pool those (of fields that are
+        # not splittable; see StringPool.intern_record)
+        for wos_record in read(fname, pool=pool, **kwargs):
+            yield LazyRecord(wos_record, skip_empty)
+    else:
+        for wos_record in read(fname, **kwargs):
+            yield pool.intern_record(Record(wos_record, skip_empty))
+
+
+def _records_profiled(
+    fname: Union[str, Iterable[str]],
+    skip_empty: bool,
+    lazy: bool,
+    pool: Optional[StringPool],
+    stats: ReadStats,
+    **kwargs,
+) -> Iterator[Union[Record, LazyRecord]]:
+    """Get records like :func:`records_from`, timing record creation in `stats`"""
+    record_class = stats.timed("record", LazyRecord if lazy else Record)
+    try:
+        if pool is None or lazy:
+            for wos_record in read(fname, pool=pool, stats=stats, **kwargs):
+                yield record_class(wos_record, skip_empty)
+        else:
+            for wos_record in read(fname, stats=stats, **kwargs):
+                yield pool.intern_record(record_class(wos_record, skip_empty))
+    finally:
+        logger.info("Read statistics:\n%s", stats.report())
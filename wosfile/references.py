@@ -0,0 +1,173 @@
+from functools import lru_cache
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .read import FileName, read
+
+__all__ = [
+    "Reference",
+    "ReferenceParser",
+    "parse_reference",
+    "parse_references",
+    "references_from",
+]
+
+# Maximum number of distinct reference strings kept in the parse cache
+CACHE_SIZE = 2**18
+# Maximum number of distinct authors and sources kept in the intern pool
+POOL_SIZE = 2**20
+
+# Cited references field: either one string with "; " between references (as
+# returned by read) or a list of references (as in Record)
+ReferencesField = Union[str, Sequence[str]]
+
+
+class Reference(NamedTuple):
+    """Parts of a cited reference in the WoS cited references field (CR)"""
+
+    author: Optional[str]
+    year: Optional[int]
+    source: Optional[str]
+    volume: Optional[str]
+    page: Optional[str]
+    doi: Optional[str]
+
+
+def _is_year(part: str) -> bool:
+    return len(part) == 4 and part.isdigit()
+
+
+def _is_numbered(part: str) -> bool:
+    """Whether `part` looks like a volume or page number, e.g. 'V12' or 'P34'"""
+    return part[:1] in ("V", "P") and part[1:2].isdigit()
+
+
+class ReferenceParser:
+    def __init__(
+        self, cache_size: int = CACHE_SIZE, pool_size: int = POOL_SIZE
+    ) -> None:
+        """Create a parser for cited references
+
+        Parsed references are cached, and authors and sources are interned, so
+        that references to the same work share their strings. Both the cache
+        and the pool are bounded, so memory use stays the same no matter how
+        many references are parsed. Once the pool is full, new authors and
+        sources are no longer shared.
+
+        :param int cache_size: maximum number of cached references
+        :param int pool_size: maximum number of interned authors and sources
+
+        """
+        self.pool_size = pool_size
+        self.pool: Dict[str, str] = {}
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def intern(self, value: str) -> str:
+        """Get shared copy of `value`"""
+        pool = self.pool
+        try:
+            return pool[value]
+        except KeyError:
+            if len(pool) < self.pool_size:
+                pool[value] = value
+            return value
+
+    def _parse(self, reference: str) -> Reference:
+        """Parse a single cited reference
+
+        References look like 'Author, Year, Source, V12, P34, DOI 10.1/x'.
+        Every part is optional; missing parts are None.
+
+        """
+        parts = reference.strip().split(", ")
+
+        doi = None
+        for i, part in enumerate(parts):
+            if part.startswith("DOI "):
+                # Multiple DOIs are listed as 'DOI [10.1/x, 10.1/y]': keep first
+                doi = part[4:].lstrip("[").rstrip("]") or None
+                del parts[i:]
+                break
+
+        author = year = source = volume = page = None
+        if parts and parts[0] and not _is_year(parts[0]):
+            author = self.intern(parts.pop(0))
+        if parts and _is_year(parts[0]):
+            year = int(parts.pop(0))
+        for part in parts:
+            if source is volume is page is None and not _is_numbered(part):
+                source = self.intern(part)
+            elif part[:1] == "V" and volume is page is None:
+                volume = part[1:]
+            elif part[:1] == "P" and page is None:
+                page = part[1:]
+        return Reference(author, year, source, volume, page, doi)
+
+    def parse_field(self, field: Optional[ReferencesField]) -> List[Reference]:
+        """Parse all references in cited references field `field`"""
+        if not field:
+            return []
+        if isinstance(field, str):
+            field = field.split("; ")
+        parse = self.parse
+        return [parse(reference) for reference in field]
+
+
+_parser = ReferenceParser()
+
+
+def parse_reference(reference: str) -> Reference:
+    """Parse a single cited reference into a :class:`Reference`
+
+    Results are cached, since the same references occur in many records.
+
+    """
+    return _parser.parse(reference)
+
+
+def parse_references(
+    fields: Iterable[Optional[ReferencesField]],
+    parser: Optional[ReferenceParser] = None,
+) -> Iterator[List[Reference]]:
+    """Parse many cited references fields (CR) at once
+
+    Missing fields (None or empty) yield an empty list.
+
+    :param fields: cited references fields, e.g. the CR values of a series of records
+    :param parser: parser to use. If None, a shared default parser is used.
+    :return: iterator over lists of references, one list per field
+
+    """
+    parse_field = (parser or _parser).parse_field
+    for field in fields:
+        yield parse_field(field)
+
+
+def references_from(
+    fname: Union[FileName, Iterable[FileName]],
+    parser: Optional[ReferenceParser] = None,
+    **kwargs
+) -> Iterator[Tuple[Optional[str], List[Reference]]]:
+    """Get parsed cited references of all records in one or more WoS files
+
+    Only the UT and CR fields are read and records are processed one at a
+    time, so memory use does not grow with the size of the files.
+
+    :param fname: name(s) of the WoS export file(s)
+    :param parser: parser to use. If None, a shared default parser is used.
+    :param kwargs: additional arguments for :func:`.read`
+    :return: iterator over (UT, references) pairs
+
+    """
+    parse_field = (parser or _parser).parse_field
+    for wos_record in read(fname, fields=("UT", "CR"), **kwargs):
+        yield wos_record.get("UT"), parse_field(wos_record.get("CR"))
@@ -0,0 +1,215 @@
+import pathlib
+import sqlite3
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
+
+from .address import parse_addresses
+from .read import FileName
+from .record import field_items, to_int
+from .references import ReferenceParser
+from .tags import is_splittable, numeric_tags, tags
+
+__all__ = ["load_sqlite"]
+
+# Fields with a single value get a column in the records table; the address
+# field gets its own table
+record_columns = [
+    tag for tag in dict.fromkeys(tag for tag, *_ in tags) if not is_splittable[tag]
+]
+record_columns.remove("C1")
+
+# Tables with one row per item of a splittable field, with the tag as type
+item_tables = {
+    "DE": "keywords",
+    "ID": "keywords",
+    "SC": "categories",
+    "WC": "categories",
+}
+
+# Other splittable fields (e.g. C3, EM, RI and OI) go in a generic items table
+other_item_tags = [
+    tag
+    for tag in dict.fromkeys(tag for tag, *_ in tags)
+    if is_splittable[tag] and tag not in ("AU", "AF", "CR") and tag not in item_tables
+]
+
+schema = [
+    "CREATE TABLE IF NOT EXISTS records (id INTEGER PRIMARY KEY, {})".format(
+        ", ".join(
+            '"{}" {}'.format(tag, "INTEGER" if tag in numeric_tags else "TEXT")
+            for tag in record_columns
+        )
+    ),
+    "CREATE TABLE IF NOT EXISTS authors "
+    "(record_id INTEGER, position INTEGER, AU TEXT, AF TEXT)",
+    "CREATE TABLE IF NOT EXISTS addresses (record_id INTEGER, author TEXT, "
+    "address TEXT, organisation TEXT, country TEXT)",
+    "CREATE TABLE IF NOT EXISTS cited_references (record_id INTEGER, "
+    "position INTEGER, reference TEXT, author TEXT, year INTEGER, source TEXT, "
+    "volume TEXT, page TEXT, doi TEXT)",
+    "CREATE TABLE IF NOT EXISTS keywords (record_id INTEGER, type TEXT, keyword TEXT)",
+    "CREATE TABLE IF NOT EXISTS categories "
+    "(record_id INTEGER, type TEXT, category TEXT)",
+    "CREATE TABLE IF NOT EXISTS items "
+    "(record_id INTEGER, tag TEXT, position INTEGER, item TEXT)",
+]
+
+indexes = [
+    ("records", "UT"),
+    ("records", "DI"),
+    ("records", "PY"),
+    ("authors", "record_id"),
+    ("authors", "AU"),
+    ("addresses", "record_id"),
+    ("addresses", "country"),
+    ("cited_references", "record_id"),
+    ("cited_references", "doi"),
+    ("keywords", "record_id"),
+    ("keywords", "keyword"),
+    ("categories", "record_id"),
+    ("categories", "category"),
+    ("items", "record_id"),
+    ("items", "item"),
+]
+
+inserts = {
+    "records": "INSERT INTO records VALUES ({})".format(
+        ", ".join("?" * (len(record_columns) + 1))
+    ),
+    "authors": "INSERT INTO authors VALUES (?, ?, ?, ?)",
+    "addresses": "INSERT INTO addresses VALUES (?, ?, ?, ?, ?)",
+    "cited_references": "INSERT INTO cited_references VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "keywords": "INSERT INTO keywords VALUES (?, ?, ?)",
+    "categories": "INSERT INTO categories VALUES (?, ?, ?)",
+    "items": "INSERT INTO items VALUES (?, ?, ?, ?)",
+}
+
+Rows = Dict[str, List[Tuple[Any, ...]]]
+
+
+def _add_rows(
+    rows: Rows, record_id: int, record: Mapping[str, Any], parser: ReferenceParser
+) -> None:
+    """Add rows of all tables for `record` to `rows`"""
+    rows["records"].append(
+        (
+            record_id,
+            *(
+                to_int(record.get(tag)) if tag in numeric_tags else record.get(tag)
+                for tag in record_columns
+            ),
+        )
+    )
+
+    au, af = field_items("AU", record.get("AU")), field_items("AF", record.get("AF"))
+    for i in range(max(len(au), len(af))):
+        rows["authors"].append(
+            (
+                record_id,
+                i,
+                au[i] if i < len(au) else None,
+                af[i] if i < len(af) else None,
+            )
+        )
+
+    (addresses,) = parse_addresses([record.get("C1")])
+    rows["addresses"].extend(
+        (record_id, author, *address) for author, address in addresses
+    )
+
+    references = field_items("CR", record.get("CR"))
+    rows["cited_references"].extend(
+        (record_id, i, reference, *parser.parse(reference))
+        for i, reference in enumerate(references)
+    )
+
+    for tag, table in item_tables.items():
+        rows[table].extend(
+            (record_id, tag, item) for item in field_items(tag, record.get(tag))
+        )
+
+    for tag in other_item_tags:
+        rows["items"].extend(
+            (record_id, tag, i, item)
+            for i, item in enumerate(field_items(tag, record.get(tag)))
+        )
+
+
+def _flush(db: sqlite3.Connection, rows: Rows) -> None:
+    with db:  # One transaction per batch
+        for table, table_rows in rows.items():
+            if table_rows:
+                db.executemany(inserts[table], table_rows)
+                table_rows.clear()
+
+
+def load_sqlite(
+    records: Iterable[Mapping[str, Any]],
+    database: Union[FileName, sqlite3.Connection],
+    batch_size: int = 50000,
+    wal: bool = True,
+    create_indexes: bool = True,
+) -> int:
+    """Load records into normalised tables of an SQLite database
+
+    Besides a ``records`` table with a column for each single-valued field
+    (by field tag), the database gets tables ``authors`` (AU and AF),
+    ``addresses`` (author, address, organisation and country from C1),
+    ``cited_references`` (the reference and its parts), ``keywords`` (DE and
+    ID) and ``categories`` (WC and SC). Items of other fields with multiple
+    values, such as C3 (affiliations), EM, RI and OI, go in a generic
+    ``items`` table with the field tag and position of each item. All of
+    these refer to the ``id`` column of ``records`` through their
+    ``record_id`` column.
+
+    Rows are inserted in batches, with one transaction per batch, and
+    indexes are only created after all records are loaded. Records are added
+    to any existing records in the database.
+
+    :param records:
+        records to load, e.g. from :func:`.records_from` or :func:`.read`
+    :param database: file name of or connection to the database
+    :param int batch_size: number of records per transaction
+    :param bool wal: whether to switch the database to write-ahead logging
+    :param bool create_indexes:
+        whether to index the columns that are most used for lookups and joins
+    :return: number of records loaded
+
+    """
+    if isinstance(database, (str, pathlib.Path)):
+        db = sqlite3.connect(str(database))
+    else:
+        db = database
+    parser = ReferenceParser()
+
+    try:
+        if wal:
+            db.execute("PRAGMA journal_mode = WAL")
+        synchronous = db.execute("PRAGMA synchronous").fetchone()[0]
+        db.execute("PRAGMA synchronous = OFF")
+        with db:
+            for statement in schema:
+                db.execute(statement)
+
+        query = "SELECT COALESCE(MAX(id), 0) + 1 FROM records"
+        (first_id,) = db.execute(query).fetchone()
+        rows: Rows = {table: [] for table in inserts}
+        n = 0
+        for n, record in enumerate(records, 1):
+            _add_rows(rows, first_id + n - 1, record, parser)
+            if n % batch_size == 0:
+                _flush(db, rows)
+        _flush(db, rows)
+
+        if create_indexes:
+            with db:
+                for table, column in indexes:
+                    db.execute(
+                        'CREATE INDEX IF NOT EXISTS "{0}_{1}" ON {0} ("{1}")'.format(
+                            table, column
+                        )
+                    )
+        db.execute("PRAGMA synchronous = {}".format(synchronous))
+    finally:
+        if db is not database:
+            db.close()
+    return n
@@ -0,0 +1,233 @@
+import heapq
+import io
+import sys
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+)
+
+__all__ = ["ReadStats"]
+
+T = TypeVar("T")
+
+
+class _TimedIterator:
+    """Iterator wrapper that adds the time spent in ``next`` to a stage"""
+
+    def __init__(self, iterator: Iterator, stats: "ReadStats", stage: str) -> None:
+        self.iterator = iterator
+        self.stats = stats
+        self.stage = stage
+
+    def __iter__(self) -> "_TimedIterator":
+        return self
+
+    def __next__(self) -> Any:
+        start = perf_counter()
+        try:
+            return next(self.iterator)
+        finally:
+            self.stats.add_time(self.stage, perf_counter() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.iterator, name)
+
+
+class _TimedStream(io.RawIOBase):
+    """Binary stream that times and counts the bytes read from stream `fh`
+
+    Wrap it in a :class:`io.BufferedReader`: text streams read much faster
+    from native buffered streams than from Python-level wrappers.
+
+    """
+
+    def __init__(self, fh: BinaryIO, stats: "ReadStats") -> None:
+        self.fh = fh
+        self.stats = stats
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        start = perf_counter()
+        n = self.fh.readinto(buffer)  # type: ignore
+        self.stats.add_time("io", perf_counter() - start)
+        self.stats.bytes += n
+        return n
+
+
+class ReadStats:
+    def __init__(self, top: int = 5) -> None:
+        """Collect timings and throughput while reading WoS files
+
+        Pass an instance as ``stats`` to :func:`.read` or
+        :func:`.records_from`. Reading is only instrumented if stats are
+        given, so it costs nothing otherwise.
+
+        Time is kept per stage. Stages can overlap: 'io' (reading and
+        decompressing bytes) is part of 'lines' (gathering and decoding the
+        lines of plain text records) and 'csv' (splitting tab-delimited
+        rows). Further stages are 'format' (joining the lines of plain text
+        fields) and 'record' (creating :class:`.Record` objects). Stages of
+        files that are read in worker processes are not timed. Use
+        :meth:`time` or :meth:`timed` to add stages of your own, e.g. for
+        address parsing.
+
+        :param int top: number of largest records and fields to keep
+
+        """
+        self.top = top
+        # Stage -> [number of calls, total seconds]
+        self.stages: Dict[str, List[float]] = {}
+        self.records = 0
+        # Records skipped because they do not match `where`, in all processes
+        self.skipped = 0
+        # Bytes read from (decompressed) files; not counted in worker processes
+        self.bytes = 0
+        # Seconds spent getting records from the read pipeline
+        self.elapsed = 0.0
+        # Min-heaps of (size, UT) and (size, UT, field tag)
+        self.largest_records: List[Tuple[int, str]] = []
+        self.largest_fields: List[Tuple[int, str, str]] = []
+
+    def add_time(self, stage: str, seconds: float, calls: int = 1) -> None:
+        """Add `seconds` spent in `calls` calls to `stage`"""
+        try:
+            totals = self.stages[stage]
+        except KeyError:
+            self.stages[stage] = [calls, seconds]
+        else:
+            totals[0] += calls
+            totals[1] += seconds
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Context manager that adds the time spent in its body to `stage`"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, perf_counter() - start)
+
+    def timed(self, stage: str, func: Callable[..., T]) -> Callable[..., T]:
+        """Wrap `func` so that time spent calling it is added to `stage`"""
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add_time(stage, perf_counter() - start)
+
+        return wrapper
+
+    def add_record(self, record: Mapping[str, Any]) -> None:
+        """Count `record` and keep track of the largest records and fields"""
+        self.records += 1
+        ut = record.get("UT") or ""
+        top = self.top
+        fields = self.largest_fields
+        size = 0
+        for tag, value in record.items():
+            if not value:
+                continue
+            n = len(value)
+            size += n
+            if len(fields) < top:
+                heapq.heappush(fields, (n, ut, tag))
+            elif n > fields[0][0]:
+                heapq.heapreplace(fields, (n, ut, tag))
+        if len(self.largest_records) < top:
+            heapq.heappush(self.largest_records, (size, ut))
+        elif size > self.largest_records[0][0]:
+            heapq.heapreplace(self.largest_records, (size, ut))
+
+    def track(self, records: Iterable[Mapping[str, Any]]) -> Iterator[Any]:
+        """Yield `records`, timing the pipeline and counting each record"""
+        records = iter(records)
+        while True:
+            start = perf_counter()
+            try:
+                record = next(records)
+            except StopIteration:
+                return
+            finally:
+                self.elapsed += perf_counter() - start
+            self.add_record(record)
+            yield record
+
+    @property
+    def records_per_sec(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the statistics as a (JSON-serialisable) dict"""
+        return {
+            "records": self.records,
+            "skipped": self.skipped,
+            "bytes": self.bytes,
+            "seconds": self.elapsed,
+            "records_per_sec": self.records_per_sec,
+            "bytes_per_sec": self.bytes_per_sec,
+            "stages": {
+                stage: {"calls": int(calls), "seconds": seconds}
+                for stage, (calls, seconds) in self.stages.items()
+            },
+            "largest_records": [
+                {"UT": ut, "size": size}
+                for size, ut in sorted(self.largest_records, reverse=True)
+            ],
+            "largest_fields": [
+                {"UT": ut, "field": tag, "size": size}
+                for size, ut, tag in sorted(self.largest_fields, reverse=True)
+            ],
+        }
+
+    def report(self) -> str:
+        """Get a human-readable summary of the statistics"""
+        lines = [
+            "{} records, {:.1f} MB in {:.2f} s: {:.0f} records/s, {:.1f} MB/s".format(
+                self.records,
+                self.bytes / 2**20,
+                self.elapsed,
+                self.records_per_sec,
+                self.bytes_per_sec / 2**20,
+            )
+        ]
+        if self.skipped:
+            lines.append("{} records skipped by where".format(self.skipped))
+        for stage, (calls, seconds) in sorted(
+            self.stages.items(), key=lambda item: -item[1][1]
+        ):
+            lines.append(
+                "  {:10} {:10.3f} s  {:>10} calls".format(stage, seconds, int(calls))
+            )
+        lines.append("Largest records:")
+        for size, ut in sorted(self.largest_records, reverse=True):
+            lines.append("  {:10} chars  {}".format(size, ut))
+        lines.append("Largest fields:")
+        for size, ut, tag in sorted(self.largest_fields, reverse=True):
+            lines.append("  {:10} chars  {} {}".format(size, tag, ut))
+        return "\n".join(lines)
+
+    def dump(self, file: Optional[TextIO] = None) -> None:
+        """Print :meth:`report` to `file` (default: standard error)"""
+        print(self.report(), file=file or sys.stderr)
@@ -0,0 +1,490 @@
+from array import array
+from collections.abc import Mapping
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .aggregate import Aggregate
+from .network import _import_numpy
+from .pool import StringPool
+from .read import FileName, read
+from .record import Record, field_items, to_int
+from .tags import is_splittable, numeric_tags
+
+__all__ = ["RecordTable", "TableRow", "record_table"]
+
+# Fields that are dictionary-encoded by default
+CATEGORICAL_TAGS = frozenset(("DT", "LA", "SO", "WC"))
+
+# Value of numeric fields and code of categorical fields that are missing
+MISSING = -1
+
+
+class _ColumnBuilder:
+    """Collects the values of one field, row by row"""
+
+    def __init__(self, tag: str, categorical: bool) -> None:
+        self.tag = tag
+        self.pool = StringPool(None) if categorical else None
+        self.splittable = is_splittable.get(tag, False)
+        self.numeric = tag in numeric_tags and not self.splittable
+        if self.splittable:
+            self.offsets = array("q", [0])
+            self.values: Any = array("i") if categorical else []
+        elif self.numeric or categorical:
+            self.values = array("q" if self.numeric else "i")
+        else:
+            self.values = []
+        self.rows = 0
+
+    def pad(self, rows: int) -> None:
+        """Add missing values up to `rows` rows"""
+        n = rows - self.rows
+        if n <= 0:
+            return
+        if self.splittable:
+            self.offsets.extend([len(self.values)] * n)
+        elif self.numeric or self.pool is not None:
+            self.values.extend([MISSING] * n)
+        else:
+            self.values.extend([None] * n)
+        self.rows = rows
+
+    def add(self, value: Any) -> None:
+        if self.splittable:
+            items = field_items(self.tag, value)
+            if self.pool is not None:
+                items = [self.pool.code(item) for item in items]
+            self.values.extend(items)
+            self.offsets.append(len(self.values))
+        elif self.numeric:
+            self.values.append(to_int(value, MISSING))
+        elif self.pool is not None:
+            self.values.append(self.pool.code(value) if value else MISSING)
+        else:
+            self.values.append(value or None)
+        self.rows += 1
+
+
+class RecordTable:
+    def __init__(
+        self,
+        length: int,
+        fields: Sequence[str],
+        columns: Dict[str, Any],
+        offsets: Dict[str, Any],
+        categories: Dict[str, List[str]],
+    ) -> None:
+        """Columnar table of records; use :func:`record_table` to create one
+
+        Numeric fields (e.g. PY and TC) are NumPy integer arrays, with
+        :data:`MISSING` (-1) for missing values. Categorical fields (e.g. SO)
+        are arrays of codes into a list of categories. Splittable fields
+        (e.g. AU and WC) are stored as offsets plus a flat array of all
+        items: the items of row ``i`` are ``values[offsets[i]:offsets[i + 1]]``.
+        Other fields are object arrays of strings, with None if missing.
+
+        Filtering, sorting and grouping work on whole columns at once. Rows
+        are :class:`TableRow` mappings that behave like :class:`.Record`.
+
+        :param int length: number of rows
+        :param fields: field tags, in order
+        :param columns: field tag -> array of values, codes or items
+        :param offsets: field tag -> array of offsets, for splittable fields
+        :param categories: field tag -> categories, for categorical fields
+
+        """
+        self.length = length
+        self.fields = tuple(fields)
+        self.columns = columns
+        self.offsets = offsets
+        self.categories = categories
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping],
+        fields: Optional[Iterable[str]] = None,
+        categorical: Iterable[str] = CATEGORICAL_TAGS,
+    ) -> "RecordTable":
+        """Build a table from parsed or raw records
+
+        :param records: e.g. from :func:`.records_from` or :func:`.read`
+        :param fields:
+            field tags to keep. If None, all fields that occur are kept
+        :param categorical:
+            field tags to dictionary-encode. Numeric fields (e.g. PY) cannot
+            be dictionary-encoded
+
+        """
+        np = _import_numpy()
+        categorical = frozenset(categorical)
+        if categorical & numeric_tags:
+            raise ValueError(
+                "Numeric fields cannot be categorical: {}".format(
+                    ", ".join(sorted(categorical & numeric_tags))
+                )
+            )
+        keep = frozenset(fields) if fields is not None else None
+        builders: Dict[str, _ColumnBuilder] = {}
+        n = 0
+        for n, record in enumerate(records, 1):
+            for tag, value in record.items():
+                if keep is not None and tag not in keep:
+                    continue
+                try:
+                    builder = builders[tag]
+                except KeyError:
+                    builder = builders[tag] = _ColumnBuilder(tag, tag in categorical)
+                builder.pad(n - 1)
+                builder.add(value)
+
+        columns: Dict[str, Any] = {}
+        offsets: Dict[str, Any] = {}
+        categories: Dict[str, List[str]] = {}
+        for tag, builder in builders.items():
+            builder.pad(n)
+            if builder.pool is not None:
+                categories[tag] = builder.pool.values
+                columns[tag] = np.frombuffer(builder.values, dtype=np.int32).copy()
+            elif builder.numeric:
+                columns[tag] = np.frombuffer(builder.values, dtype=np.int64).copy()
+            else:
+                column = np.empty(len(builder.values), dtype=object)
+                column[:] = builder.values
+                columns[tag] = column
+            if builder.splittable:
+                offsets[tag] = np.frombuffer(builder.offsets, dtype=np.int64).copy()
+        return cls(n, list(builders), columns, offsets, categories)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self.columns
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        """Get row `key` (an integer) or the values of field `key` (a tag)"""
+        if isinstance(key, str):
+            return self.column(key)
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("row index out of range")
+        return TableRow(self, key)
+
+    def __iter__(self) -> Iterator["TableRow"]:
+        for i in range(self.length):
+            yield TableRow(self, i)
+
+    def _labels(self, tag: str) -> Any:
+        """Get object array of categories of `tag`, with None for missing"""
+        np = _import_numpy()
+        labels = np.empty(len(self.categories[tag]) + 1, dtype=object)
+        labels[:-1] = self.categories[tag]
+        return labels
+
+    def column(self, tag: str) -> Any:
+        """Get NumPy array with the value of field `tag` for each row
+
+        Numeric fields give integers (-1 if missing), other fields give
+        objects: strings (None if missing), or lists for splittable fields.
+
+        """
+        np = _import_numpy()
+        values = self.columns[tag]
+        if tag in self.categories:
+            values = self._labels(tag)[values]
+        if tag not in self.offsets:
+            return values
+        offsets = self.offsets[tag]
+        column = np.empty(self.length, dtype=object)
+        column[:] = [
+            list(values[start:end]) for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+        return column
+
+    def _exploded(self, tag: str) -> Tuple[Any, Any]:
+        """Get row index and item of each item of splittable field `tag`"""
+        np = _import_numpy()
+        offsets = self.offsets[tag]
+        rows = np.repeat(np.arange(self.length), np.diff(offsets))
+        return rows, self.columns[tag]
+
+    def isin(self, tag: str, values: Iterable[Any]) -> Any:
+        """Get boolean mask of rows where (an item of) field `tag` is in `values`"""
+        np = _import_numpy()
+        values = list(values)
+        column = self.columns[tag]
+        if tag in self.categories:
+            lookup = {value: code for code, value in enumerate(self.categories[tag])}
+            codes = [lookup[value] for value in values if value in lookup]
+            matches = np.isin(column, np.array(codes, dtype=column.dtype))
+        elif column.dtype == object:
+            wanted = set(values)
+            matches = np.fromiter(
+                (value in wanted for value in column), dtype=bool, count=len(column)
+            )
+        else:
+            matches = np.isin(column, np.array(values, dtype=column.dtype))
+        if tag not in self.offsets:
+            return matches
+        rows, _ = self._exploded(tag)
+        return np.bincount(rows[matches], minlength=self.length) > 0
+
+    def take(self, indices: Any) -> "RecordTable":
+        """Get a table with the rows at `indices`, in that order
+
+        :param indices: array of row indices or boolean mask
+
+        """
+        np = _import_numpy()
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        columns = {}
+        offsets = {}
+        for tag, values in self.columns.items():
+            if tag not in self.offsets:
+                columns[tag] = values[indices]
+                continue
+            starts = self.offsets[tag][:-1][indices]
+            lengths = self.offsets[tag][1:][indices] - starts
+            new_offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=new_offsets[1:])
+            items = np.repeat(starts - new_offsets[:-1], lengths)
+            items += np.arange(new_offsets[-1])
+            columns[tag] = values[items]
+            offsets[tag] = new_offsets
+        return RecordTable(len(indices), self.fields, columns, offsets, self.categories)
+
+    def filter(self, mask: Any) -> "RecordTable":
+        """Get a table with the rows where boolean array `mask` is True
+
+        E.g. ``table.filter(table["PY"] >= 2010)``.
+
+        """
+        return self.take(mask)
+
+    def _sort_key(self, tag: str) -> Any:
+        """Get integer array that sorts like the values of field `tag`"""
+        np = _import_numpy()
+        if tag in self.offsets:
+            raise ValueError("Cannot sort by splittable field {}".format(tag))
+        values = self.columns[tag]
+        if tag in self.categories:
+            # Rank of each category; missing values sort last
+            order = sorted(
+                range(len(self.categories[tag])), key=self.categories[tag].__getitem__
+            )
+            ranks = np.empty(len(order) + 1, dtype=np.int64)
+            ranks[order] = np.arange(len(order))
+            ranks[-1] = len(order)
+            return ranks[values]
+        if values.dtype == object:
+            present = values != None  # noqa: E711
+            _, ranks = np.unique(values[present].astype(str), return_inverse=True)
+            key = np.full(len(values), len(ranks), dtype=np.int64)
+            key[present] = ranks
+            return key
+        return values
+
+    def sort(
+        self, by: Union[str, Sequence[str]], descending: bool = False
+    ) -> "RecordTable":
+        """Get a table sorted by one or more fields
+
+        Sorting is stable. In ascending order, missing values of numeric
+        fields (-1) come first and those of other fields come last.
+
+        :param by: field tag(s) to sort by, e.g. 'TC' or ['PY', 'TC']
+        :param bool descending: whether to sort from high to low
+
+        """
+        np = _import_numpy()
+        keys = [self._sort_key(tag) for tag in ([by] if isinstance(by, str) else by)]
+        if descending:
+            keys = [-key for key in keys]
+        return self.take(np.lexsort(keys[::-1]))
+
+    def _numbers(self, tag: str) -> Any:
+        """Get integer value of field `tag` for each row, 0 if missing or invalid"""
+        np = _import_numpy()
+        values = self.columns.get(tag)
+        if values is None or tag in self.offsets:
+            return np.zeros(self.length, dtype=np.int64)
+        if tag in self.categories:
+            values = self._labels(tag)[values]
+        elif values.dtype != object:
+            return np.maximum(values, 0)
+        return np.fromiter(
+            (to_int(value, 0) for value in values), dtype=np.int64, count=len(values)
+        )
+
+    def _group_codes(self, tag: str) -> Tuple[Any, Any, List[Optional[str]]]:
+        """Get (row, group) index pairs and group labels for field `tag`
+
+        Rows where `tag` is missing are in group None. A row is in a group at
+        most once, even if an item occurs more than once.
+
+        """
+        np = _import_numpy()
+        values = self.columns[tag]
+        if tag in self.categories:
+            labels: List[Optional[str]] = list(self.categories[tag])
+            codes = values.astype(np.int64)
+        elif values.dtype == object:
+            lookup: Dict[str, int] = {}
+            codes = np.fromiter(
+                (
+                    MISSING if value is None else lookup.setdefault(value, len(lookup))
+                    for value in values
+                ),
+                dtype=np.int64,
+                count=len(values),
+            )
+            labels = list(lookup)
+        else:
+            present = values != MISSING
+            unique, inverse = np.unique(values[present], return_inverse=True)
+            codes = np.full(len(values), MISSING, dtype=np.int64)
+            codes[present] = inverse
+            labels = [str(value) for value in unique]
+        codes = np.where(codes == MISSING, len(labels), codes)
+        labels.append(None)
+
+        if tag not in self.offsets:
+            return np.arange(self.length), codes, labels
+        rows, _ = self._exploded(tag)
+        # Rows without items are in group None
+        empty = np.flatnonzero(np.diff(self.offsets[tag]) == 0)
+        rows = np.concatenate([rows, empty])
+        codes = np.concatenate([codes, np.full(len(empty), len(labels) - 1)])
+        pairs = np.unique(rows * len(labels) + codes)
+        return pairs // len(labels), pairs % len(labels), labels
+
+    def group_by(self, tag: str) -> Dict[Optional[str], Any]:
+        """Get the row indices of each distinct value (or item) of field `tag`
+
+        :return: dict of value (None for missing) -> array of row indices
+
+        """
+        np = _import_numpy()
+        rows, codes, labels = self._group_codes(tag)
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(labels))
+        groups = np.split(rows[order], np.cumsum(counts)[:-1])
+        return {label: group for label, group in zip(labels, groups) if len(group)}
+
+    def aggregate(
+        self, by: Union[str, Sequence[str]], sums: Iterable[str] = ("TC", "Z9")
+    ) -> Aggregate:
+        """Count rows and sum numeric fields per group (see :class:`.Aggregate`)
+
+        Grouping by a single field is vectorised; grouping by several fields
+        adds the rows one by one.
+
+        :param by: field tag(s) to group by
+        :param sums: numeric field tags to sum within each group
+
+        """
+        np = _import_numpy()
+        result = Aggregate(by, sums)
+        if len(result.by) > 1 or result.by[0] not in self.columns:
+            return result.update(self)
+
+        rows, codes, labels = self._group_codes(result.by[0])
+        totals = [np.bincount(codes, minlength=len(labels))]
+        for tag in result.sums:
+            weights = self._numbers(tag)[rows]
+            totals.append(np.bincount(codes, weights, minlength=len(labels)))
+        for label, group in zip(labels, zip(*(total.tolist() for total in totals))):
+            if group[0]:
+                result.groups[(label,)] = [int(total) for total in group]
+        return result
+
+
+class TableRow(Mapping):
+    """Row of a :class:`RecordTable`, with the same values as a :class:`.Record`"""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: RecordTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, tag: str) -> Union[str, List[str]]:
+        table = self.table
+        values = table.columns[tag]
+        categories = table.categories.get(tag)
+        offsets = table.offsets.get(tag)
+        if offsets is not None:
+            items = values[offsets[self.index] : offsets[self.index + 1]].tolist()
+            if not items:
+                raise KeyError(tag)
+            return [categories[code] for code in items] if categories else items
+        value = values[self.index]
+        if categories is not None:
+            if value == MISSING:
+                raise KeyError(tag)
+            return categories[value]
+        if values.dtype != object:
+            if value == MISSING:
+                raise KeyError(tag)
+            return str(value)
+        if value is None:
+            raise KeyError(tag)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        for tag in self.table.fields:
+            if tag in self:
+                yield tag
+
+    def __contains__(self, tag: object) -> bool:
+        try:
+            self[tag]  # type: ignore
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, dict(self))
+
+    record_id = Record.record_id
+    author_address = Record.author_address
+    references = Record.references
+
+
+def record_table(
+    fname: Union[FileName, Iterable[FileName]],
+    fields: Optional[Iterable[str]] = None,
+    categorical: Iterable[str] = CATEGORICAL_TAGS,
+    **kwargs
+) -> RecordTable:
+    """Read WoS file(s) into a :class:`RecordTable`
+
+    :param fname: name(s) of the WoS export file(s)
+    :param fields: field tags to read. If None, all fields are read
+    :param categorical:
+        field tags to dictionary-encode; not numeric fields (see
+        :meth:`RecordTable.from_records`)
+    :param kwargs: passed on to :func:`.read`, e.g. ``where`` or ``dedupe``
+    :return: :class:`RecordTable`
+
+    """
+    if fields is not None:
+        kwargs["fields"] = fields = list(fields)
+    records = read(fname, **kwargs)
+    return RecordTable.from_records(records, fields, categorical)
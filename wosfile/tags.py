@@ -83,3 +83,5 @@ tags = (
 )
 is_splittable = {abbr: iterable for abbr, _, iterable, _ in tags}
 has_item_per_line = {abbr: item_per_line for abbr, _, _, item_per_line in tags}
+# Fields whose values are integers
+numeric_tags = frozenset(("NR", "PG", "PY", "TC", "U1", "U2", "Z9"))
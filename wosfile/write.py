@@ -0,0 +1,199 @@
+import csv
+import re
+from abc import ABC, abstractmethod
+from typing import IO, Any, Iterable, List, Mapping, Optional, TextIO, Union
+
+from .read import FileName
+from .tags import has_item_per_line, tags
+
+__all__ = [
+    "PlainTextWriter",
+    "TabDelimitedWriter",
+    "write_plaintext",
+    "write_tab_delimited",
+]
+
+WosRecord = Mapping[str, Union[str, List[str]]]
+
+# Buffer size of files that are written
+BUFFER_SIZE = 2**20
+
+# Columns of tab-delimited files, in the order of WoS exports
+tab_delimited_tags = tuple(
+    (
+        "PT AU BA BE GP AF BF CA TI SO SE BS LA DT CT CY CL SP HO DE ID AB C1 C3 RP "
+        "EM RI OI FU FX CR NR TC Z9 U1 U2 PU PI PA SN EI BN J9 JI PD PY VL IS PN SU "
+        "SI MA BP EP AR DI D2 EA EY PG P2 WC WE SC GA PM OA HC HP DA ED UT"
+    ).split()
+)
+
+# Separator between items of a field, except within [...] (addresses in C1)
+_item_separator = re.compile(r"; (?![^\[]*\])")
+
+
+def _items(value: str) -> List[str]:
+    """Split raw value of a field with one item per line in plain text files"""
+    if "[" in value:
+        return _item_separator.split(value)
+    return value.split("; ")
+
+
+class Writer(ABC):
+    def __init__(self, fh: TextIO) -> None:
+        self.fh = fh
+        # Number of records written
+        self.written = 0
+
+    @abstractmethod
+    def write(self, record: WosRecord) -> None:
+        """Write a single record"""
+
+    def write_all(self, records: Iterable[WosRecord]) -> int:
+        """Write all `records`; return the number of records written"""
+        n = self.written
+        for record in records:
+            self.write(record)
+        return self.written - n
+
+    def close(self) -> None:
+        """Finish the file, without closing `fh`"""
+
+    def __enter__(self) -> "Writer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class PlainTextWriter(Writer):
+    def __init__(self, fh: TextIO) -> None:
+        """Create a writer of WoS plain text files to `fh`
+
+        This is the inverse of :class:`.PlainTextReader`: fields with one
+        item per line are split over multiple lines, and the file starts with
+        FN and VR lines. Call :meth:`close` (or use the writer as a context
+        manager) to end the file with EF. Empty fields are left out.
+
+        Records can be raw records from :func:`.read` or parsed records.
+
+        :param fh: file to write to, opened in text mode(!)
+        :type fh: file object
+
+        """
+        super().__init__(fh)
+        self.closed = False
+        fh.write("FN Clarivate Analytics Web of Science\nVR 1.0\n")
+
+    def write(self, record: WosRecord) -> None:
+        lines = []
+        for tag, value in record.items():
+            if not value:
+                continue
+            if has_item_per_line.get(tag, False):
+                items = _items(value) if isinstance(value, str) else value
+                lines.append(tag + " " + "\n   ".join(items))
+            elif isinstance(value, str):
+                lines.append(tag + " " + value)
+            else:
+                lines.append(tag + " " + "; ".join(value))
+        lines.append("ER\n\n")
+        self.fh.write("\n".join(lines))
+        self.written += 1
+
+    def close(self) -> None:
+        if not self.closed:
+            self.fh.write("EF\n")
+            self.closed = True
+
+
+class TabDelimitedWriter(Writer):
+    def __init__(self, fh: TextIO, fields: Optional[Iterable[str]] = None) -> None:
+        """Create a writer of WoS tab-delimited files to `fh`
+
+        This is the inverse of :class:`.TabDelimitedReader`: the file starts
+        with a header row, and each record is a row. Values are only quoted
+        if they contain tabs, newlines or quotes.
+
+        Records can be raw records from :func:`.read` or parsed records.
+
+        :param fh: file to write to, opened in text mode(!) with ``newline=''``
+        :type fh: file object
+        :param fields:
+            field tags to write, in this order. If None, all known field tags
+            are written in the order of WoS exports. Other fields are left out
+        :type fields: iterable of strings
+
+        """
+        super().__init__(fh)
+        self.fields = tuple(fields) if fields is not None else tab_delimited_tags
+        self.writer = csv.writer(fh, delimiter="\t", lineterminator="\n")
+        self.writer.writerow(self.fields)
+        # Number of tabs in a row whose values contain no tabs
+        self.separators = len(self.fields) - 1
+
+    def _row(self, record: WosRecord) -> List[str]:
+        return [
+            (
+                value
+                if value.__class__ is str
+                else "; ".join(value) if value else ""  # type: ignore
+            )
+            for value in map(record.get, self.fields)
+        ]
+
+    def write(self, record: WosRecord) -> None:
+        row = self._row(record)
+        line = "\t".join(row)
+        # The csv module is much slower, so only use it if values need quotes
+        if line.count("\t") != self.separators or any(c in line for c in '"\n\r'):
+            self.writer.writerow(row)
+        else:
+            self.fh.write(line + "\n")
+        self.written += 1
+
+
+def _open(fname: FileName, encoding: str) -> IO[str]:
+    """Open `fname` for writing, with a BOM for UTF-8 and UTF-16"""
+    if encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+        encoding = "utf-8-sig"
+    return open(fname, "w", encoding=encoding, newline="", buffering=BUFFER_SIZE)
+
+
+def write_plaintext(
+    records: Iterable[WosRecord], fname: FileName, encoding: str = "utf-8"
+) -> int:
+    """Write `records` to WoS plain text file `fname`
+
+    :param records: WoS records, e.g. from :func:`wosfile.read`
+    :param fname: name of the file
+    :param str encoding:
+        encoding of the file. UTF-8 and UTF-16 files start with a BOM, like
+        files exported from WoS
+    :return: number of records written
+
+    """
+    with _open(fname, encoding) as fh, PlainTextWriter(fh) as writer:
+        return writer.write_all(records)
+
+
+def write_tab_delimited(
+    records: Iterable[WosRecord],
+    fname: FileName,
+    fields: Optional[Iterable[str]] = None,
+    encoding: str = "utf-8",
+) -> int:
+    """Write `records` to WoS tab-delimited file `fname`
+
+    :param records: WoS records, e.g. from :func:`wosfile.read`
+    :param fname: name of the file
+    :param fields:
+        field tags to write. If None, all known field tags are written (see
+        :class:`TabDelimitedWriter`)
+    :param str encoding:
+        encoding of the file. UTF-8 and UTF-16 files start with a BOM, like
+        files exported from WoS
+    :return: number of records written
+
+    """
+    with _open(fname, encoding) as fh, TabDelimitedWriter(fh, fields) as writer:
+        return writer.write_all(records)